@@ -0,0 +1,200 @@
+# benchmark throughput lexer: varian lexer di dumps/ vs engine di src/lexer.py
+# tiap varian dumps/ dipasangin sama file rules-nya, engine src/lexer.py dijalanin pake rules
+# dan keyword set yang sama biar hasilnya bisa dibandingin
+#
+# input: corpus tetap dari test/milestone-*/input (tiap file di-lex sendiri-sendiri) plus source
+# sintetis yang diperbesar (gabungan file yang lolos lexer, diulang sampe skala tertentu)
+# yang dilaporin: tokens/detik (waktu terbaik dari beberapa run), peak memory (tracemalloc),
+# dan apakah output-nya sama kayak varian dumps/ dan kayak engine compiled src/lexer.py
+# semua engine src/lexer.py wajib ngeluarin token + pesan error yang sama persis kayak compiled,
+# kalo ada yang beda benchmark-nya gagal (exit 1). varian dumps/ cuma dilaporin: itu lexer lama
+# yang bug-nya udah dibenerin di src/lexer.py (titik terakhir jadi RANGE_OPERATOR, selain-itu /
+# turun-ke gak digabung, comment {} gak dikenal), jadi output-nya memang beda
+#
+# cara pake (dari root folder):
+#   python3 bench/bench_lexers.py
+#   python3 bench/bench_lexers.py --scale 1,4,16 --repeat 3
+#   python3 bench/bench_lexers.py --rules dfa_rules_final
+
+import contextlib
+import glob
+import importlib.util
+import io
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import GeneratedDFA, compile_rules, lexical_analyze, load_rules, read_source_file
+from lexer_codegen import generate_lexer
+from rules_compiler import minimize_rules
+
+# varian lexer lama di dumps/ dan file rules pasangannya
+VARIANTS = [
+    ("Lexer.py", "dumps/dfa_rules.json"),
+    ("LexerPrimitif.py", "dumps/dfa_rules_primitif.json"),
+    ("LexerAlternative.py", "dumps/dfa_rules_alternative.json"),
+    ("LexerCommentHandle.py", "dumps/dfa_rules_commenthandle.json"),
+    ("Lexer_final.py", "rules/dfa_rules_final.json"),
+]
+
+def _load_module(path, name):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+# engine yang dibandingin: (label, factory)
+# factory(variant_module, rules_path, dfa) -> fungsi text -> list token, None kalo gak bisa
+# engine baru tinggal ditambahin ke list ini
+def _dumps_engine(variant, rules_path, dfa):
+    words = (variant.KEYWORDS, variant.LOGICAL_OPERATORS, variant.ARITHMETIC_OPERATORS)
+    return lambda text: variant.lexical_analyze(text, dfa, *words)
+
+def _src_engine(engine, variant, binary=False):
+    words = (variant.KEYWORDS, variant.LOGICAL_OPERATORS, variant.ARITHMETIC_OPERATORS)
+    if binary:
+        return lambda text: lexical_analyze(text.encode("utf-8"), engine, *words)
+    return lambda text: lexical_analyze(text, engine, *words)
+
+def _compiled_engine(variant, rules_path, dfa):
+    return _src_engine(compile_rules(dfa), variant)
+
+def _minimized_engine(variant, rules_path, dfa):
+    return _src_engine(compile_rules(minimize_rules(dfa)), variant)
+
+def _bytes_engine(variant, rules_path, dfa):
+    engine = compile_rules(dfa)
+    if not engine.bytes_safe:
+        return None
+    return _src_engine(engine, variant, binary=True)
+
+def _generated_engine(variant, rules_path, dfa):
+    # module hasil codegen ditulis ke folder sementara, gak ganggu src/generated
+    with tempfile.TemporaryDirectory() as tmp:
+        path = generate_lexer(rules_path, os.path.join(tmp, "bench_generated.py"))
+        module = _load_module(path, "bench_generated")
+    return _src_engine(GeneratedDFA(module), variant)
+
+ENGINES = [
+    ("dumps", _dumps_engine),
+    ("compiled", _compiled_engine),
+    ("minimized", _minimized_engine),
+    ("generated", _generated_engine),
+    ("bytes", _bytes_engine),
+]
+
+def run_quiet(fn, text):
+    # output lexer (pesan error) dibuang biar gak ngerusak tabel, exception dicatet ke output-nya
+    # hasilnya dibalikin apa adanya (TokenStream gak diubah jadi list biar waktunya adil)
+    with contextlib.redirect_stdout(io.StringIO()) as out:
+        try:
+            tokens = fn(text)
+        except Exception as e:
+            tokens = []
+            print(f"Exception: {e!r}")
+    return tokens, out.getvalue()
+
+def corpus_files():
+    return sorted(glob.glob(os.path.join(ROOT, "test", "milestone-*", "input", "*.pas")))
+
+def clean_texts(texts, reference):
+    # file corpus yang lolos lexer referensi tanpa error (gak ada output / exception)
+    return [text for text in texts if not run_quiet(reference, text)[1]]
+
+def synthetic_source(parts, scale):
+    # gabungin file corpus yang bersih, diulang scale kali
+    return ("\n".join(parts) + "\n") * scale
+
+def measure(fn, texts, repeat):
+    # return (tokens per input, waktu terbaik, peak memory byte)
+    best = None
+    outputs = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        outputs = [run_quiet(fn, text) for text in texts]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    tracemalloc.start()
+    for text in texts:
+        run_quiet(fn, text)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return [(list(tokens), out) for tokens, out in outputs], best, peak
+
+def main():
+    args = sys.argv[1:]
+    scales = [1, 4, 16]
+    repeat = 3
+    only_rules = None
+    while args:
+        arg = args.pop(0)
+        if arg == "--scale":
+            scales = [int(s) for s in args.pop(0).split(",")]
+        elif arg == "--repeat":
+            repeat = int(args.pop(0))
+        elif arg == "--rules":
+            only_rules = args.pop(0)
+        else:
+            print("Usage: python3 bench/bench_lexers.py [--scale 1,4,16] [--repeat N] [--rules <nama>]")
+            sys.exit(1)
+
+    texts = [read_source_file(path) for path in corpus_files()]
+    print(f"Corpus: {len(texts)} files, {sum(map(len, texts)) / 1024:.1f} KB, repeat = {repeat}")
+    print(f"{'rules':<28}{'input':<16}{'engine':<11}{'tokens':<9}{'time (s)':<10}"
+          f"{'tokens/s':<11}{'peak (MB)':<11}{'= dumps':<9}= compiled")
+
+    failures = []
+    for variant_file, rules_path in VARIANTS:
+        rules_name = os.path.splitext(os.path.basename(rules_path))[0]
+        if only_rules and only_rules != rules_name:
+            continue
+        variant = _load_module(os.path.join(ROOT, "dumps", variant_file), os.path.splitext(variant_file)[0])
+        dfa = load_rules(os.path.join(ROOT, rules_path))
+        engines = []
+        for label, factory in ENGINES:
+            fn = factory(variant, os.path.join(ROOT, rules_path), dfa)
+            if fn is not None:
+                engines.append((label, fn))
+
+        clean = clean_texts(texts, dict(engines)["compiled"])
+        if not clean:
+            failures.append(f"{rules_name}: no corpus file lexes cleanly with the compiled engine")
+            continue
+        inputs = [("corpus", texts), ("clean corpus", clean)]
+        inputs += [(f"synthetic x{scale}", [synthetic_source(clean, scale)]) for scale in scales]
+
+        for input_name, input_texts in inputs:
+            results = {}
+            for label, fn in engines:
+                results[label] = measure(fn, input_texts, repeat)
+            for label, _ in engines:
+                outputs, elapsed, peak = results[label]
+                n_tokens = sum(len(tokens) for tokens, _ in outputs)
+                same_dumps = _same(outputs, results["dumps"][0], len(input_texts))
+                same_compiled = _same(outputs, results["compiled"][0], len(input_texts))
+                print(f"{rules_name:<28}{input_name:<16}{label:<11}{n_tokens:<9}{elapsed:<10.3f}"
+                      f"{n_tokens / elapsed if elapsed else 0:<11.0f}{peak / (1 << 20):<11.2f}"
+                      f"{same_dumps:<9}{same_compiled}")
+                if label != "dumps" and outputs != results["compiled"][0]:
+                    failures.append(f"{rules_name} {input_name}: {label} output differs from compiled")
+
+    if failures:
+        print()
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1)
+
+def _same(outputs, reference, n_inputs):
+    # jumlah input yang token dan pesan error-nya sama persis
+    same = sum(a == b for a, b in zip(outputs, reference))
+    if n_inputs == 1:
+        return "yes" if same else "no"
+    return f"{same}/{n_inputs}"
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# benchmark lexer paralel: waktu lexing satu file gede buat jumlah worker yang beda-beda
+# hasil tiap run dicek harus sama persis kayak lexical_analyze biasa
+#
+# cara pake (dari root folder):
+#   python3 bench/bench_parallel_lexer.py                       # source sintetis ~20 MB
+#   python3 bench/bench_parallel_lexer.py <source_file.pas>
+#   python3 bench/bench_parallel_lexer.py --size 50 --workers 8  # ~50 MB, sampe 8 worker
+
+import contextlib
+import glob
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import (
+    ARITHMETIC_OPERATORS, KEYWORDS, LOGICAL_OPERATORS, lexical_analyze, load_engine, read_source_file
+)
+from parallel_lexer import parallel_lexical_analyze
+
+DFA_PATH = os.path.join(ROOT, "rules", "dfa_rules_final.json")
+
+def synthetic_source(size_mb):
+    # gabungin program test milestone-3 yang lolos lexer sampe ukurannya kira-kira size_mb
+    engine = load_engine(DFA_PATH)
+    parts = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test", "milestone-3", "input", "*.pas"))):
+        text = read_source_file(path)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            lexical_analyze(text, engine, KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
+        if not out.getvalue():
+            parts.append(text)
+    unit = "\n".join(parts) + "\n"
+    return unit * max(1, int(size_mb * (1 << 20) / len(unit)))
+
+def same_tokens(a, b):
+    return (a.kinds == b.kinds and a.starts == b.starts and a.ends == b.ends
+            and a.overrides == b.overrides)
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+def main():
+    args = sys.argv[1:]
+    size_mb = 20
+    max_workers = os.cpu_count() or 1
+    source_path = None
+    while args:
+        arg = args.pop(0)
+        if arg == "--size":
+            size_mb = float(args.pop(0))
+        elif arg == "--workers":
+            max_workers = int(args.pop(0))
+        else:
+            source_path = arg
+    if source_path:
+        text = read_source_file(source_path)
+        name = source_path
+    else:
+        text = synthetic_source(size_mb)
+        name = f"synthetic ({size_mb:g} MB)"
+
+    engine = load_engine(DFA_PATH)
+    print(f"Source: {name}, {len(text) / (1 << 20):.1f} MB, cpu_count = {os.cpu_count()}")
+    reference, serial_time = timed(
+        lambda: lexical_analyze(text, engine, KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS))
+    print(f"{'workers':<9}{'time (s)':<11}{'speedup':<9}{'tokens':<10}match")
+    print(f"{'serial':<9}{serial_time:<11.2f}{1.0:<9.2f}{len(reference):<10}-")
+
+    workers = 1
+    while workers <= max_workers:
+        tokens, elapsed = timed(lambda: parallel_lexical_analyze(text, DFA_PATH, workers))
+        match = "yes" if same_tokens(tokens, reference) else "NO"
+        print(f"{workers:<9}{elapsed:<11.2f}{serial_time / elapsed:<9.2f}{len(tokens):<10}{match}")
+        workers *= 2
+
+if __name__ == "__main__":
+    main()
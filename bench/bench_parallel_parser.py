@@ -0,0 +1,91 @@
+# benchmark parser paralel: waktu parsing satu program gede buat jumlah worker yang beda-beda
+# token di-lex sekali di luar timing, hasil tiap run dicek harus sama persis kayak Parser.parse()
+# program sintetisnya sama kayak bench_parser.py: program corpus dijadiin prosedur level atas
+#
+# cara pake (dari root folder):
+#   python3 bench/bench_parallel_parser.py                        # skala 64
+#   python3 bench/bench_parallel_parser.py <source_file.pas>
+#   python3 bench/bench_parallel_parser.py --scale 256 --workers 8 --repeat 5
+
+import gc
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from bench_parser import DFA_PATH, corpus, lex, synthetic_program
+from lexer import load_engine, read_source_file
+from parallel_parser import find_subprogram_bounds, parallel_parse
+from parser import ParseNode, Parser
+
+def same_tree(a, b):
+    # bandingin iteratif (tree-nya bisa dalem), token dibandingin field-nya
+    stack = [(a, b)]
+    while stack:
+        x, y = stack.pop()
+        if isinstance(x, ParseNode):
+            if not isinstance(y, ParseNode) or x.chain != y.chain or len(x.children) != len(y.children):
+                return False
+            stack.extend(zip(x.children, y.children))
+        elif isinstance(y, ParseNode) or (x.type, x.value, x.offset) != (y.type, y.value, y.offset):
+            return False
+    return True
+
+def timed(fn, repeat):
+    # waktu terbaik dari beberapa run, gc.collect dulu tiap run biar sampah run sebelumnya gak ikut keitung
+    best = None
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        start = time.perf_counter()
+        result = fn()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+def main():
+    args = sys.argv[1:]
+    scale = 64
+    repeat = 3
+    max_workers = os.cpu_count() or 1
+    source_path = None
+    while args:
+        arg = args.pop(0)
+        if arg == "--scale":
+            scale = int(args.pop(0))
+        elif arg == "--workers":
+            max_workers = int(args.pop(0))
+        elif arg == "--repeat":
+            repeat = int(args.pop(0))
+        else:
+            source_path = arg
+
+    engine = load_engine(DFA_PATH)
+    if source_path:
+        text = read_source_file(source_path)
+        name = source_path
+    else:
+        text = synthetic_program(corpus(engine), scale)
+        name = f"synthetic x{scale}"
+    tokens = lex(text, engine)
+
+    print(f"Source: {name}, {len(tokens)} tokens, {len(find_subprogram_bounds(tokens))} top-level subprograms, "
+          f"cpu_count = {os.cpu_count()}")
+    # semua run diukur dengan tree referensi udah ada di memory, biar beban GC-nya sama
+    reference = Parser(tokens).parse()
+    _, serial_time = timed(lambda: Parser(tokens).parse(), repeat)
+    print(f"{'workers':<9}{'time (s)':<11}{'speedup':<9}match")
+    print(f"{'serial':<9}{serial_time:<11.2f}{1.0:<9.2f}-")
+
+    workers = 1
+    while workers <= max_workers:
+        tree, elapsed = timed(lambda: parallel_parse(tokens, workers), repeat)
+        match = "yes" if same_tree(tree, reference) else "NO"
+        del tree
+        print(f"{workers:<9}{elapsed:<11.2f}{serial_time / elapsed:<9.2f}{match}")
+        workers *= 2
+
+if __name__ == "__main__":
+    main()
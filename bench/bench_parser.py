@@ -0,0 +1,154 @@
+# benchmark parser: waktu bikin parse tree (recursive descent atau tabel LL(1)) / AST (lewat parse tree
+# atau langsung) + memory yang kepake
+# token di-lex sekali di luar timing, yang diukur cuma parser-nya
+#
+# input: program test/milestone-*/input yang lolos lexer dan parser tanpa error (corpus),
+# plus program sintetis gede: tiap program corpus dijadiin prosedur
+# (program X; ... selesai.  ->  prosedur X_k; ... selesai;) terus diulang sampe skala tertentu
+# yang dilaporin: waktu terbaik dari beberapa run, peak memory Python (tracemalloc), dan
+# pertambahan peak RSS process selama parsing (diukur di child process hasil fork)
+#
+# cara pake (dari root folder):
+#   python3 bench/bench_parser.py
+#   python3 bench/bench_parser.py --scale 1,8,64 --repeat 3
+
+import contextlib
+import glob
+import io
+import multiprocessing
+import os
+import re
+import resource
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from ast_builder import ASTBuilder
+from ast_parser import ASTParser
+from event_tree import EventParser
+from lexer import ARITHMETIC_OPERATORS, KEYWORDS, LOGICAL_OPERATORS, lexical_analyze, load_engine, read_source_file
+from ll1 import LL1Parser
+from parser import Parser
+
+DFA_PATH = os.path.join(ROOT, "rules", "dfa_rules_final.json")
+
+# parser yang dibandingin: (label, fungsi tokens -> hasil), parser baru tinggal ditambahin
+PARSERS = [
+    ("parse tree", lambda tokens: Parser(tokens).parse()),
+    ("compressed", lambda tokens: Parser(tokens, compress=True).parse()),
+    ("events", lambda tokens: EventParser(tokens).parse()),
+    ("LL(1) table", lambda tokens: LL1Parser(tokens).parse()),
+    # cuma deklarasi: body prosedur/fungsi gak pernah diakses
+    ("lazy bodies", lambda tokens: Parser(tokens, lazy=True).parse()),
+    ("tree + AST", lambda tokens: ASTBuilder().build(Parser(tokens).parse())),
+    ("direct AST", lambda tokens: ASTParser(tokens).parse()),
+]
+
+_PROGRAM_HEADER = re.compile(r"\bprogram\s+(\w+)\s*;", re.IGNORECASE)
+
+def lex(text, engine):
+    return lexical_analyze(text, engine, KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
+
+def corpus(engine):
+    # program corpus yang lolos lexer dan parser tanpa error
+    texts = []
+    for path in sorted(glob.glob(os.path.join(ROOT, "test", "milestone-*", "input", "*.pas"))):
+        text = read_source_file(path)
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            try:
+                Parser(lex(text, engine)).parse()
+            except Exception:
+                continue
+        if not out.getvalue():
+            texts.append(text)
+    return texts
+
+def synthetic_program(texts, scale):
+    # gabungin program corpus jadi prosedur di satu program gede
+    parts = ["program Bench;\n"]
+    for k in range(scale):
+        for text in texts:
+            body = _PROGRAM_HEADER.sub(lambda m: f"prosedur {m.group(1)}_{k};", text, count=1)
+            parts.append(body[:body.rindex(".")] + ";\n")
+    parts.append("mulai\nselesai.\n")
+    return "".join(parts)
+
+def _current_rss():
+    with open("/proc/self/statm") as f:
+        return int(f.read().split()[1]) * resource.getpagesize()
+
+def _rss_child(fn, inputs, conn):
+    base = _current_rss()
+    results = [fn(tokens) for tokens in inputs]
+    conn.send(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024 - base)
+    del results
+
+def peak_rss(fn, inputs):
+    # pertambahan peak RSS selama fn jalan, None kalo gak bisa diukur (bukan Linux)
+    if not os.path.exists("/proc/self/statm"):
+        return None
+    context = multiprocessing.get_context("fork")
+    receiver, sender = context.Pipe(False)
+    process = context.Process(target=_rss_child, args=(fn, inputs, sender))
+    process.start()
+    grow = receiver.recv()
+    process.join()
+    return grow
+
+def measure(fn, inputs, repeat):
+    # return (waktu terbaik, peak tracemalloc byte)
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        results = [fn(tokens) for tokens in inputs]
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+        del results
+    tracemalloc.start()
+    results = [fn(tokens) for tokens in inputs]
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del results
+    return best, peak
+
+def main():
+    args = sys.argv[1:]
+    scales = [1, 8, 64]
+    repeat = 3
+    while args:
+        arg = args.pop(0)
+        if arg == "--scale":
+            scales = [int(s) for s in args.pop(0).split(",")]
+        elif arg == "--repeat":
+            repeat = int(args.pop(0))
+        else:
+            print("Usage: python3 bench/bench_parser.py [--scale 1,8,64] [--repeat N]")
+            sys.exit(1)
+
+    engine = load_engine(DFA_PATH)
+    texts = corpus(engine)
+    inputs = [("corpus", [lex(text, engine) for text in texts])]
+    for scale in scales:
+        inputs.append((f"synthetic x{scale}", [lex(synthetic_program(texts, scale), engine)]))
+
+    # RSS diukur duluan: kalo parser udah pernah jalan di process ini, memory bekas parse tree
+    # sebelumnya dipake ulang sama child-nya dan RSS-nya keliatan gak nambah
+    rss = {(input_name, label): peak_rss(fn, token_streams)
+           for input_name, token_streams in inputs for label, fn in PARSERS}
+
+    print(f"Corpus: {len(texts)} programs, repeat = {repeat}")
+    print(f"{'input':<16}{'parser':<12}{'tokens':<10}{'time (s)':<10}{'tokens/s':<11}{'peak (MB)':<11}RSS (MB)")
+    for input_name, token_streams in inputs:
+        n_tokens = sum(len(tokens) for tokens in token_streams)
+        for label, fn in PARSERS:
+            elapsed, peak = measure(fn, token_streams, repeat)
+            rss_grow = rss[input_name, label]
+            rss_text = "-" if rss_grow is None else f"{rss_grow / (1 << 20):.2f}"
+            print(f"{input_name:<16}{label:<12}{n_tokens:<10}{elapsed:<10.3f}"
+                  f"{n_tokens / elapsed if elapsed else 0:<11.0f}{peak / (1 << 20):<11.2f}{rss_text}")
+
+if __name__ == "__main__":
+    main()
@@ -1,65 +1,99 @@
 from ast_nodes import *
-from typing import Dict, List, Any, Optional
+from parser import (
+    ARRAY_TYPE, ASSIGNMENT_STATEMENT, COMPOUND_STATEMENT, CONST_DECLARATION, EMPTY_STATEMENT, ERROR,
+    EXPRESSION, FACTOR, FOR_STATEMENT, FORMAL_PARAMETER_LIST, FUNCTION_CALL, FUNCTION_DECLARATION,
+    IF_STATEMENT, PARAMETER_GROUP, PROCEDURE_CALL, PROCEDURE_DECLARATION, PROGRAM, RANGE,
+    REPEAT_STATEMENT, TYPE_DECLARATION, VAR_DECLARATION, WHILE_STATEMENT, ParseNode, Token
+)
+
+# parse tree dari Parser(recover=True) bisa ada node <error> di bagian yang gagal di-parse,
+# subtree yang rusak itu dilewatin (lihat has_error dan declaration_items)
+from typing import List, Any, Optional
 
 class ASTBuilder:
     def __init__(self):
         self.errors = []
     
-    def build(self, parse_tree: Dict) -> ProgramNode:
-        if parse_tree["type"] != "<program>":
+    def build(self, parse_tree: ParseNode) -> ProgramNode:
+        if parse_tree.kind != PROGRAM:
             raise ValueError("Expected <program> as root node")
         
         return self.transform_program(parse_tree)
     
-    def transform_program(self, node: Dict) -> ProgramNode:
-        children = node["children"]
+    def transform_program(self, node: ParseNode) -> ProgramNode:
+        children = node.children
         program_header = children[0]
-        program_name = self.extract_identifier(program_header["children"][1])
+        program_name, program_key = "", None
+        if program_header.kind != ERROR:
+            program_name = self.extract_identifier(program_header.children[1])
+            program_key = program_header.children[1].name
         
         declarations = self.transform_declaration_part(children[1])
         
-        body = self.transform_compound_statement(children[2])
+        if children[2].kind == ERROR:
+            body = self.locate(CompoundStatementNode(statements=[]), children[2])
+        else:
+            body = self.transform_compound_statement(children[2])
         
-        return ProgramNode(name=program_name, declarations=declarations, body=body)
+        return self.locate(ProgramNode(name=program_name, declarations=declarations, body=body, key=program_key), program_header)
     
-    def transform_declaration_part(self, node: Dict) -> DeclarationPartNode:
+    def transform_declaration_part(self, node: ParseNode) -> DeclarationPartNode:
         const_decls = []
         type_decls = []
         var_decls = []
         subprogram_decls = []
         
-        for child in node.get("children", []):
-            node_type = child.get("type", "")
+        for child in node.children:
+            node_kind = child.kind
             
-            if node_type == "<const-declaration>":
+            if node_kind == CONST_DECLARATION:
                 const_decls.extend(self.transform_const_declaration(child))
-            elif node_type == "<type-declaration>":
+            elif node_kind == TYPE_DECLARATION:
                 type_decls.extend(self.transform_type_declaration(child))
-            elif node_type == "<var-declaration>":
+            elif node_kind == VAR_DECLARATION:
                 var_decls.extend(self.transform_var_declaration(child))
-            elif node_type == "<procedure-declaration>":
+            elif self.has_error(child):
+                continue
+            elif node_kind == PROCEDURE_DECLARATION:
                 subprogram_decls.append(self.transform_procedure_declaration(child))
-            elif node_type == "<function-declaration>":
+            elif node_kind == FUNCTION_DECLARATION:
                 subprogram_decls.append(self.transform_function_declaration(child))
         
-        return DeclarationPartNode(
+        return self.locate(DeclarationPartNode(
             const_decls=const_decls,
             type_decls=type_decls,
             var_decls=var_decls,
             subprogram_decls=subprogram_decls
-        )
+        ), node)
      
-    def transform_const_declaration(self, node: Dict) -> List[ConstDeclNode]:
+    def has_error(self, node: ParseNode) -> bool:
+        # node <error> langsung di bawah node ini (header/body prosedur/fungsi yang rusak)
+        return any(isinstance(child, ParseNode) and child.kind == ERROR for child in node.children)
+    
+    def declaration_items(self, node: ParseNode) -> List[tuple]:
+        # anak deklarasi konstanta/tipe/variabel dipotong per item (sampe titik koma), item yang
+        # diakhirin node <error> dibuang
+        items = []
+        item = []
+        for child in node.children[1:]:
+            if isinstance(child, ParseNode) and child.kind == ERROR:
+                item = []
+                continue
+            item.append(child)
+            if isinstance(child, Token) and child.type == "SEMICOLON":
+                items.append(tuple(item))
+                item = []
+        return items
+    
+    def transform_const_declaration(self, node: ParseNode) -> List[ConstDeclNode]:
         const_nodes = []
-        children = node["children"]
         
-        i = 1
-        while i < len(children):
-            name = self.extract_identifier(children[i])
-            i += 2
+        for item in self.declaration_items(node):
+            name_token = item[0]
+            name = self.extract_identifier(name_token)
             
-            value_token = children[i]
-            if hasattr(value_token, 'type'):
+            value_token = item[2]
+            if isinstance(value_token, Token):
                 if value_token.type == "NUMBER":
                     value = self.parse_number(value_token.value)
                 elif value_token.type == "CHAR_LITERAL":
@@ -73,74 +107,70 @@ class ASTBuilder:
             else:
                 value = value_token
             
-            const_nodes.append(ConstDeclNode(name=name, value=value))
-            i += 2
+            const_nodes.append(self.locate(ConstDeclNode(name=name, value=value, key=name_token.name), name_token))
         
         return const_nodes
     
-    def transform_type_declaration(self, node: Dict) -> List[TypeDeclNode]:
+    def transform_type_declaration(self, node: ParseNode) -> List[TypeDeclNode]:
         type_nodes = []
-        children = node["children"]
         
-        i = 1
-        while i < len(children):
-            name = self.extract_identifier(children[i])
-            i += 2
+        for item in self.declaration_items(node):
+            name_token = item[0]
+            name = self.extract_identifier(name_token)
             
-            type_spec = self.transform_type(children[i])
-            type_nodes.append(TypeDeclNode(name=name, type_spec=type_spec))
-            i += 2
+            type_spec = self.transform_type(item[2])
+            type_nodes.append(self.locate(TypeDeclNode(name=name, type_spec=type_spec, key=name_token.name), name_token))
         
         return type_nodes
     
-    def transform_var_declaration(self, node: Dict) -> List[VarDeclNode]:
+    def transform_var_declaration(self, node: ParseNode) -> List[VarDeclNode]:
         var_nodes = []
-        children = node["children"]
         
-        i = 1
-        while i < len(children):
-            id_list = self.transform_identifier_list(children[i])
-            i += 2
+        for item in self.declaration_items(node):
+            id_list_node = item[0]
+            id_list = self.transform_identifier_list(id_list_node)
             
-            type_spec = self.transform_type(children[i])
-            var_nodes.append(VarDeclNode(names=id_list, type_spec=type_spec))
-            i += 2
+            type_spec = self.transform_type(item[2])
+            var_nodes.append(self.locate(VarDeclNode(names=[token.value for token in id_list], type_spec=type_spec,
+                                                     keys=[token.name for token in id_list]), id_list_node))
         
         return var_nodes
     
-    def transform_identifier_list(self, node: Dict) -> List[str]:
+    # balikin token identifier-nya, pemanggil ambil value sama name-nya
+    def transform_identifier_list(self, node: ParseNode) -> List[Token]:
         
         identifiers = []
-        for child in node["children"]:
-            if hasattr(child, 'type') and child.type == "IDENTIFIER":
-                identifiers.append(child.value)
+        for child in node.children:
+            if isinstance(child, Token) and child.type == "IDENTIFIER":
+                identifiers.append(child)
         return identifiers
     
-    def transform_procedure_declaration(self, node: Dict) -> ProcedureDeclNode:
-        children = node["children"]
+    def transform_procedure_declaration(self, node: ParseNode) -> ProcedureDeclNode:
+        children = node.children
         
         name = self.extract_identifier(children[1])
         
         params = []
         block_idx = 2
-        if len(children) > 3 and isinstance(children[2], dict) and children[2].get("type") == "<formal-parameter-list>":
+        if len(children) > 3 and isinstance(children[2], ParseNode) and children[2].kind == FORMAL_PARAMETER_LIST:
             params = self.transform_formal_parameter_list(children[2])
             block_idx = 3
         
         block = children[block_idx + 1]
-        declarations = self.transform_declaration_part(block["children"][0])
-        body = self.transform_compound_statement(block["children"][1])
+        declarations = self.transform_declaration_part(block.children[0])
+        body = self.transform_compound_statement(block.children[1])
         
-        return ProcedureDeclNode(name=name, params=params, declarations=declarations, body=body)
+        return self.locate(ProcedureDeclNode(name=name, params=params, declarations=declarations, body=body,
+                                             key=children[1].name), children[1])
     
-    def transform_function_declaration(self, node: Dict) -> FunctionDeclNode:
-        children = node["children"]
+    def transform_function_declaration(self, node: ParseNode) -> FunctionDeclNode:
+        children = node.children
         
         name = self.extract_identifier(children[1])
         
         params = []
         type_idx = 2
-        if len(children) > 3 and isinstance(children[2], dict) and children[2].get("type") == "<formal-parameter-list>":
+        if len(children) > 3 and isinstance(children[2], ParseNode) and children[2].kind == FORMAL_PARAMETER_LIST:
             params = self.transform_formal_parameter_list(children[2])
             type_idx = 3
         
@@ -148,115 +178,113 @@ class ASTBuilder:
         
         block_idx = type_idx + 2
         block = children[block_idx + 1]
-        declarations = self.transform_declaration_part(block["children"][0])
-        body = self.transform_compound_statement(block["children"][1])
+        declarations = self.transform_declaration_part(block.children[0])
+        body = self.transform_compound_statement(block.children[1])
         
-        return FunctionDeclNode(name=name, params=params, return_type=return_type,
-                               declarations=declarations, body=body)
+        return self.locate(FunctionDeclNode(name=name, params=params, return_type=return_type,
+                                            declarations=declarations, body=body, key=children[1].name), children[1])
     
-    def transform_formal_parameter_list(self, node: Dict) -> List[ParamNode]:
+    def transform_formal_parameter_list(self, node: ParseNode) -> List[ParamNode]:
         params = []
-        children = node["children"]
+        children = node.children
         
         for child in children:
-            if isinstance(child, dict) and child.get("type") == "<parameter-group>":
-                param_group = child["children"]
+            if isinstance(child, ParseNode) and child.kind == PARAMETER_GROUP:
+                param_group = child.children
                 id_list = self.transform_identifier_list(param_group[0])
                 type_spec = self.transform_type(param_group[2])
-                params.append(ParamNode(names=id_list, type_spec=type_spec))
+                params.append(self.locate(ParamNode(names=[token.value for token in id_list], type_spec=type_spec,
+                                                    keys=[token.name for token in id_list]), param_group[0]))
         
         return params
     
-    def transform_type(self, node: Dict) -> TypeSpecNode:
-        child = node["children"][0]
+    def transform_type(self, node: ParseNode) -> TypeSpecNode:
+        child = node.children[0]
         
-        if isinstance(child, dict):
-            node_type = child.get("type", "")
-            if node_type == "<array-type>":
+        if isinstance(child, ParseNode):
+            if child.kind == ARRAY_TYPE:
                 return self.transform_array_type(child)
-            elif node_type == "<range>":
-                return RangeTypeNode(range_spec=self.transform_range(child))
+            elif child.kind == RANGE:
+                return self.locate(RangeTypeNode(range_spec=self.transform_range(child)), child)
         else:
-            if hasattr(child, 'type'):
+            if isinstance(child, Token):
                 if child.type == "KEYWORD":
-                    return PrimitiveTypeNode(type_name=child.value.lower())
+                    return self.locate(PrimitiveTypeNode(type_name=child.name), child)
                 elif child.type == "IDENTIFIER":
-                    return CustomTypeNode(type_name=child.value)
+                    return self.locate(CustomTypeNode(type_name=child.value, key=child.name), child)
         
         raise ValueError(f"Unknown type structure: {node}")
     
-    def transform_array_type(self, node: Dict) -> ArrayTypeNode:
-        children = node["children"]
+    def transform_array_type(self, node: ParseNode) -> ArrayTypeNode:
+        children = node.children
         range_node = self.transform_range(children[2])
         element_type = self.transform_type(children[5])
         
-        return ArrayTypeNode(index_range=range_node, element_type=element_type)
+        return self.locate(ArrayTypeNode(index_range=range_node, element_type=element_type), node)
     
-    def transform_range(self, node: Dict) -> RangeNode:
-        children = node["children"]
+    def transform_range(self, node: ParseNode) -> RangeNode:
+        children = node.children
         start = self.transform_expression(children[0])
         end = self.transform_expression(children[2])
         
-        return RangeNode(start=start, end=end)
+        return self.locate(RangeNode(start=start, end=end), node)
     
-    def transform_compound_statement(self, node: Dict) -> CompoundStatementNode:
-        statement_list = node["children"][1]
+    def transform_compound_statement(self, node: ParseNode) -> CompoundStatementNode:
+        statement_list = node.children[1]
         statements = self.transform_statement_list(statement_list)
         
-        return CompoundStatementNode(statements=statements)
+        return self.locate(CompoundStatementNode(statements=statements), node)
     
-    def transform_statement_list(self, node: Dict) -> List[StatementNode]:
+    def transform_statement_list(self, node: ParseNode) -> List[StatementNode]:
         statements = []
         
-        for child in node["children"]:
-            if isinstance(child, dict) and "type" in child:
-                if not child["type"].startswith("<"):
-                    continue
+        for child in node.children:
+            if isinstance(child, ParseNode) and child.kind != ERROR:
                 stmt = self.transform_statement(child)
                 if not isinstance(stmt, EmptyStatementNode):
                     statements.append(stmt)
         
         return statements
     
-    def transform_statement(self, node: Dict) -> StatementNode:
-        node_type = node.get("type", "")
+    def transform_statement(self, node: ParseNode) -> StatementNode:
+        node_kind = node.kind
         
-        if node_type == "<compound-statement>":
+        if node_kind == COMPOUND_STATEMENT:
             return self.transform_compound_statement(node)
-        elif node_type == "<assignment-statement>":
+        elif node_kind == ASSIGNMENT_STATEMENT:
             return self.transform_assignment_statement(node)
-        elif node_type == "<if-statement>":
+        elif node_kind == IF_STATEMENT:
             return self.transform_if_statement(node)
-        elif node_type == "<while-statement>":
+        elif node_kind == WHILE_STATEMENT:
             return self.transform_while_statement(node)
-        elif node_type == "<for-statement>":
+        elif node_kind == FOR_STATEMENT:
             return self.transform_for_statement(node)
-        elif node_type == "<repeat-statement>":
+        elif node_kind == REPEAT_STATEMENT:
             return self.transform_repeat_statement(node)
-        elif node_type == "<procedure/function-call>":
+        elif node_kind == PROCEDURE_CALL:
             return self.transform_procedure_call(node)
-        elif node_type == "<empty-statement>":
+        elif node_kind == EMPTY_STATEMENT:
             return EmptyStatementNode()
         else:
-            raise ValueError(f"Unknown statement type: {node_type}")
+            raise ValueError(f"Unknown statement type: {node.type}")
     
-    def transform_assignment_statement(self, node: Dict) -> AssignmentNode:
-        children = node["children"]
+    def transform_assignment_statement(self, node: ParseNode) -> AssignmentNode:
+        children = node.children
         
         var_name = self.extract_identifier(children[0])
         
-        if len(children) > 2 and hasattr(children[1], 'type') and children[1].type == "LBRACKET":
+        if len(children) > 2 and isinstance(children[1], Token) and children[1].type == "LBRACKET":
             index = self.transform_expression(children[2])
-            target = ArrayAccessNode(array_name=var_name, index=index)
+            target = self.locate(ArrayAccessNode(array_name=var_name, index=index, key=children[0].name), children[0])
             value = self.transform_expression(children[5])
         else:
-            target = VarNode(name=var_name)
+            target = self.locate(VarNode(name=var_name, key=children[0].name), children[0])
             value = self.transform_expression(children[2])
         
-        return AssignmentNode(target=target, value=value)
+        return self.locate(AssignmentNode(target=target, value=value), children[0])
     
-    def transform_if_statement(self, node: Dict) -> IfStatementNode:
-        children = node["children"]
+    def transform_if_statement(self, node: ParseNode) -> IfStatementNode:
+        children = node.children
         
         condition = self.transform_expression(children[1])
         then_stmt = self.transform_statement(children[3])
@@ -265,94 +293,94 @@ class ASTBuilder:
         if len(children) > 4:
             else_stmt = self.transform_statement(children[5])
         
-        return IfStatementNode(condition=condition, then_stmt=then_stmt, else_stmt=else_stmt)
+        return self.locate(IfStatementNode(condition=condition, then_stmt=then_stmt, else_stmt=else_stmt), children[0])
     
-    def transform_while_statement(self, node: Dict) -> WhileStatementNode:
-        children = node["children"]
+    def transform_while_statement(self, node: ParseNode) -> WhileStatementNode:
+        children = node.children
         
         condition = self.transform_expression(children[1])
         body = self.transform_statement(children[3])
         
-        return WhileStatementNode(condition=condition, body=body)
+        return self.locate(WhileStatementNode(condition=condition, body=body), children[0])
     
-    def transform_for_statement(self, node: Dict) -> ForStatementNode:
-        children = node["children"]
+    def transform_for_statement(self, node: ParseNode) -> ForStatementNode:
+        children = node.children
         
         var_name = self.extract_identifier(children[1])
         start = self.transform_expression(children[3])
         
         direction_token = children[4]
         is_downto = False
-        if hasattr(direction_token, 'value') and direction_token.value == "turun-ke":
+        if isinstance(direction_token, Token) and direction_token.name == "turun-ke":
             is_downto = True
         
         end = self.transform_expression(children[5])
         body = self.transform_statement(children[7])
         
-        return ForStatementNode(var_name=var_name, start=start, end=end, 
-                              body=body, is_downto=is_downto)
+        return self.locate(ForStatementNode(var_name=var_name, start=start, end=end, 
+                                            body=body, is_downto=is_downto, key=children[1].name), children[0])
     
-    def transform_repeat_statement(self, node: Dict) -> RepeatStatementNode:
-        children = node["children"]
+    def transform_repeat_statement(self, node: ParseNode) -> RepeatStatementNode:
+        children = node.children
         
         statement_list = self.transform_statement_list(children[1])
         condition = self.transform_expression(children[3])
         
-        return RepeatStatementNode(body=statement_list, condition=condition)
+        return self.locate(RepeatStatementNode(body=statement_list, condition=condition), children[0])
     
-    def transform_procedure_call(self, node: Dict) -> ProcedureCallNode:
-        children = node["children"]
+    def transform_procedure_call(self, node: ParseNode) -> ProcedureCallNode:
+        children = node.children
         
         name = self.extract_identifier(children[0])
         
         args = []
-        if len(children) > 2 and isinstance(children[2], dict):
+        if len(children) > 2 and isinstance(children[2], ParseNode):
             args = self.transform_parameter_list(children[2])
         
-        return ProcedureCallNode(name=name, args=args)
+        return self.locate(ProcedureCallNode(name=name, args=args, key=children[0].name), children[0])
     
-    def transform_parameter_list(self, node: Dict) -> List[ExpressionNode]:
+    def transform_parameter_list(self, node: ParseNode) -> List[ExpressionNode]:
         params = []
         
-        for child in node["children"]:
-            if isinstance(child, dict) and child.get("type", "").startswith("<"):
+        for child in node.children:
+            if isinstance(child, ParseNode):
                 params.append(self.transform_expression(child))
         
         return params
     
-    def transform_expression(self, node: Dict) -> ExpressionNode:
-        children = node["children"]
+    def transform_expression(self, node: ParseNode) -> ExpressionNode:
+        children = node.children
         
         left = self.transform_simple_expression(children[0])
         
         if len(children) > 1:
             op_token = children[1]
-            if hasattr(op_token, 'type') and op_token.type == "RELATIONAL_OPERATOR":
+            if isinstance(op_token, Token) and op_token.type == "RELATIONAL_OPERATOR":
                 right = self.transform_simple_expression(children[2])
-                return BinOpNode(operator=op_token.value, left=left, right=right)
+                return self.locate(BinOpNode(operator=op_token.value, left=left, right=right), op_token)
         
         return left
     
-    def transform_simple_expression(self, node: Dict) -> ExpressionNode:
-        children = node["children"]
+    def transform_simple_expression(self, node: ParseNode) -> ExpressionNode:
+        children = node.children
         idx = 0
         
         result = None
-        if hasattr(children[0], 'type') and children[0].type == "ARITHMETIC_OPERATOR":
+        if isinstance(children[0], Token) and children[0].type == "ARITHMETIC_OPERATOR":
             sign = children[0].value
             term = self.transform_term(children[1])
-            result = UnaryOpNode(operator=sign, operand=term)
+            result = self.locate(UnaryOpNode(operator=sign, operand=term), children[0])
             idx = 2
         else:
             result = self.transform_term(children[0])
             idx = 1
         
         while idx < len(children):
-            if hasattr(children[idx], 'type'):
+            if isinstance(children[idx], Token):
                 if children[idx].type == "ARITHMETIC_OPERATOR" or children[idx].type == "LOGICAL_OPERATOR":
                     operator = children[idx].value
                     right = self.transform_term(children[idx + 1])
-                    result = BinOpNode(operator=operator, left=result, right=right)
+                    result = self.locate(BinOpNode(operator=operator, left=result, right=right), children[idx])
                     idx += 2
                 else:
                     idx += 1
@@ -361,18 +389,18 @@ class ASTBuilder:
         
         return result
     
-    def transform_term(self, node: Dict) -> ExpressionNode:
-        children = node["children"]
+    def transform_term(self, node: ParseNode) -> ExpressionNode:
+        children = node.children
         
         result = self.transform_factor(children[0])
         idx = 1
         
         while idx < len(children):
-            if hasattr(children[idx], 'type'):
+            if isinstance(children[idx], Token):
                 if children[idx].type == "ARITHMETIC_OPERATOR" or children[idx].type == "LOGICAL_OPERATOR":
                     operator = children[idx].value
                     right = self.transform_factor(children[idx + 1])
-                    result = BinOpNode(operator=operator, left=result, right=right)
+                    result = self.locate(BinOpNode(operator=operator, left=result, right=right), children[idx])
                     idx += 2
                 else:
                     idx += 1
@@ -381,55 +409,70 @@ class ASTBuilder:
         
         return result
     
-    def transform_factor(self, node: Dict) -> ExpressionNode:
-        children = node["children"]
+    def transform_factor(self, node: ParseNode) -> ExpressionNode:
+        children = node.children
         child = children[0]
         
-        if isinstance(child, dict):
-            node_type = child.get("type", "")
-            if node_type == "<function-call>":
+        if isinstance(child, ParseNode):
+            if child.kind == FUNCTION_CALL:
                 return self.transform_function_call(child)
-            elif node_type == "<expression>":
+            elif child.kind == EXPRESSION:
                 return self.transform_expression(child)
-            elif node_type == "<factor>":
+            elif child.kind == FACTOR:
                 operand = self.transform_factor(child)
-                return UnaryOpNode(operator="tidak", operand=operand)
+                return self.locate(UnaryOpNode(operator="tidak", operand=operand), node)
         else:
-            if hasattr(child, 'type'):
+            if isinstance(child, Token):
                 if child.type == "IDENTIFIER":
-                    if len(children) > 1 and hasattr(children[1], 'type') and children[1].type == "LBRACKET":
+                    if len(children) > 1 and isinstance(children[1], Token) and children[1].type == "LBRACKET":
                         index = self.transform_expression(children[2])
-                        return ArrayAccessNode(array_name=child.value, index=index)
+                        return self.locate(ArrayAccessNode(array_name=child.value, index=index, key=child.name), child)
                     else:
-                        return VarNode(name=child.value)
+                        return self.locate(VarNode(name=child.value, key=child.name), child)
                 elif child.type == "NUMBER":
-                    return NumberLiteralNode(value=self.parse_number(child.value))
+                    return self.locate(NumberLiteralNode(value=self.parse_number(child.value)), child)
                 elif child.type == "CHAR_LITERAL":
-                    return CharLiteralNode(value=child.value)
+                    return self.locate(CharLiteralNode(value=child.value), child)
                 elif child.type == "STRING_LITERAL":
                     value = child.value[1:-1] if len(child.value) >= 2 else child.value
-                    return StringLiteralNode(value=value)
+                    return self.locate(StringLiteralNode(value=value), child)
                 elif child.type == "LOGICAL_OPERATOR" and child.value == "tidak":
                     operand = self.transform_factor(children[1])
-                    return UnaryOpNode(operator="tidak", operand=operand)
+                    return self.locate(UnaryOpNode(operator="tidak", operand=operand), child)
                 elif child.type == "LPARENTHESIS":
                     return self.transform_expression(children[1])
         
         raise ValueError(f"Unknown factor structure: {node}")
     
-    def transform_function_call(self, node: Dict) -> FunctionCallNode:
-        children = node["children"]
+    def transform_function_call(self, node: ParseNode) -> FunctionCallNode:
+        children = node.children
         
         name = self.extract_identifier(children[0])
         
         args = []
-        if len(children) > 2 and isinstance(children[2], dict):
+        if len(children) > 2 and isinstance(children[2], ParseNode):
             args = self.transform_parameter_list(children[2])
         
-        return FunctionCallNode(name=name, args=args)
+        return self.locate(FunctionCallNode(name=name, args=args, key=children[0].name), children[0])
+    
+    def locate(self, ast_node: ASTNode, source) -> ASTNode:
+        # tempel token awal dari parse tree ke ast node, line/column-nya baru dihitung pas dipake
+        ast_node.token = self.first_token(source)
+        return ast_node
+    
+    def first_token(self, node) -> Optional[Any]:
+        # token paling kiri di subtree parse tree (None kalo subtree-nya kosong)
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            if isinstance(current, ParseNode):
+                stack.extend(reversed(current.children))
+            elif isinstance(current, Token):
+                return current
+        return None
     
     def extract_identifier(self, token) -> str:
-        if hasattr(token, 'value'):
+        if isinstance(token, Token):
             return token.value
         raise ValueError(f"Expected identifier token, got: {token}")
     
@@ -1,23 +1,53 @@
 from typing import List, Optional, Union, Any
 
+from token_stream import fold_name
+
 class ASTNode:
     def __init__(self, line: Optional[int] = None, column: Optional[int] = None):
-        self.line = line
-        self.column = column
+        self._line = line
+        self._column = column
+        # token awal node di source, line/column di-resolve dari sini pas dibutuhin
+        self.token: Optional[Any] = None
+        # node yang punya nama identifier juga nyimpen key (keys buat list nama): nama versi
+        # case-fold yang di-intern (Token.name), dipake symbol table buat bandingin pake is
 
         self.tab_index: Optional[int] = None      
         self.computed_type: Optional[Any] = None  
         self.scope_level: Optional[int] = None    
 
+    def _resolve_position(self):
+        if self._line is None and self.token is not None:
+            self._line, self._column = self.token.line_col()
+
+    @property
+    def line(self) -> Optional[int]:
+        self._resolve_position()
+        return self._line
+
+    @line.setter
+    def line(self, value: Optional[int]):
+        self._line = value
+
+    @property
+    def column(self) -> Optional[int]:
+        self._resolve_position()
+        return self._column
+
+    @column.setter
+    def column(self, value: Optional[int]):
+        self._column = value
+
     def __repr__(self):
         return f"{self.__class__.__name__}()"
 
 class ProgramNode(ASTNode):
 
     def __init__(self, name: str, declarations: 'DeclarationPartNode', 
-                 body: 'CompoundStatementNode', line: Optional[int] = None):
+                 body: 'CompoundStatementNode', line: Optional[int] = None,
+                 key: Optional[str] = None):
         super().__init__(line)
         self.name = name
+        self.key = fold_name(name) if key is None else key
         self.declarations = declarations
         self.body = body
 
@@ -42,9 +72,11 @@ class DeclarationPartNode(ASTNode):
 
 class ConstDeclNode(ASTNode):
 
-    def __init__(self, name: str, value: Any, line: Optional[int] = None):
+    def __init__(self, name: str, value: Any, line: Optional[int] = None,
+                 key: Optional[str] = None):
         super().__init__(line)
         self.name = name
+        self.key = fold_name(name) if key is None else key
         self.value = value  
 
     def __repr__(self):
@@ -52,9 +84,11 @@ class ConstDeclNode(ASTNode):
 
 class TypeDeclNode(ASTNode):
 
-    def __init__(self, name: str, type_spec: 'TypeSpecNode', line: Optional[int] = None):
+    def __init__(self, name: str, type_spec: 'TypeSpecNode', line: Optional[int] = None,
+                 key: Optional[str] = None):
         super().__init__(line)
         self.name = name
+        self.key = fold_name(name) if key is None else key
         self.type_spec = type_spec
 
     def __repr__(self):
@@ -62,9 +96,11 @@ class TypeDeclNode(ASTNode):
 
 class VarDeclNode(ASTNode):
 
-    def __init__(self, names: List[str], type_spec: 'TypeSpecNode', line: Optional[int] = None):
+    def __init__(self, names: List[str], type_spec: 'TypeSpecNode', line: Optional[int] = None,
+                 keys: Optional[List[str]] = None):
         super().__init__(line)
         self.names = names  
+        self.keys = [fold_name(name) for name in names] if keys is None else keys
         self.type_spec = type_spec
 
     def __repr__(self):
@@ -75,9 +111,11 @@ class ProcedureDeclNode(ASTNode):
     def __init__(self, name: str, params: List['ParamNode'] = None,
                  declarations: 'DeclarationPartNode' = None,
                  body: 'CompoundStatementNode' = None,
-                 line: Optional[int] = None):
+                 line: Optional[int] = None,
+                 key: Optional[str] = None):
         super().__init__(line)
         self.name = name
+        self.key = fold_name(name) if key is None else key
         self.params = params or []
         self.declarations = declarations
         self.body = body
@@ -91,9 +129,11 @@ class FunctionDeclNode(ASTNode):
                  return_type: 'TypeSpecNode' = None,
                  declarations: 'DeclarationPartNode' = None,
                  body: 'CompoundStatementNode' = None,
-                 line: Optional[int] = None):
+                 line: Optional[int] = None,
+                 key: Optional[str] = None):
         super().__init__(line)
         self.name = name
+        self.key = fold_name(name) if key is None else key
         self.params = params or []
         self.return_type = return_type
         self.declarations = declarations
@@ -104,9 +144,11 @@ class FunctionDeclNode(ASTNode):
 
 class ParamNode(ASTNode):
 
-    def __init__(self, names: List[str], type_spec: 'TypeSpecNode', line: Optional[int] = None):
+    def __init__(self, names: List[str], type_spec: 'TypeSpecNode', line: Optional[int] = None,
+                 keys: Optional[List[str]] = None):
         super().__init__(line)
         self.names = names
+        self.keys = [fold_name(name) for name in names] if keys is None else keys
         self.type_spec = type_spec
 
     def __repr__(self):
@@ -137,9 +179,11 @@ class ArrayTypeNode(TypeSpecNode):
 
 class CustomTypeNode(TypeSpecNode):
 
-    def __init__(self, type_name: str, line: Optional[int] = None):
+    def __init__(self, type_name: str, line: Optional[int] = None,
+                 key: Optional[str] = None):
         super().__init__(line)
         self.type_name = type_name
+        self.key = fold_name(type_name) if key is None else key
 
     def __repr__(self):
         return f"CustomTypeNode(type='{self.type_name}')"
@@ -213,9 +257,11 @@ class ForStatementNode(StatementNode):
 
     def __init__(self, var_name: str, start: 'ExpressionNode', 
                  end: 'ExpressionNode', body: StatementNode,
-                 is_downto: bool = False, line: Optional[int] = None):
+                 is_downto: bool = False, line: Optional[int] = None,
+                 key: Optional[str] = None):
         super().__init__(line)
         self.var_name = var_name
+        self.key = fold_name(var_name) if key is None else key
         self.start = start
         self.end = end
         self.body = body
@@ -237,9 +283,11 @@ class RepeatStatementNode(StatementNode):
 
 class ProcedureCallNode(StatementNode):
 
-    def __init__(self, name: str, args: List['ExpressionNode'] = None, line: Optional[int] = None):
+    def __init__(self, name: str, args: List['ExpressionNode'] = None, line: Optional[int] = None,
+                 key: Optional[str] = None):
         super().__init__(line)
         self.name = name
+        self.key = fold_name(name) if key is None else key
         self.args = args or []
 
     def __repr__(self):
@@ -277,18 +325,22 @@ class UnaryOpNode(ExpressionNode):
 
 class VarNode(ExpressionNode):
 
-    def __init__(self, name: str, line: Optional[int] = None):
+    def __init__(self, name: str, line: Optional[int] = None,
+                 key: Optional[str] = None):
         super().__init__(line)
         self.name = name
+        self.key = fold_name(name) if key is None else key
 
     def __repr__(self):
         return f"VarNode(name='{self.name}')"
 
 class ArrayAccessNode(ExpressionNode):
 
-    def __init__(self, array_name: str, index: ExpressionNode, line: Optional[int] = None):
+    def __init__(self, array_name: str, index: ExpressionNode, line: Optional[int] = None,
+                 key: Optional[str] = None):
         super().__init__(line)
         self.array_name = array_name
+        self.key = fold_name(array_name) if key is None else key
         self.index = index
 
     def __repr__(self):
@@ -296,9 +348,11 @@ class ArrayAccessNode(ExpressionNode):
 
 class FunctionCallNode(ExpressionNode):
 
-    def __init__(self, name: str, args: List[ExpressionNode] = None, line: Optional[int] = None):
+    def __init__(self, name: str, args: List[ExpressionNode] = None, line: Optional[int] = None,
+                 key: Optional[str] = None):
         super().__init__(line)
         self.name = name
+        self.key = fold_name(name) if key is None else key
         self.args = args or []
 
     def __repr__(self):
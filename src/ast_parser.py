@@ -0,0 +1,476 @@
+# parser yang langsung bikin AST (ast_nodes) tanpa parse tree di tengah
+# grammar, urutan cek token, dan pesan error-nya sama persis kayak Parser (method
+# match/expect/error diwarisin), bedanya tiap fungsi parse_* langsung return node AST
+# hasilnya sama kayak ASTBuilder().build(Parser(tokens).parse()), termasuk token awal
+# tiap node (buat line/column), cuma gak ada parse tree yang dibikin terus dibuang
+#
+# dipake kalo yang dibutuhin cuma semantic analysis, buat nge-print parse tree tetep pake Parser
+#
+# ekspresi di-parse pake precedence climbing (satu fungsi + tabel operator), bukan rantai
+# expression -> simple-expression -> term -> factor, jadi literal tunggal cukup 2 call
+
+from typing import List, Optional, Union
+
+from ast_nodes import *
+from parser import Parser, Token
+
+# level precedence operator biner, makin gede makin kuat ngiketnya
+RELATIONAL, ADDITIVE, MULTIPLICATIVE = 1, 2, 3
+
+# token type -> {value lowercase -> precedence}, value None = semua value token type itu
+BINARY_OPERATORS = {
+    "RELATIONAL_OPERATOR": {None: RELATIONAL},
+    "ARITHMETIC_OPERATOR": {"+": ADDITIVE, "-": ADDITIVE, "*": MULTIPLICATIVE, "/": MULTIPLICATIVE,
+                            "bagi": MULTIPLICATIVE, "mod": MULTIPLICATIVE},
+    "LOGICAL_OPERATOR": {"atau": ADDITIVE, "dan": MULTIPLICATIVE},
+}
+
+class ASTParser(Parser):
+    # compress/lazy/recover Parser cuma ngaruh ke bentuk parse tree, ASTParser gak punya
+    # mode itu, jadi argumennya gak diterima (daripada diem-diem diabaikan)
+    def __init__(self, tokens, start: int = 0, position: Optional[int] = None):
+        super().__init__(tokens, start=start, position=position)
+
+    def parse(self) -> ProgramNode:
+        return self.parse_program()
+
+    def locate(self, ast_node: ASTNode, token: Optional[Token]) -> ASTNode:
+        ast_node.token = token
+        return ast_node
+
+    # grammar: <program> ::= <program-header> <declaration-part> <compound-statement> .
+    def parse_program(self) -> ProgramNode:
+        program_token = self.expect("KEYWORD", "program")
+        name_token = self.expect("IDENTIFIER")
+        self.expect("SEMICOLON")
+        declarations = self.parse_declaration_part()
+        body = self.parse_compound_statement()
+        self.expect("DOT")
+        return self.locate(ProgramNode(name=name_token.value, declarations=declarations, body=body,
+                                       key=name_token.name), program_token)
+
+    def parse_declaration_part(self) -> DeclarationPartNode:
+        # token awal-nya None kalo gak ada deklarasi sama sekali (kayak parse tree kosong)
+        start_token = self.current_token
+        const_decls = []
+        type_decls = []
+        var_decls = []
+        subprogram_decls = []
+
+        while self.match("KEYWORD", "konstanta"):
+            const_decls.extend(self.parse_const_declaration())
+
+        while self.match("KEYWORD", "tipe"):
+            type_decls.extend(self.parse_type_declaration())
+
+        while self.match("KEYWORD", "variabel"):
+            var_decls.extend(self.parse_var_declaration())
+
+        while self.match("KEYWORD", "prosedur") or self.match("KEYWORD", "fungsi"):
+            subprogram_decls.append(self.parse_subprogram_declaration())
+
+        empty = not (const_decls or type_decls or var_decls or subprogram_decls)
+        return self.locate(DeclarationPartNode(
+            const_decls=const_decls,
+            type_decls=type_decls,
+            var_decls=var_decls,
+            subprogram_decls=subprogram_decls
+        ), None if empty else start_token)
+
+    def parse_const_declaration(self) -> List[ConstDeclNode]:
+        const_nodes = []
+        self.expect("KEYWORD", "konstanta")
+
+        while True:
+            name_token = self.expect("IDENTIFIER")
+            self.expect("RELATIONAL_OPERATOR", "=")
+
+            # value bisa number (plus tanda + atau -), char, string, atau identifier lain
+            if self.match("ARITHMETIC_OPERATOR", "-") or self.match("ADDITIVE_OPERATOR", "-"):
+                self.advance()
+                if self.match("NUMBER"):
+                    value = self.parse_number("-" + self.current_token.value)
+                    self.advance()
+                else:
+                    self.error("Expected number after minus sign")
+            elif self.match("ARITHMETIC_OPERATOR", "+") or self.match("ADDITIVE_OPERATOR", "+"):
+                self.advance()
+                if self.match("NUMBER"):
+                    value = self.parse_number(self.current_token.value)
+                    self.advance()
+                else:
+                    self.error("Expected number after plus sign")
+            elif self.match("NUMBER"):
+                value = self.parse_number(self.expect("NUMBER").value)
+            elif self.match("CHAR_LITERAL"):
+                value = self.expect("CHAR_LITERAL").value
+            elif self.match("STRING_LITERAL"):
+                value = self.string_value(self.expect("STRING_LITERAL").value)
+            elif self.match("IDENTIFIER"):
+                value = self.expect("IDENTIFIER").value
+            else:
+                self.error("Expected constant value")
+
+            self.expect("SEMICOLON")
+            const_nodes.append(self.locate(ConstDeclNode(name=name_token.value, value=value, key=name_token.name), name_token))
+
+            if not self.match("IDENTIFIER"):
+                break
+
+        return const_nodes
+
+    def parse_type_declaration(self) -> List[TypeDeclNode]:
+        type_nodes = []
+        self.expect("KEYWORD", "tipe")
+
+        while True:
+            name_token = self.expect("IDENTIFIER")
+            self.expect("RELATIONAL_OPERATOR", "=")
+            type_spec = self.parse_type()
+            self.expect("SEMICOLON")
+            type_nodes.append(self.locate(TypeDeclNode(name=name_token.value, type_spec=type_spec, key=name_token.name), name_token))
+
+            if not self.match("IDENTIFIER"):
+                break
+
+        return type_nodes
+
+    def parse_var_declaration(self) -> List[VarDeclNode]:
+        var_nodes = []
+        self.expect("KEYWORD", "variabel")
+
+        while True:
+            first_token = self.current_token
+            names = self.parse_identifier_list()
+            self.expect("COLON")
+            type_spec = self.parse_type()
+            self.expect("SEMICOLON")
+            var_nodes.append(self.locate(VarDeclNode(names=[token.value for token in names], type_spec=type_spec,
+                                                     keys=[token.name for token in names]), first_token))
+
+            if not self.match("IDENTIFIER"):
+                break
+
+        return var_nodes
+
+    # balikin token-nya (bukan cuma value) biar pemanggil bisa ambil value sama name-nya
+    def parse_identifier_list(self) -> List[Token]:
+        identifiers = [self.expect("IDENTIFIER")]
+
+        while self.match("COMMA"):
+            self.expect("COMMA")
+            identifiers.append(self.expect("IDENTIFIER"))
+
+        return identifiers
+
+    def parse_type(self) -> TypeSpecNode:
+        if self.match("KEYWORD", "larik"):
+            return self.parse_array_type()
+        elif self.match("KEYWORD"):
+            if self.current_token.name in ["integer", "real", "boolean", "char", "string"]:
+                token = self.current_token
+                self.advance()
+                return self.locate(PrimitiveTypeNode(type_name=token.name), token)
+            else:
+                self.error("Expected type keyword")
+        elif self.match("IDENTIFIER"):
+            token = self.expect("IDENTIFIER")
+            return self.locate(CustomTypeNode(type_name=token.value, key=token.name), token)
+        elif self.match("NUMBER") or self.match("CHAR_LITERAL"):
+            range_node = self.parse_range()
+            return self.locate(RangeTypeNode(range_spec=range_node), range_node.token)
+        else:
+            self.error("Expected type")
+
+    def parse_array_type(self) -> ArrayTypeNode:
+        larik_token = self.expect("KEYWORD", "larik")
+        self.expect("LBRACKET")
+        index_range = self.parse_range()
+        self.expect("RBRACKET")
+        self.expect("KEYWORD", "dari")
+        element_type = self.parse_type()
+        return self.locate(ArrayTypeNode(index_range=index_range, element_type=element_type), larik_token)
+
+    def parse_range(self) -> RangeNode:
+        # token awal range = token pertama ekspresi start (bisa "(" atau tanda -)
+        start_token = self.current_token
+        start = self.parse_expression()
+        self.expect("RANGE_OPERATOR")
+        end = self.parse_expression()
+        return self.locate(RangeNode(start=start, end=end), start_token)
+
+    def parse_procedure_declaration(self) -> ProcedureDeclNode:
+        self.expect("KEYWORD", "prosedur")
+        name_token = self.expect("IDENTIFIER")
+
+        params = []
+        if self.match("LPARENTHESIS"):
+            params = self.parse_formal_parameter_list()
+
+        self.expect("SEMICOLON")
+        declarations, body = self.parse_block()
+        self.expect("SEMICOLON")
+        return self.locate(ProcedureDeclNode(name=name_token.value, params=params,
+                                             declarations=declarations, body=body, key=name_token.name), name_token)
+
+    def parse_function_declaration(self) -> FunctionDeclNode:
+        self.expect("KEYWORD", "fungsi")
+        name_token = self.expect("IDENTIFIER")
+
+        params = []
+        if self.match("LPARENTHESIS"):
+            params = self.parse_formal_parameter_list()
+
+        self.expect("COLON")
+        return_type = self.parse_type()
+        self.expect("SEMICOLON")
+        declarations, body = self.parse_block()
+        self.expect("SEMICOLON")
+        return self.locate(FunctionDeclNode(name=name_token.value, params=params, return_type=return_type,
+                                            declarations=declarations, body=body, key=name_token.name), name_token)
+
+    def parse_formal_parameter_list(self) -> List[ParamNode]:
+        self.expect("LPARENTHESIS")
+        params = [self.parse_parameter_group()]
+
+        while self.match("SEMICOLON"):
+            self.expect("SEMICOLON")
+            params.append(self.parse_parameter_group())
+
+        self.expect("RPARENTHESIS")
+        return params
+
+    def parse_parameter_group(self) -> ParamNode:
+        first_token = self.current_token
+        names = self.parse_identifier_list()
+        self.expect("COLON")
+        type_spec = self.parse_type()
+        return self.locate(ParamNode(names=[token.value for token in names], type_spec=type_spec,
+                                     keys=[token.name for token in names]), first_token)
+
+    def parse_block(self):
+        # return (declarations, body), block gak punya node AST sendiri
+        return self.parse_declaration_part(), self.parse_compound_statement()
+
+    def parse_compound_statement(self) -> CompoundStatementNode:
+        mulai_token = self.expect("KEYWORD", "mulai")
+        statements = self.parse_statement_list()
+        self.expect("KEYWORD", "selesai")
+        return self.locate(CompoundStatementNode(statements=statements), mulai_token)
+
+    def parse_statement_list(self) -> List[StatementNode]:
+        # empty statement gak dimasukin ke list (sama kayak ASTBuilder)
+        statements = []
+        statement = self.parse_statement()
+        if not isinstance(statement, EmptyStatementNode):
+            statements.append(statement)
+
+        while self.match("SEMICOLON"):
+            self.expect("SEMICOLON")
+            if not self.match("KEYWORD", "selesai") and not self.match("KEYWORD", "sampai"):
+                statement = self.parse_statement()
+                if not isinstance(statement, EmptyStatementNode):
+                    statements.append(statement)
+            else:
+                break
+
+        if not self.match("KEYWORD", "selesai") and not self.match("KEYWORD", "sampai") and not self.match("SEMICOLON"):
+            self.error(f"Expected SEMICOLON(;) or KEYWORD(selesai/sampai), but got {self.current_token}")
+
+        return statements
+
+    def parse_statement(self) -> StatementNode:
+        if self.match("KEYWORD", "mulai"):
+            return self.parse_compound_statement()
+        elif self.match("KEYWORD", "jika"):
+            return self.parse_if_statement()
+        elif self.match("KEYWORD", "selama"):
+            return self.parse_while_statement()
+        elif self.match("KEYWORD", "untuk"):
+            return self.parse_for_statement()
+        elif self.match("KEYWORD", "ulangi"):
+            return self.parse_repeat_statement()
+        elif self.match("IDENTIFIER"):
+            peek = self.peek(1)
+            if peek and (peek.type == "ASSIGN_OPERATOR" or peek.type == "LBRACKET"):
+                return self.parse_assignment_statement()
+            else:
+                return self.parse_procedure_call()
+        else:
+            return EmptyStatementNode()
+
+    def parse_assignment_statement(self) -> AssignmentNode:
+        name_token = self.expect("IDENTIFIER")
+
+        if self.match("LBRACKET"):
+            self.expect("LBRACKET")
+            index = self.parse_expression()
+            self.expect("RBRACKET")
+            target = self.locate(ArrayAccessNode(array_name=name_token.value, index=index, key=name_token.name), name_token)
+        else:
+            target = self.locate(VarNode(name=name_token.value, key=name_token.name), name_token)
+
+        self.expect("ASSIGN_OPERATOR")
+        value = self.parse_expression()
+        return self.locate(AssignmentNode(target=target, value=value), name_token)
+
+    def parse_if_statement(self) -> IfStatementNode:
+        jika_token = self.expect("KEYWORD", "jika")
+        condition = self.parse_expression()
+        self.expect("KEYWORD", "maka")
+        then_stmt = self.parse_statement()
+
+        else_stmt = None
+        if self.match("KEYWORD", "selain-itu"):
+            self.expect("KEYWORD", "selain-itu")
+            else_stmt = self.parse_statement()
+
+        return self.locate(IfStatementNode(condition=condition, then_stmt=then_stmt, else_stmt=else_stmt), jika_token)
+
+    def parse_while_statement(self) -> WhileStatementNode:
+        selama_token = self.expect("KEYWORD", "selama")
+        condition = self.parse_expression()
+        self.expect("KEYWORD", "lakukan")
+        body = self.parse_statement()
+        return self.locate(WhileStatementNode(condition=condition, body=body), selama_token)
+
+    def parse_for_statement(self) -> ForStatementNode:
+        untuk_token = self.expect("KEYWORD", "untuk")
+        var_token = self.expect("IDENTIFIER")
+        self.expect("ASSIGN_OPERATOR")
+        start = self.parse_expression()
+
+        if self.match("KEYWORD", "ke"):
+            direction_token = self.expect("KEYWORD", "ke")
+        elif self.match("KEYWORD", "turun-ke"):
+            direction_token = self.expect("KEYWORD", "turun-ke")
+        else:
+            self.error("Expected 'ke' or 'turun-ke'")
+
+        end = self.parse_expression()
+        self.expect("KEYWORD", "lakukan")
+        body = self.parse_statement()
+        return self.locate(ForStatementNode(var_name=var_token.value, start=start, end=end, body=body, key=var_token.name,
+                                            is_downto=direction_token.name == "turun-ke"), untuk_token)
+
+    def parse_repeat_statement(self) -> RepeatStatementNode:
+        ulangi_token = self.expect("KEYWORD", "ulangi")
+        body = self.parse_statement_list()
+        self.expect("KEYWORD", "sampai")
+        condition = self.parse_expression()
+        return self.locate(RepeatStatementNode(body=body, condition=condition), ulangi_token)
+
+    def parse_procedure_call(self) -> ProcedureCallNode:
+        name_token = self.expect("IDENTIFIER")
+        self.expect("LPARENTHESIS")
+        args = []
+        if not self.match("RPARENTHESIS"):
+            args = self.parse_parameter_list()
+        self.expect("RPARENTHESIS")
+        return self.locate(ProcedureCallNode(name=name_token.value, args=args, key=name_token.name), name_token)
+
+    def parse_parameter_list(self) -> List[ExpressionNode]:
+        args = [self.parse_expression()]
+
+        while self.match("COMMA"):
+            self.expect("COMMA")
+            args.append(self.parse_expression())
+
+        return args
+
+    def binary_precedence(self, token: Optional[Token]) -> int:
+        # precedence token kalo operator biner, 0 kalo bukan
+        operators = BINARY_OPERATORS.get(token.type) if token is not None else None
+        if operators is None:
+            return 0
+        if None in operators:
+            return operators[None]
+        return operators.get(token.name, 0)
+
+    def parse_expression(self, min_precedence: int = RELATIONAL) -> ExpressionNode:
+        # precedence climbing: operator dengan precedence >= min_precedence diambil di sini,
+        # operand kanannya di-parse dengan min_precedence = precedence operator + 1 (asosiatif kiri)
+        # tanda + atau - di depan cuma boleh di awal simple expression dan nempel ke term pertama
+        token = self.current_token
+        if (min_precedence <= ADDITIVE and token is not None and token.type == "ARITHMETIC_OPERATOR"
+                and token.value in ["+", "-"]):
+            self.advance()
+            left = self.locate(UnaryOpNode(operator=token.value, operand=self.parse_expression(MULTIPLICATIVE)), token)
+        else:
+            left = self.parse_factor()
+
+        while True:
+            operator = self.current_token
+            precedence = self.binary_precedence(operator)
+            if precedence < min_precedence:
+                return left
+            self.advance()
+            right = self.parse_expression(precedence + 1)
+            left = self.locate(BinOpNode(operator=operator.value, left=left, right=right), operator)
+            if precedence == RELATIONAL:
+                # relational operator gak bisa dirantai (a < b < c itu syntax error)
+                return left
+
+    def parse_simple_expression(self) -> ExpressionNode:
+        return self.parse_expression(ADDITIVE)
+
+    def parse_term(self) -> ExpressionNode:
+        return self.parse_expression(MULTIPLICATIVE)
+
+    def parse_factor(self) -> ExpressionNode:
+        # cabangnya dipilih dari type token sekali baca, bukan match() berkali-kali
+        token = self.current_token
+        token_type = token.type if token is not None else None
+        if token_type == "IDENTIFIER":
+            peek = self.peek(1)
+            if peek and peek.type == "LPARENTHESIS":
+                return self.parse_function_call()
+            self.advance()
+            if peek and peek.type == "LBRACKET":
+                self.advance()
+                index = self.parse_expression()
+                self.expect("RBRACKET")
+                return self.locate(ArrayAccessNode(array_name=token.value, index=index, key=token.name), token)
+            return self.locate(VarNode(name=token.value, key=token.name), token)
+        elif token_type == "NUMBER":
+            self.advance()
+            return self.locate(NumberLiteralNode(value=self.parse_number(token.value)), token)
+        elif token_type == "CHAR_LITERAL":
+            self.advance()
+            return self.locate(CharLiteralNode(value=token.value), token)
+        elif token_type == "STRING_LITERAL":
+            self.advance()
+            return self.locate(StringLiteralNode(value=self.string_value(token.value)), token)
+        elif token_type == "LPARENTHESIS":
+            # ekspresi dalam kurung gak punya node sendiri
+            self.advance()
+            expression = self.parse_expression()
+            self.expect("RPARENTHESIS")
+            return expression
+        elif token_type == "LOGICAL_OPERATOR" and token.name == "tidak":
+            self.advance()
+            return self.locate(UnaryOpNode(operator="tidak", operand=self.parse_factor()), token)
+        else:
+            self.error(f"Unexpected token in factor: {self.current_token}")
+
+    def parse_function_call(self) -> FunctionCallNode:
+        name_token = self.expect("IDENTIFIER")
+        self.expect("LPARENTHESIS")
+        args = []
+        if not self.match("RPARENTHESIS"):
+            args = self.parse_parameter_list()
+        self.expect("RPARENTHESIS")
+        return self.locate(FunctionCallNode(name=name_token.value, args=args, key=name_token.name), name_token)
+
+    def string_value(self, value: str) -> str:
+        # buang kutip string literal
+        return value[1:-1] if len(value) >= 2 else value
+
+    def parse_number(self, value: str) -> Union[int, float]:
+        try:
+            if '.' in value:
+                return float(value)
+            else:
+                return int(value)
+        except ValueError:
+            return value
@@ -839,8 +839,8 @@ if __name__ == "__main__":
     
     
     from lexer import tokenize_from_text
-    from parser import Parser
-    from ast_builder import ASTBuilder
+    from ast_parser import ASTParser
+    from parser import ParseError
     from semantic_analyzer import SemanticVisitor
     
     def run_test(input_file: str, output_file: str):
@@ -872,22 +872,20 @@ if __name__ == "__main__":
             return
         
         
+        # AST langsung dari parser, parse tree-nya gak dibutuhin di sini. error sintaks tetep
+        # dilaporin sebagai Parser Error, error lain pas bikin node-nya sebagai AST Builder Error
         try:
-            parser = Parser(tokens)
-            parse_tree = parser.parse()
-            print(f"  ✓ Parsing successful")
-        except Exception as e:
+            parser = ASTParser(tokens)
+            ast = parser.parse()
+        except ParseError as e:
             print(f"  ✗ Parser Error: {e}")
             return
-        
-        
-        try:
-            builder = ASTBuilder()
-            ast = builder.build(parse_tree)
-            print(f"  ✓ AST construction successful")
         except Exception as e:
+            print(f"  ✓ Parsing successful")
             print(f"  ✗ AST Builder Error: {e}")
             return
+        print(f"  ✓ Parsing successful")
+        print(f"  ✓ AST construction successful")
         
         
         try:
@@ -958,7 +956,7 @@ if __name__ == "__main__":
                     if i < st.RESERVED_COUNT:
                         lines.append(f"{i:<5}{entry.id:<20}(reserved word)")
                     
-                    elif entry.id.lower() in st.RESERVED_WORDS:
+                    elif entry.name in st.RESERVED_WORDS:
                         lines.append(f"{i:<5}{entry.id:<20}{obj_str:<12}... (predefined)")
                     else:
                         
@@ -1,25 +1,47 @@
 import sys
 import os
 from lexer import tokenize_from_file
-from parser import Parser
+from event_tree import parse_events
 from tree_printer import print_tree, tree_to_string
+from token_stream import TokenStream, kind_id
+from token_file import load_token_file
 
 def parse_token_file(token_file):
-    tokens = []
+    # baca file token (satu token per baris, format TYPE(value)) jadi TokenStream
+    # value-nya langsung nunjuk ke isi file, gak di-copy per token
     with open(token_file, 'rb') as f:
         first_bytes = f.read(2)
 
     encoding = 'utf-16-le' if first_bytes == b'\xff\xfe' else 'utf-8'
 
     with open(token_file, 'r', encoding=encoding) as f:
-        for line in f:
-            line = line.strip().lstrip('\ufeff')  # remove BOM kalau ad
-            if not line:
-                continue
-            if '(' in line and ')' in line:
-                token_type = line.split('(')[0]
-                value = line.split('(')[1].rstrip(')')
-                tokens.append((token_type, value))
+        content = f.read()
+
+    tokens = TokenStream(content)
+    line_start = 0
+    n = len(content)
+    while line_start < n:
+        line_end = content.find('\n', line_start)
+        if line_end < 0:
+            line_end = n
+        line = content[line_start:line_end]
+        next_line = line_end + 1
+
+        # posisi baris setelah strip whitespace dan BOM
+        stripped = line.strip()
+        no_bom = stripped.lstrip('\ufeff')  # remove BOM kalau ad
+        offset = line_start + (len(line) - len(line.lstrip())) + (len(stripped) - len(no_bom))
+        if no_bom and '(' in no_bom and ')' in no_bom:
+            open_idx = no_bom.index('(')
+            token_type = no_bom[:open_idx]
+            # value = bagian sampai '(' berikutnya, tanpa ')' di belakang
+            value_end = no_bom.find('(', open_idx + 1)
+            if value_end < 0:
+                value_end = len(no_bom)
+            while value_end > open_idx + 1 and no_bom[value_end - 1] == ')':
+                value_end -= 1
+            tokens.append(kind_id(token_type), offset + open_idx + 1, offset + value_end)
+        line_start = next_line
     return tokens
 
 def get_output_path(source_file):
@@ -38,29 +60,42 @@ def get_output_path(source_file):
     return os.path.join(source_dir, f"output{file_name}.txt")
 
 def main():
-    if len(sys.argv) != 2:
-        print("Usage: python3 compiler.py <source_file.pas|tokens.txt>")
+    args = sys.argv[1:]
+    # --recover: semua error sintaks dilaporin sekaligus, bukan cuma yang pertama
+    recover = "--recover" in args
+    if recover:
+        args.remove("--recover")
+    if len(args) != 1:
+        print("Usage: python3 compiler.py [--recover] <source_file.pas|tokens.txt|tokens.ptk>")
         sys.exit(1)
 
-    source_file = sys.argv[1]
+    source_file = args[0]
     file_ext = os.path.splitext(source_file)[1]
     dfa_rules = "rules/dfa_rules_final.json"
 
     try:
         if file_ext == '.txt':
             tokens = parse_token_file(source_file)
+        elif file_ext == '.ptk':
+            tokens = load_token_file(source_file)
         elif file_ext == '.pas':
             tokens = tokenize_from_file(dfa_rules, source_file)
         else:
-            print(f"Error: Unsupported file format '{file_ext}'. Use .pas or .txt")
+            print(f"Error: Unsupported file format '{file_ext}'. Use .pas, .txt or .ptk")
             sys.exit(1)
 
         if not tokens:
             print("Lexical analysis failed")
             sys.exit(1)
 
-        parser = Parser(tokens)
-        parse_tree = parser.parse()
+        # parse tree-nya cuma buat di-print, jadi disimpen sebagai array event aja (gak ada object
+        # node), print-nya langsung dari event (output tetep sama). nesting yang kedalaman buat
+        # recursive descent di-parse driver LL(1)
+        parse_tree = parse_events(tokens, recover=recover)
+        if parse_tree.errors:
+            for error in parse_tree.errors:
+                print(f"Error: {error}")
+            sys.exit(1)
 
         # print ke terminal
         print_tree(parse_tree, is_root=True)
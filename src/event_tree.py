@@ -0,0 +1,251 @@
+# parse tree dalam bentuk event flat (kayak event parser rust-analyzer): satu array integer
+# isinya urutan event start node, token, finish node (preorder), 4 byte per event
+# - kode event: token = index token * 2 (+ 1 buat NUMBER negatif hasil gabungan minus + angka,
+#   index-nya index minus), finish = -1, start = -(kind + 2)
+# - EventParser: Parser yang make_node-nya gak bikin object node, cuma nyatet kind + kode
+#   anak-anaknya di tabel flat. abis parsing, tabelnya diurutin jadi event pake stack (gak rekursif)
+# - EventTree: array event + token-nya. tree view (EventNode, bisa dipake kayak ParseNode) baru
+#   dibikin pas diakses, tree_printer.tree_to_string nge-render langsung dari event-nya tanpa
+#   rekursi. array event-nya bisa langsung disimpen (tobytes) terus di-load lagi (frombytes)
+# - LL1EventParser: sama, tapi parsing-nya pake driver LL1Parser (stack eksplisit), jadi input
+#   yang nesting-nya lebih dalem dari recursion limit Python tetep bisa jadi EventTree.
+#   parse_events pake EventParser dulu, kalo kena RecursionError baru pindah ke LL1EventParser
+#   (tanpa mode recover, error pertama dilempar dengan keterangan kalo recover-nya gak jalan)
+#
+# cara pake (dari root folder):
+#   python3 src/event_tree.py rules/dfa_rules_final.json <source_file.pas>
+
+import os
+import sys
+from array import array
+from itertools import repeat
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from ll1 import GRAMMAR_PATH, LL1Parser, load_compiled_grammar
+from parser import TOKEN_BATCH, ParseError, ParseNode, Parser, Token
+from token_stream import TokenStream
+
+FINISH = -1
+
+class _EventToken(Token):
+    # Token plus kode event-nya
+    __slots__ = ("code",)
+
+    def __init__(self, token_type, value, offset, source_map, code, word=None, name=None):
+        Token.__init__(self, token_type, value, offset, source_map, word, name)
+        self.code = code
+
+class EventParser(Parser):
+    def __init__(self, tokens, recover=False):
+        # tokens: TokenStream atau list/tuple of tuple, token-nya diakses lagi per index
+        if not isinstance(tokens, (TokenStream, list, tuple)):
+            raise ValueError("EventParser needs indexable tokens (TokenStream, list or tuple)")
+        # tabel node: kind, posisi kode anak pertama di refs. kode anak = kode event token,
+        # atau -(nomor node + 2) buat node. kode anak satu node selalu berurutan di refs
+        self.node_kinds = array("h")
+        self.node_first = array("i")
+        self.refs = array("i")
+        Parser.__init__(self, tokens, recover=recover)
+        self.make_node = self.add_node
+
+    def _iter_tokens(self, tokens, start=0):
+        source_map = self.source_map
+        if isinstance(tokens, TokenStream):
+            for first in range(start, len(tokens), TOKEN_BATCH):
+                last = min(first + TOKEN_BATCH, len(tokens))
+                yield from map(_EventToken, tokens.types(first, last), tokens.values(first, last),
+                               tokens.offsets(first, last), repeat(source_map), range(first * 2, last * 2, 2),
+                               tokens.words(first, last), tokens.names(first, last))
+            return
+        for i in range(start, len(tokens)):
+            t = tokens[i]
+            yield _EventToken(t[0], t[1], t[2] if len(t) > 2 else None, source_map, i * 2)
+
+    def negative_number(self, minus_token, number_token):
+        return _EventToken("NUMBER", "-" + number_token.value, minus_token.offset, minus_token.source_map,
+                           minus_token.code + 1)
+
+    def add_node(self, kind, children):
+        # make_node versi event: return nomor node di tabel
+        codes = []
+        for child in children:
+            if type(child) is int:
+                codes.append(-child - 2)
+            elif isinstance(child, ParseNode):
+                # ErrorNode dari mode recover, anaknya token semua
+                codes.append(-self.add_node(child.kind, child.children) - 2)
+            else:
+                codes.append(child.code)
+        node = len(self.node_kinds)
+        self.node_kinds.append(kind)
+        self.node_first.append(len(self.refs))
+        self.refs.extend(codes)
+        return node
+
+    def parse(self):
+        root = super().parse()
+        return EventTree(self.tokens, self._events(root), self.errors)
+
+    def _events(self, root):
+        # tabel node -> event preorder. stack isinya kode anak yang belum dikeluarin, anak
+        # node dimasukin kebalik biar keluarnya urut, finish node-nya di bawah anak-anaknya
+        kinds = self.node_kinds
+        first = self.node_first
+        refs = self.refs
+        first.append(len(refs))
+        events = array("i")
+        emit = events.append
+        stack = [-root - 2]
+        pop = stack.pop
+        push = stack.append
+        extend = stack.extend
+        while stack:
+            code = pop()
+            if code >= FINISH:
+                emit(code)
+            else:
+                node = -code - 2
+                emit(-kinds[node] - 2)
+                push(FINISH)
+                extend(reversed(refs[first[node]:first[node + 1]]))
+        return events
+
+# EventParser dengan driver LL(1): parse() diwarisin dari LL1Parser, make_node/token dari
+# EventParser. gak ada mode recover (driver LL(1) berhenti di error pertama)
+class LL1EventParser(EventParser, LL1Parser):
+    def __init__(self, tokens, grammar_path=GRAMMAR_PATH):
+        EventParser.__init__(self, tokens)
+        self.grammar = load_compiled_grammar(grammar_path)
+
+def parse_events(tokens, recover=False):
+    # EventTree buat tokens. recursive descent lebih cepet, driver LL(1) cuma dipake kalo
+    # nesting-nya kedalaman buat recursive descent
+    try:
+        return EventParser(tokens, recover=recover).parse()
+    except RecursionError:
+        pass
+    # driver LL(1) gak punya mode recover, error sintaks pertama langsung dilempar. kalo
+    # recover diminta, pesan error-nya bilang recovery-nya gak jalan (bukan diem-diem berhenti)
+    try:
+        return LL1EventParser(tokens).parse()
+    except ParseError as error:
+        if not recover:
+            raise
+        raise ParseError(f"{error} (input is nested too deeply for error recovery, only the first "
+                         f"syntax error is reported)", error.position, error.token) from error
+
+class EventTree:
+    def __init__(self, tokens, events, errors=()):
+        self.tokens = tokens
+        self.events = events
+        # ParseError dari mode recover (node-nya <error> di event)
+        self.errors = list(errors)
+        self._ends = None
+        self._fields = None
+
+    @classmethod
+    def frombytes(cls, tokens, data):
+        # kebalikan tobytes, tokens harus token stream yang sama waktu di-parse
+        events = array("i")
+        events.frombytes(data)
+        return cls(tokens, events)
+
+    def tobytes(self):
+        return self.events.tobytes()
+
+    def __len__(self):
+        return len(self.events)
+
+    @property
+    def ends(self):
+        # posisi abis finish tiap event start (token: posisinya + 1), dihitung sekali pas
+        # pertama dibutuhin (tree view / render)
+        if self._ends is None:
+            events = self.events
+            ends = array("i", range(1, len(events) + 1))
+            starts = []
+            for position, code in enumerate(events):
+                if code == FINISH:
+                    ends[starts.pop()] = position + 1
+                elif code < FINISH:
+                    starts.append(position)
+            self._ends = ends
+        return self._ends
+
+    @property
+    def root(self):
+        return EventNode(self, 0)
+
+    def token_fields(self):
+        # ([type], [value]) semua token, dipake buat render
+        if self._fields is None:
+            tokens = self.tokens
+            if isinstance(tokens, TokenStream):
+                self._fields = (tokens.types(0, len(tokens)), tokens.values(0, len(tokens)))
+            else:
+                self._fields = ([t[0] for t in tokens], [t[1] for t in tokens])
+        return self._fields
+
+    def token(self, code):
+        # object Token buat kode event token
+        index = code >> 1
+        tokens = self.tokens
+        source_map = getattr(tokens, "source_map", None)
+        if isinstance(tokens, TokenStream):
+            if code & 1:
+                return Token("NUMBER", "-" + tokens.value(index + 1), tokens.offset(index), source_map)
+            return Token(tokens.type(index), tokens.value(index), tokens.offset(index), source_map)
+        t = tokens[index]
+        offset = t[2] if len(t) > 2 else None
+        if code & 1:
+            return Token("NUMBER", "-" + tokens[index + 1][1], offset, source_map)
+        return Token(t[0], t[1], offset, source_map)
+
+# view satu node di EventTree, bisa dipake kayak ParseNode biasa (tree_printer, ASTBuilder).
+# children baru dibikin pas pertama diakses
+class EventNode(ParseNode):
+    __slots__ = ("tree", "position", "_children")
+
+    def __init__(self, tree, position):
+        self.kind = -tree.events[position] - 2
+        self.tree = tree
+        self.position = position
+        self._children = None
+
+    @property
+    def children(self):
+        if self._children is None:
+            tree = self.tree
+            events = tree.events
+            ends = tree.ends
+            children = []
+            position = self.position + 1
+            end = ends[self.position] - 1
+            while position < end:
+                code = events[position]
+                if code >= 0:
+                    children.append(tree.token(code))
+                    position += 1
+                else:
+                    children.append(EventNode(tree, position))
+                    position = ends[position]
+            self._children = tuple(children)
+        return self._children
+
+if __name__ == "__main__":
+    if len(sys.argv) != 3:
+        print("Usage: python3 event_tree.py <dfa_rules.json> <source_file.pas>")
+        sys.exit(1)
+
+    from lexer import tokenize_from_file
+    from tree_printer import tree_to_string
+
+    tokens = tokenize_from_file(sys.argv[1], sys.argv[2])
+    try:
+        tree = parse_events(tokens)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    print(tree_to_string(tree))
+    print(f"\n{len(tree)} events, {len(tree.tobytes())} bytes")
@@ -0,0 +1,182 @@
+# lexer incremental: abis text-nya diedit, yang di-lex ulang cuma daerah sekitar edit
+# token stream lama diedit di tempat (TokenStream.splice), bukan di-lex ulang dari offset 0
+#
+# - lex ulang mulai dari awal token yang pasti gak kena edit (token selalu di luar comment,
+#   string literal juga satu token utuh, jadi awal token aman buat mulai scan)
+# - berhenti begitu posisi scan sama kayak awal token lama setelah edit dan 2 token terakhirnya
+#   sama (jendela merge compound keyword), sisa token lama tinggal digeser offset-nya
+# - kalo token stream lama/baru berhenti gara-gara error, fallback ke lex ulang semuanya
+#   biar hasilnya tetep sama persis (token yang udah ada gak di-merge pas lexing-nya stop)
+#
+# cara pake (dari root folder):
+#   python3 src/incremental_lexer.py rules/dfa_rules_final.json <source_file.pas> <offset> <removed> <inserted>
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lexer import (
+    ARITHMETIC_OPERATORS, KEYWORDS, LOGICAL_OPERATORS, _lex_text, _reserved_kinds, compile_rules,
+    lexical_analyze, load_engine, read_source_file
+)
+
+# jumlah token berturut-turut yang gak kena edit sebelum titik mulai lex ulang:
+# 2 buat jendela merge compound keyword, plus 1 jaga-jaga lookahead DFA (misal 1e+ atau 1..)
+RESTART_SLACK = 3
+
+class _Resync:
+    # dipake _lex_text: ngecek apa hasil lex ulang udah nyambung lagi sama token stream lama
+    # old: token stream lama (offset-nya offset source lama), fresh: hasil lex ulang
+    def __init__(self, old, first, index, edit_start, edit_end, delta):
+        self.old = old
+        self.first = first
+        self.index = index
+        self.edit_start = edit_start
+        self.edit_end = edit_end
+        self.delta = delta
+        self.stop_index = None
+        self.position = self._new_start(index) if index < len(old) else float("inf")
+
+    def _new_start(self, index):
+        # offset token lama di source baru, None kalo kena daerah yang diedit
+        offset = self.old.offset(index)
+        if offset >= self.edit_end:
+            return offset + self.delta
+        return offset if offset < self.edit_start else None
+
+    def _new_end(self, index):
+        offset = self.old.end(index)
+        if offset <= self.edit_start:
+            return offset
+        return offset + self.delta if offset >= self.edit_end else None
+
+    def same(self, j, fresh, i):
+        # token lama ke-j sama persis kayak token ke-i hasil lex ulang? token lama yang
+        # ngelingkupin daerah edit text-nya udah berubah, jadi gak pernah sama
+        old = self.old
+        if old.offset(j) < self.edit_end and old.end(j) > self.edit_start:
+            return False
+        return (old.kinds[j] == fresh.kinds[i] and self._new_start(j) == fresh.starts[i]
+                and self._new_end(j) == fresh.ends[i] and old.overrides.get(j) == fresh.overrides.get(i))
+
+    def _same_token(self, fresh, k):
+        # token ke-k dari belakang di stream baru (hasil lex ulang, disambung token lama
+        # sebelum first) sama kayak token ke-k sebelum self.index di stream lama?
+        j = self.index - k
+        i = len(fresh) - k
+        if i < 0:
+            # masih token lama sebelum first (atau dua-duanya udah lewat awal stream)
+            i += self.first
+            if i < 0 or j < 0:
+                return i < 0 and j < 0
+            return i == j
+        if j < 0:
+            return False
+        return self.same(j, fresh, i)
+
+    def aligned(self, fresh, pos):
+        old = self.old
+        n = len(old)
+        while self.index < n and self._new_start(self.index) < pos:
+            self.index += 1
+        if self.index == n:
+            self.position = float("inf")
+            return False
+        self.position = self._new_start(self.index)
+        if self.position != pos:
+            return False
+        if self._same_token(fresh, 1) and self._same_token(fresh, 2):
+            self.stop_index = self.index
+            return True
+        self.index += 1
+        self.position = self._new_start(self.index) if self.index < n else float("inf")
+        return False
+
+def _restart_point(tokens, engine, offset):
+    # (index token, posisi) tempat lex ulang dimulai: mundur dari edit sampe ketemu RESTART_SLACK
+    # token berturut-turut yang scan DFA-nya (termasuk lookahead) berhenti sebelum offset,
+    # kalo gak ketemu mulai dari awal text
+    text = tokens.source
+    n = len(text)
+    index = tokens.index_at(offset)
+    safe = 0
+    while index > 0 and safe < RESTART_SLACK:
+        index -= 1
+        _, stop, _, _ = engine.scan(text, tokens.offset(index), n)
+        safe = safe + 1 if stop < offset else 0
+    if safe < RESTART_SLACK:
+        return 0, 0
+    return index, tokens.offset(index)
+
+def relex(tokens, offset, removed, inserted, dfa, keywords=KEYWORDS,
+          logical_operators=LOGICAL_OPERATORS, arithmetic_operators=ARITHMETIC_OPERATORS, report=print):
+    # terapin edit (hapus removed karakter di offset, sisipin inserted) ke source tokens
+    # dan lex ulang seperlunya, tokens diedit di tempat
+    # return (tokens, (first, old_end, new_end)): token [first, old_end) yang lama diganti
+    # token [first, new_end) yang baru, token setelahnya sama (offset-nya aja yang geser).
+    # token di ujung daerah lex ulang yang hasilnya sama persis gak diitung berubah
+    # pesan error cuma keluar buat daerah yang di-lex ulang
+    if tokens.binary:
+        raise ValueError("relex needs a TokenStream lexed from str")
+    engine = compile_rules(dfa) if isinstance(dfa, dict) else dfa
+    reserved = _reserved_kinds(keywords, logical_operators, arithmetic_operators)
+    old_source = tokens.source
+    old_map = tokens.source_map
+    source = old_source[:offset] + inserted + old_source[offset + removed:]
+    delta = len(inserted) - removed
+
+    changed = None
+    if not tokens.stopped:
+        first, restart = _restart_point(tokens, engine, offset)
+        sync = _Resync(tokens, first, tokens.index_at(offset + removed), offset, offset + removed, delta)
+        messages = []
+        fresh, stopped, _ = _lex_text(source, engine, reserved, messages.append, restart, sync)
+        if not stopped:
+            for message in messages:
+                report(message)
+            old_end = len(tokens) if sync.stop_index is None else sync.stop_index
+            changed = _changed_range(sync, first, old_end, fresh)
+            tokens.splice(first, old_end, fresh, delta, source)
+    if changed is None:
+        changed = _relex_all(tokens, source, engine, reserved, report)
+    # Token lama (dari sebelum edit) yang masih nunjuk source map lama tetep dapet posisi yang bener
+    old_map.forward(offset, offset + removed, delta, tokens.source_map)
+    return tokens, changed
+
+def _changed_range(sync, first, old_end, fresh):
+    # persempit [first, old_end) -> [first, first + len(fresh)) jadi cuma token yang beneran
+    # berubah: token di depan (jendela RESTART_SLACK) dan di belakang (token yang dipake buat
+    # nyambung lagi) yang sama persis dibuang dari range
+    n = len(fresh)
+    head = 0
+    while head < n and first + head < old_end and sync.same(first + head, fresh, head):
+        head += 1
+    tail = 0
+    while tail < n - head and old_end - tail - 1 >= first + head and sync.same(old_end - tail - 1, fresh, n - tail - 1):
+        tail += 1
+    return first + head, old_end - tail, first + n - tail
+
+def _relex_all(tokens, source, engine, reserved, report):
+    # fallback: lex ulang semuanya, hasilnya ditaruh ke object tokens yang sama
+    old_len = len(tokens)
+    result, _, _ = _lex_text(source, engine, reserved, report)
+    tokens.splice(0, old_len, result, 0, source)
+    tokens.stopped = result.stopped
+    return 0, old_len, len(tokens)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 6:
+        print("Usage: python3 incremental_lexer.py <dfa_rules.json> <source_file.pas> <offset> <removed> <inserted>")
+        sys.exit(1)
+
+    engine = load_engine(sys.argv[1])
+    text = read_source_file(sys.argv[2])
+    tokens = lexical_analyze(text, engine, KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
+    begin = time.perf_counter()
+    tokens, (first, old_end, new_end) = relex(tokens, int(sys.argv[3]), int(sys.argv[4]), sys.argv[5], engine)
+    elapsed = time.perf_counter() - begin
+    print(f"Relexed in {elapsed * 1000:.2f} ms: tokens [{first}, {old_end}) -> [{first}, {new_end})")
+    for i in range(first, new_end):
+        print(f"{tokens.type(i)}({tokens.value(i)})")
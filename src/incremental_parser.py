@@ -0,0 +1,195 @@
+# parser incremental: abis source-nya diedit, yang di-parse ulang cuma prosedur/fungsi atau
+# blok mulai..selesai terkecil yang ngandung edit, sisa parse tree dipake ulang apa adanya
+#
+# - parse tree disimpen bareng pohon "unit": <program>, <procedure-declaration>,
+#   <function-declaration>, dan <compound-statement>. tiap unit nyatet range token-nya
+#   (start relatif ke unit induk + panjang) dan path index anak dari node unit induknya
+# - token di-lex ulang pake incremental_lexer.relex, range token yang berubah dipake buat nyari
+#   unit terkecil yang token pertama dan terakhirnya gak kena edit
+# - unit itu di-parse ulang mulai dari token pertamanya, hasilnya dipake kalo parsing-nya sukses
+#   dan berhentinya pas di token terakhir unit (batasnya masih valid), kalo gak naik ke unit
+#   induknya, sampe <program> = parse ulang semuanya
+# - node di sepanjang path dari unit ke root dibikin ulang (children tuple), node lain dipake
+#   ulang by reference. offset Token lama gak diubah: source map lama nerusin posisinya ke
+#   source map baru (SourceMap.forward), jadi line/column-nya tetep bener
+#
+# cara pake (dari root folder):
+#   python3 src/incremental_parser.py rules/dfa_rules_final.json <source_file.pas> <offset> <removed> <inserted>
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from incremental_lexer import relex
+from lexer import ARITHMETIC_OPERATORS, KEYWORDS, LOGICAL_OPERATORS, lexical_analyze, load_engine, read_source_file
+from parser import (
+    COMPOUND_STATEMENT, FUNCTION_DECLARATION, NODE_KINDS, PROCEDURE_DECLARATION, PROGRAM,
+    ParseNode, Parser, UnitChainNode, compress_node
+)
+
+UNIT_KINDS = (PROGRAM, PROCEDURE_DECLARATION, FUNCTION_DECLARATION, COMPOUND_STATEMENT)
+
+class _Unit:
+    # node: node di parse tree yang kind paling bawahnya kind unit (di mode compress bisa
+    # UnitChainNode, misal <statement-list> -> <compound-statement>)
+    # start: index token pertama relatif ke start unit induk, length: jumlah token
+    # path: index anak dari node unit induk sampe node ini, children: unit di dalemnya urut start
+    __slots__ = ("node", "start", "length", "parent", "path", "children")
+
+    def __init__(self, node, start, length, parent, path):
+        self.node = node
+        self.start = start
+        self.length = length
+        self.parent = parent
+        self.path = path
+        self.children = []
+
+    @property
+    def kind(self):
+        return self.node.chain[-1]
+
+class IncrementalParser:
+    def __init__(self, tokens, compress=False):
+        # tokens: TokenStream hasil lexer dari str (yang bisa di-relex)
+        self.tokens = tokens
+        self.compress = compress
+        self.make_node = compress_node if compress else ParseNode
+        self.tree = None
+        self.root = None
+        # (nama unit, index token awal, index token akhir) yang terakhir di-parse ulang
+        self.reparsed = None
+        self.parse()
+
+    def parse(self):
+        # parse ulang semuanya, error sintaks dilempar kayak Parser.parse()
+        self.tree = self.root = None
+        tree = Parser(self.tokens, self.compress).parse()
+        root = _Unit(tree, 0, len(self.tokens), None, ())
+        self._collect(root, tree, (), 0)
+        self.tree, self.root = tree, root
+        self.reparsed = (NODE_KINDS[PROGRAM], 0, len(self.tokens))
+        return tree
+
+    def edit(self, offset, removed, inserted, dfa, report=print):
+        # terapin edit ke source (lihat relex), terus parse ulang seperlunya
+        _, (first, old_end, new_end) = relex(self.tokens, offset, removed, inserted, dfa, report=report)
+        return self.update(first, old_end, new_end)
+
+    def update(self, first, old_end, new_end):
+        # token [first, old_end) udah diganti token [first, new_end) (hasil relex)
+        if self.root is None:
+            return self.parse()
+        grow = new_end - old_end
+        for unit, start in reversed(self._enclosing(first, old_end)):
+            if unit is self.root:
+                break
+            node = self._reparse(unit, start, start + unit.length + grow)
+            if node is not None:
+                self._replace(unit, node, start, grow)
+                self.reparsed = (NODE_KINDS[unit.kind], start, start + unit.length)
+                return self.tree
+        return self.parse()
+
+    def _enclosing(self, first, old_end):
+        # [(unit, index token awal)] dari root sampe unit terkecil yang token pertama dan
+        # terakhirnya di luar [first, old_end)
+        chain = [(self.root, 0)]
+        unit, base = self.root, 0
+        while True:
+            for child in unit.children:
+                start = base + child.start
+                if start >= first:
+                    return chain
+                if old_end < start + child.length:
+                    unit, base = child, start
+                    chain.append((unit, base))
+                    break
+            else:
+                return chain
+
+    def _reparse(self, unit, start, end):
+        # parse ulang unit dari token start, None kalo gagal atau gak berhenti pas di end
+        parser = Parser(self.tokens, self.compress, start=start)
+        try:
+            if unit.kind == COMPOUND_STATEMENT:
+                node = parser.parse_compound_statement()
+            else:
+                node = parser.parse_subprogram_declaration()
+        except Exception:
+            return None
+        return node if parser.pos == end else None
+
+    def _replace(self, unit, node, start, grow):
+        # pasang node hasil parse ulang, unit di dalemnya dikumpulin lagi
+        for kind in reversed(unit.node.chain[:-1]):
+            node = self.make_node(kind, (node,))
+        unit.node = node
+        unit.length += grow
+        unit.children = []
+        self._collect(unit, node, (), start)
+
+        # node di sepanjang path ke root dibikin ulang, unit setelahnya geser grow token
+        child = node
+        while unit.parent is not None:
+            parent = unit.parent
+            nodes = [parent.node]
+            for i in unit.path[:-1]:
+                nodes.append(nodes[-1].children[i])
+            for host, i in zip(reversed(nodes), reversed(unit.path)):
+                child = _with_child(host, i, child)
+            parent.node = child
+            parent.length += grow
+            if grow:
+                after = False
+                for sibling in parent.children:
+                    if after:
+                        sibling.start += grow
+                    after = after or sibling is unit
+            unit = parent
+        self.tree = child
+
+    def _collect(self, unit, node, path, base):
+        # cari unit anak di bawah node, base = index token awal unit
+        for i, child in enumerate(node.children):
+            if not isinstance(child, ParseNode):
+                continue
+            if child.chain[-1] in UNIT_KINDS:
+                # token pertama/terakhir unit selalu token asli (prosedur/fungsi/mulai, ;/selesai)
+                start = self.tokens.index_at(child.children[0].offset)
+                end = self.tokens.index_at(child.children[-1].offset) + 1
+                sub = _Unit(child, start - base, end - start, unit, path + (i,))
+                unit.children.append(sub)
+                self._collect(sub, child, (), start)
+            else:
+                self._collect(unit, child, path + (i,), base)
+
+def _with_child(node, index, child):
+    # node baru dengan anak ke-index diganti child, bentuk node-nya (chain) tetep
+    children = node.children[:index] + (child,) + node.children[index + 1:]
+    if type(node) is UnitChainNode:
+        return UnitChainNode(node.chain, children)
+    return ParseNode(node.kind, children)
+
+if __name__ == "__main__":
+    if len(sys.argv) != 6:
+        print("Usage: python3 incremental_parser.py <dfa_rules.json> <source_file.pas> <offset> <removed> <inserted>")
+        sys.exit(1)
+
+    engine = load_engine(sys.argv[1])
+    text = read_source_file(sys.argv[2])
+    tokens = lexical_analyze(text, engine, KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
+    try:
+        begin = time.perf_counter()
+        parser = IncrementalParser(tokens)
+        full = time.perf_counter() - begin
+        begin = time.perf_counter()
+        parser.edit(int(sys.argv[3]), int(sys.argv[4]), sys.argv[5], engine)
+        elapsed = time.perf_counter() - begin
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+    name, first, last = parser.reparsed
+    print(f"Full parse: {full * 1000:.2f} ms")
+    print(f"Relexed and reparsed {name} tokens [{first}, {last}) in {elapsed * 1000:.2f} ms")
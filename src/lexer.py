@@ -1,8 +1,21 @@
 # lexer untuk pascal-s dengan bahasa indonesia
-# baca token dari kode pascal terus convert jadi list of tuples (type, value)
+# baca token dari kode pascal terus convert jadi TokenStream (bisa diakses kayak list of tuples (type, value))
 
+import codecs
+import hashlib
+import importlib.util
+import io
 import json
+import marshal
+import mmap
+import os
+import re
 import sys
+from array import array
+from collections import deque
+
+from token_file import write_token_file
+from token_stream import TOKEN_KINDS, SourceMap, TokenStream, kind_id
 
 # keywords bahasa indonesia buat pascal-s
 KEYWORDS = {
@@ -16,6 +29,24 @@ LOGICAL_OPERATORS = {"dan", "atau", "tidak"}
 # operator aritmatika bahasa indonesia
 ARITHMETIC_OPERATORS = {"bagi", "mod"}
 
+# versi format module hasil lexer_codegen.py, naikin kalo generatornya berubah
+GENERATED_LEXER_VERSION = 4
+# versi format cache rules di disk (file .dfacache di sebelah file rules)
+RULES_CACHE_VERSION = 2
+
+# whitespace dilewatin sekaligus, \s di regex sama persis kayak str.isspace()
+_WHITESPACE = re.compile(r"\s+")
+# versi bytes: karakter ASCII yang str.isspace() (whitespace non-ASCII dicek pake decode)
+_WHITESPACE_BYTES = re.compile(rb"[\t-\r\x1c-\x1f ]+")
+_IS_SPACE_BYTE = [chr(b).isspace() if b < 128 else False for b in range(256)]
+
+# file source yang ukurannya segini ke atas otomatis di-lex lewat mmap (kalo bisa)
+MMAP_MIN_SIZE = 1 << 20
+# ukuran potongan buat validasi UTF-8 file mmap
+_UTF8_CHECK_CHUNK = 1 << 20
+# ukuran potongan yang dibaca sekali jalan di mode streaming
+STREAM_CHUNK_SIZE = 1 << 16
+
 def load_rules(json_path):
     # load DFA rules dari file json
     with open(json_path, "r") as f:
@@ -40,178 +71,934 @@ def match(ch, pattern):
             return True
     return False
 
+def pattern_chars(pattern):
+    # himpunan karakter yang match sama pattern, None kalo pattern-nya gak terbatas (ALL_EXCEPT)
+    if "ALL_EXCEPT " in pattern:
+        return None
+    if len(pattern) == 1:
+        return {pattern}
+    chars = set()
+    for part in pattern.split(","):
+        part = part.strip()
+        if ".." in part:
+            lo, hi = part.split("..")
+            if lo and hi:
+                if len(lo) != 1 or len(hi) != 1:
+                    return None
+                chars.update(chr(o) for o in range(ord(lo), ord(hi) + 1))
+        elif len(part) == 1:
+            chars.add(part)
+    return chars
+
+def _mentions_non_ascii(pattern):
+    # cek apakah pattern nyebut karakter non-ASCII secara eksplisit
+    if "ALL_EXCEPT " in pattern:
+        return any(len(e) == 1 and ord(e) >= 128 for e in pattern[len("ALL_EXCEPT "):].split(", "))
+    chars = pattern_chars(pattern)
+    return chars is None or any(ord(c) >= 128 for c in chars)
+
+def _char_class_regex(codes, negate=False):
+    # bikin character class regex dari list kode ASCII, digabung jadi range biar pendek
+    parts = []
+    codes = sorted(codes)
+    i = 0
+    while i < len(codes):
+        j = i
+        while j + 1 < len(codes) and codes[j + 1] == codes[j] + 1:
+            j += 1
+        parts.append(f"\\x{codes[i]:02x}" if i == j else f"\\x{codes[i]:02x}-\\x{codes[j]:02x}")
+        i = j + 1
+    if negate:
+        return f"[^{''.join(parts)}]*" if parts else "(?s:.)*"
+    return f"[{''.join(parts)}]*" if parts else ""
+
 def skip_comment(text, pos):
     # skip comment { } atau (* *) dan return posisi setelah comment
+    # penutupnya dicari pake str.find jadi comment panjang dilewatin sekaligus
     n = len(text)
 
     # cek comment style { ... }
     if text[pos] == '{':
-        start_pos = pos
-        pos += 1
-        while pos < n:
-            if text[pos] == '}':
-                return pos + 1
-            pos += 1
-        # kalo gak ketemu closing berarti unclosed, error!
-        raise Exception(f"Unclosed comment '{{' starting at position {start_pos}")
+        end = text.find('}', pos + 1)
+        if end < 0:
+            # kalo gak ketemu closing berarti unclosed, error!
+            raise Exception(f"Unclosed comment '{{' starting at position {pos}")
+        return end + 1
 
     # cek comment style (* ... *)
     if pos + 1 < n and text[pos] == '(' and text[pos + 1] == '*':
-        start_pos = pos
-        pos += 2
-        while pos + 1 < n:
-            if text[pos] == '*' and text[pos + 1] == ')':
-                return pos + 2
-            pos += 1
-        # unclosed comment
-        raise Exception(f"Unclosed comment '(*' starting at position {start_pos}")
+        end = text.find('*)', pos + 2)
+        if end < 0:
+            # unclosed comment
+            raise Exception(f"Unclosed comment '(*' starting at position {pos}")
+        return end + 2
 
     # bukan comment
     return pos
 
-def lexical_analyze(text, dfa, keywords, logical_operators, arithmetic_operators):
+class CompiledDFA:
+    # hasil kompilasi DFA rules biar lexer gak perlu interpret json per karakter
+    # - state dijadiin integer id
+    # - karakter dikelompokin jadi char class (karakter yang transisinya sama persis)
+    # - tabel transisi dense: table[cls * n_states + state] -> next state (-1 kalo gak ada)
+    # - final state disimpen sebagai bitset
+    def __init__(self, dfa):
+        names = [dfa["Start_state"]]
+        for s_from, _, s_to in dfa["Transitions"]:
+            names.append(s_from)
+            names.append(s_to)
+        names.extend(dfa["Final_states"])
+        names.extend(dfa.get("Error_states", {}))
+        self.state_names = list(dict.fromkeys(names))
+        self.state_ids = {name: i for i, name in enumerate(self.state_names)}
+        self.n_states = len(self.state_names)
+        self.start = self.state_ids[dfa["Start_state"]]
+
+        self.final_mask = 0
+        for name in dfa["Final_states"]:
+            self.final_mask |= 1 << self.state_ids[name]
+
+        # token type per state (dipake buat last accept state)
+        mapping = dfa["Token_mapping"]
+        self.token_types = [mapping.get(name, "UNKNOWN") for name in self.state_names]
+        errors = dfa.get("Error_states", {})
+        self.error_messages = [errors.get(name) for name in self.state_names]
+
+        # transisi per state, urutan dijaga karena yang match duluan yang menang
+        self._transitions = [[] for _ in self.state_names]
+        for s_from, pattern, s_to in dfa["Transitions"]:
+            self._transitions[self.state_ids[s_from]].append((pattern, self.state_ids[s_to]))
+        self._fold_edge_cases()
+
+        # char class buat ASCII diitung di awal, non-ASCII diitung pas pertama ketemu
+        self.table = array("h")
+        self._class_ids = {}
+        self.ascii_class = [self._class_for(chr(o)) for o in range(128)]
+        self._other_class = {}
+        self._build_runs()
+        self._build_byte_tables()
+
+    def _add_state(self, name, final, token_type, transitions):
+        # tambah state sintetis (gak ada di file rules), return id-nya
+        while name in self.state_ids:
+            name += "'"
+        state = self.n_states
+        self.state_names.append(name)
+        self.state_ids[name] = state
+        self.n_states += 1
+        if final:
+            self.final_mask |= 1 << state
+        self.token_types.append(token_type)
+        self.error_messages.append(None)
+        self._transitions.append(transitions)
+        return state
+
+    def _fold_edge_cases(self):
+        # edge case lexer dilipet ke automaton-nya, jadi lexer cukup baca tabel per state berhenti:
+        # - stop_types[state]: token type pengganti kalo scan berhenti di state itu (None = gak ada)
+        # - stop_trims[state]: berapa karakter di ujung lexeme yang bukan bagian value token
+        # - stop_backs[state]: berapa karakter yang ke-scan cuma buat lookahead (buat pesan error)
+        self.stop_types = [None] * self.n_states
+        self.stop_trims = [0] * self.n_states
+        self.stop_backs = [0] * self.n_states
+
+        # number yang diikuti .. (misal 1..10): NUMBER_DOT dapet transisi '.' ke state
+        # lookahead, berhenti di situ berarti token-nya NUMBER tanpa ".."
+        number_dot = self.state_ids.get("NUMBER_DOT", -1)
+        if (number_dot >= 0 and self.error_messages[number_dot] is None
+                and not any(match(".", p) for p, _ in self._transitions[number_dot])):
+            state = self._add_state("NUMBER_DOT_RANGE", False, "UNKNOWN", [])
+            self._transitions[number_dot].append((".", state))
+            self.stop_types.append("NUMBER")
+            self.stop_trims.append(2)
+            self.stop_backs.append(1)
+
+        # bedain . (dot) sama .. (range): state setelah '.' dari start dipecah jadi state
+        # sendiri, berhenti di situ berarti lexeme-nya persis "." jadi token-nya DOT
+        start_transitions = self._transitions[self.start]
+        dot = next((s_to for p, s_to in start_transitions if match(".", p)), -1)
+        if dot >= 0 and self.is_final(dot) and self.token_types[dot] == "RANGE_OPERATOR":
+            state = self._add_state("DOT_ONLY", True, "RANGE_OPERATOR", list(self._transitions[dot]))
+            start_transitions.insert(0, (".", state))
+            self.stop_types.append("DOT")
+            self.stop_trims.append(0)
+            self.stop_backs.append(0)
+
+    def _build_runs(self):
+        # buat state yang punya self loop (identifier, angka, isi string), karakter yang
+        # tetep di state itu dimakan sekaligus pake regex, gak satu-satu lewat tabel
+        self.run_patterns = []
+        self.runs = []
+        n_states = self.n_states
+        for state, transitions in enumerate(self._transitions):
+            pattern = None
+            if any(s_to == state for _, s_to in transitions) and \
+                    not any(_mentions_non_ascii(p) for p, _ in transitions):
+                codes = [o for o in range(128)
+                         if self.table[self.ascii_class[o] * n_states + state] == state]
+                # karakter non-ASCII ikut transisi ALL_EXCEPT pertama (kalo ada)
+                other = next((s_to for p, s_to in transitions if "ALL_EXCEPT " in p), -1)
+                if other == state:
+                    pattern = _char_class_regex(set(range(128)) - set(codes), negate=True)
+                else:
+                    pattern = _char_class_regex(codes) or None
+            self.run_patterns.append(pattern)
+            self.runs.append(re.compile(pattern).match if pattern else None)
+
+    def _build_byte_tables(self):
+        # tabel buat scan langsung di bytes UTF-8 (mode mmap)
+        # byte awal karakter non-ASCII ikut transisi karakter non-ASCII, byte lanjutannya
+        # (0x80-0xBF) gak ngubah state, jadi satu karakter tetep satu transisi
+        # cuma bisa kalo rules gak nyebut karakter non-ASCII sama sekali
+        self.bytes_safe = not any(_mentions_non_ascii(p) for ts in self._transitions for p, _ in ts)
+        if not self.bytes_safe:
+            self.byte_class = None
+            self.byte_runs = None
+            return
+        lead = self.char_class("\x80")
+        column = tuple(range(self.n_states))
+        continuation = self._class_ids.get(column)
+        if continuation is None:
+            continuation = self._class_ids[column] = len(self._class_ids)
+            self.table.extend(column)
+        self.byte_class = self.ascii_class + [continuation] * 64 + [lead] * 64
+        self.byte_runs = [re.compile(p.encode("ascii")).match if p else None for p in self.run_patterns]
+
+    def _class_for(self, ch):
+        # kolom transisi karakter ch buat semua state, kolom yang sama = class yang sama
+        column = []
+        for transitions in self._transitions:
+            target = -1
+            for pattern, s_to in transitions:
+                if match(ch, pattern):
+                    target = s_to
+                    break
+            column.append(target)
+        column = tuple(column)
+        cls = self._class_ids.get(column)
+        if cls is None:
+            cls = len(self._class_ids)
+            self._class_ids[column] = cls
+            self.table.extend(column)
+        return cls
+
+    def char_class(self, ch):
+        o = ord(ch)
+        if o < 128:
+            return self.ascii_class[o]
+        cls = self._other_class.get(ch)
+        if cls is None:
+            cls = self._other_class[ch] = self._class_for(ch)
+        return cls
+
+    def to_data(self):
+        # data mentah buat disimpen ke cache (cuma tipe yang bisa di-marshal)
+        return {
+            "state_names": self.state_names,
+            "start": self.start,
+            "final_mask": self.final_mask,
+            "token_types": self.token_types,
+            "error_messages": self.error_messages,
+            "stop_types": self.stop_types,
+            "stop_trims": self.stop_trims,
+            "stop_backs": self.stop_backs,
+            "transitions": [[tuple(t) for t in ts] for ts in self._transitions],
+            "columns": [list(column) for column in self._class_ids],
+            "ascii_class": self.ascii_class,
+        }
+
+    @classmethod
+    def from_data(cls, data):
+        # bikin ulang CompiledDFA dari hasil to_data tanpa compile ulang rules
+        engine = cls.__new__(cls)
+        engine.state_names = data["state_names"]
+        engine.state_ids = {name: i for i, name in enumerate(engine.state_names)}
+        engine.n_states = len(engine.state_names)
+        engine.start = data["start"]
+        engine.final_mask = data["final_mask"]
+        engine.token_types = data["token_types"]
+        engine.error_messages = data["error_messages"]
+        engine.stop_types = data["stop_types"]
+        engine.stop_trims = data["stop_trims"]
+        engine.stop_backs = data["stop_backs"]
+        engine._transitions = [list(ts) for ts in data["transitions"]]
+        engine.table = array("h")
+        engine._class_ids = {}
+        for column in data["columns"]:
+            engine._class_ids[tuple(column)] = len(engine._class_ids)
+            engine.table.extend(column)
+        engine.ascii_class = data["ascii_class"]
+        engine._other_class = {}
+        engine._build_runs()
+        engine._build_byte_tables()
+        return engine
+
+    @property
+    def n_classes(self):
+        return len(self._class_ids)
+
+    def is_final(self, state):
+        return state >= 0 and (self.final_mask >> state) & 1 == 1
+
+    def scan(self, text, pos, n):
+        # jalanin DFA dari pos sampe gak ada transisi lagi (maximal munch)
+        # return (state terakhir, posisi berhenti, last accept state, posisi last accept)
+        table = self.table
+        n_states = self.n_states
+        ascii_class = self.ascii_class
+        final_mask = self.final_mask
+        runs = self.runs
+        state = self.start
+        last_state = -1
+        last_pos = pos
+        while pos < n:
+            o = ord(text[pos])
+            cls = ascii_class[o] if o < 128 else self.char_class(text[pos])
+            nxt = table[cls * n_states + state]
+            if nxt < 0:
+                break
+            pos += 1
+            if nxt == state:
+                # udah masuk self loop, sisanya dimakan sekaligus
+                run = runs[state]
+                if run is not None:
+                    pos = run(text, pos).end()
+            state = nxt
+            if (final_mask >> state) & 1:
+                last_state = state
+                last_pos = pos
+        return state, pos, last_state, last_pos
+
+    def scan_bytes(self, data, pos, n):
+        # sama kayak scan tapi langsung di bytes UTF-8 (bytes atau mmap), posisinya offset byte
+        table = self.table
+        n_states = self.n_states
+        byte_class = self.byte_class
+        final_mask = self.final_mask
+        runs = self.byte_runs
+        state = self.start
+        last_state = -1
+        last_pos = pos
+        while pos < n:
+            nxt = table[byte_class[data[pos]] * n_states + state]
+            if nxt < 0:
+                break
+            pos += 1
+            if nxt == state:
+                run = runs[state]
+                if run is not None:
+                    pos = run(data, pos).end()
+            state = nxt
+            if (final_mask >> state) & 1:
+                last_state = state
+                last_pos = pos
+        return state, pos, last_state, last_pos
+
+def compile_rules(dfa):
+    # compile DFA rules (hasil load_rules) jadi CompiledDFA
+    return CompiledDFA(dfa)
+
+class GeneratedDFA:
+    # bungkus module hasil lexer_codegen.py biar interface-nya sama kayak CompiledDFA
+    def __init__(self, module):
+        self.state_names = module.STATE_NAMES
+        self.start = module.START
+        self.token_types = module.TOKEN_TYPES
+        self.error_messages = module.ERROR_MESSAGES
+        self.stop_types = module.STOP_TYPES
+        self.stop_trims = module.STOP_TRIMS
+        self.stop_backs = module.STOP_BACKS
+        self.scan = module.scan
+        # scan_bytes cuma ada kalo rules-nya aman buat di-scan per byte
+        self.scan_bytes = getattr(module, "scan_bytes", None)
+        self.bytes_safe = self.scan_bytes is not None
+
+def rules_hash(dfa_path):
+    # hash isi file rules, dipake buat ngecek module generated masih valid atau nggak
+    with open(dfa_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+def generated_lexer_path(dfa_path):
+    # lokasi module hasil codegen buat file rules tertentu (src/generated/<nama_rules>.py)
+    name = os.path.splitext(os.path.basename(dfa_path))[0]
+    return os.path.join(os.path.dirname(os.path.abspath(__file__)), "generated", f"{name}.py")
+
+def load_generated_lexer(dfa_path, digest=None):
+    # load module hasil codegen kalo ada dan hash-nya cocok sama file rules, selain itu None
+    module_path = generated_lexer_path(dfa_path)
+    if not os.path.exists(module_path):
+        return None
+    spec = importlib.util.spec_from_file_location(f"generated_{os.path.basename(module_path)[:-3]}", module_path)
+    module = importlib.util.module_from_spec(spec)
+    try:
+        spec.loader.exec_module(module)
+    except Exception:
+        return None
+    if getattr(module, "GENERATOR_VERSION", None) != GENERATED_LEXER_VERSION:
+        return None
+    if getattr(module, "RULES_HASH", None) != (digest or rules_hash(dfa_path)):
+        return None
+    return GeneratedDFA(module)
+
+def rules_cache_path(dfa_path):
+    # cache hasil compile disimpen di sebelah file rules, misal rules/dfa_rules_final.dfacache
+    return os.path.splitext(dfa_path)[0] + ".dfacache"
+
+def load_cached_rules(dfa_path, digest):
+    # baca CompiledDFA dari cache di disk, None kalo gak ada / udah basi / rusak
+    try:
+        with open(rules_cache_path(dfa_path), "rb") as f:
+            version, cached_digest, data = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+    if version != RULES_CACHE_VERSION or cached_digest != digest:
+        return None
+    return CompiledDFA.from_data(data)
+
+def save_cached_rules(dfa_path, digest, engine):
+    # tulis cache ke disk, kalo gagal (misal folder read-only) ya udah gak usah
+    cache_path = rules_cache_path(dfa_path)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            marshal.dump((RULES_CACHE_VERSION, digest, engine.to_data()), f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+# cache engine per proses: abspath rules -> (mtime, size, hash, engine)
+_ENGINE_CACHE = {}
+
+def load_engine(dfa_path):
+    # urutan: cache di memory -> module hasil codegen -> cache di disk -> compile json
+    # semuanya di-key pake hash isi file rules, jadi kalo rules berubah otomatis di-build ulang
+    key = os.path.abspath(dfa_path)
+    stat = os.stat(dfa_path)
+    cached = _ENGINE_CACHE.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[3]
+
+    digest = rules_hash(dfa_path)
+    if cached and cached[2] == digest:
+        engine = cached[3]
+    else:
+        engine = load_generated_lexer(dfa_path, digest)
+        if engine is None:
+            engine = load_cached_rules(dfa_path, digest)
+        if engine is None:
+            engine = compile_rules(load_rules(dfa_path))
+            save_cached_rules(dfa_path, digest, engine)
+    _ENGINE_CACHE[key] = (stat.st_mtime_ns, stat.st_size, digest, engine)
+    return engine
+
+def lexical_analyze(text, dfa, keywords, logical_operators, arithmetic_operators,
+                    stream=False, chunk_size=STREAM_CHUNK_SIZE):
     # fungsi utama buat tokenizing, jalan dari kiri ke kanan pake DFA
-    tokens = []
-    pos = 0
+    # hasilnya TokenStream: kind integer + offset ke text, value di-slice pas diminta
+    # text juga bisa bytes/mmap UTF-8 (lihat map_source_file), offset token-nya jadi offset byte
+    # stream=True: return LexerStream yang nge-lex sambil jalan (text boleh str atau file object)
+    engine = compile_rules(dfa) if isinstance(dfa, dict) else dfa
+    if stream:
+        return LexerStream(text, engine, keywords, logical_operators, arithmetic_operators, chunk_size)
+    reserved = _reserved_kinds(keywords, logical_operators, arithmetic_operators)
+    if not isinstance(text, str):
+        return _lexical_analyze_bytes(text, engine, reserved)
+    tokens, _, _ = _lex_text(text, engine, reserved)
+    return tokens
+
+def _lex_text(text, engine, reserved, report=print, pos=0, sync=None):
+    # inti lexer buat str, sekali jalan dari posisi pos: return (tokens, stopped, reached_end)
+    # - compound keyword (selain-itu, turun-ke) langsung digabung pas token ketiganya masuk
+    # - pesan error dikirim ke report (default langsung di-print)
+    # - stopped: lexing berhenti di tengah gara-gara error, token yang udah ada dibalikin
+    #   belum di-merge (sama kayak dulu pas merge-nya masih jalan terpisah)
+    # - reached_end: ada scan DFA yang mentok ujung text, artinya token terakhir mungkin
+    #   nyambung kalo text-nya cuma potongan (dipake parallel_lexer buat ngecek sambungan)
+    # - sync (dipake incremental_lexer): tiap kali posisi scan >= sync.position, sync.aligned()
+    #   ditanya apa token-nya udah nyambung lagi sama token stream lama, kalo iya lexing berhenti
+    type_kinds = [kind_id(t) for t in engine.token_types]
+    stop_kinds = [-1 if t is None else kind_id(t) for t in engine.stop_types]
+    stop_trims = engine.stop_trims
+    error_messages = engine.error_messages
+    identifier_kind = kind_id("IDENTIFIER")
+    keyword_kind = kind_id("KEYWORD")
+    arithmetic_kind = kind_id("ARITHMETIC_OPERATOR")
+
+    tokens = TokenStream(text)
+    kinds = tokens.kinds
+    append_kind = kinds.append
+    append_start = tokens.starts.append
+    append_end = tokens.ends.append
+    merges = []
     n = len(text)
+    reached_end = False
+    sync_pos = n + 1 if sync is None else sync.position
     while pos < n:
-        # skip whitespace
-        if text[pos].isspace():
+        ch = text[pos]
+        # skip whitespace (sekaligus satu blok)
+        if ch.isspace():
             pos += 1
+            if pos < n and text[pos].isspace():
+                pos = _WHITESPACE.match(text, pos).end()
             continue
 
         # skip comment
-        if text[pos] == '{' or (pos + 1 < n and text[pos:pos+2] == '(*'):
+        if ch == '{' or (ch == '(' and text.startswith('*', pos + 1)):
             pos = skip_comment(text, pos)
             continue
 
-        # mulai dari start state
-        state = dfa["Start_state"]
-        current_lexeme = ""
-        last_accept_state = None
-        last_accept_pos = pos
+        if pos >= sync_pos:
+            if sync.aligned(tokens, pos):
+                return tokens, False, reached_end
+            sync_pos = sync.position
 
-        # coba transisi state sampe gak bisa lagi
-        while pos < n:
-            ch = text[pos]
-            transitioned = False
-            # cari transisi yang cocok
-            for s_from, pattern, s_to in dfa["Transitions"]:
-                if s_from == state and match(ch, pattern):
-                    if (state in ["NUMBER", "NUMBER_FLOAT", "S_NUMBER"]) and (s_to in ["SPACE_NUM", "SUBSTRACT"]):
-                        last_num_pos = pos
-                    state = s_to
-                    current_lexeme += ch
-                    pos += 1
-
-                    transitioned = True
-                    break
-            if not transitioned:
-                break
-            # catet posisi terakhir yang valid
-            if state in dfa["Final_states"]:
-                last_accept_state = state
-                last_accept_pos = pos
+        # jalanin DFA dari start state
+        start = pos
+        state, pos, last_accept_state, last_accept_pos = engine.scan(text, pos, n)
+        error_message = error_messages[state]
+        if pos == n:
+            reached_end = True
 
         # error handling
-        if pos == n and state in dfa.get("Error_states", {}):
-            print(f"Error: invalid '{current_lexeme}' ({dfa['Error_states'][state]})")
-            return tokens
+        if pos == n and error_message is not None:
+            report(f"Error: invalid '{text[start:pos]}' ({error_message})")
+            _undo_compound_merges(tokens, merges)
+            tokens.stopped = True
+            return tokens, True, True
 
-        if (not last_accept_state):
-            print(f"Error: Unknown symbol '{text[pos]}'")
-            return tokens
+        if last_accept_state < 0:
+            report(f"Error: Unknown symbol '{text[pos - engine.stop_backs[state]]}'")
+            _undo_compound_merges(tokens, merges)
+            tokens.stopped = True
+            return tokens, True, reached_end
 
-        # bikin token dari lexeme yang udah dikumpulin
-        if last_accept_state and state not in dfa.get("Error_states", {}):
-            tok_type = dfa["Token_mapping"].get(last_accept_state, "UNKNOWN")
-            val = current_lexeme
+        # bikin token dari lexeme (cukup catet offset-nya)
+        if error_message is None:
+            kind = type_kinds[last_accept_state]
+            end = pos
             # reklasifikasi identifier jadi keyword/operator kalo perlu
-            if tok_type == "IDENTIFIER" and val.lower() in keywords:
-                tok_type = "KEYWORD"
-            elif tok_type == "IDENTIFIER" and val.lower() in logical_operators:
-                tok_type = "LOGICAL_OPERATOR"
-            elif tok_type == "IDENTIFIER" and val.lower() in arithmetic_operators:
-                tok_type = "ARITHMETIC_OPERATOR"
-            # edge case buat number yang diikuti .. (range operator)
-            if state == "NUMBER_DOT" and pos < n and text[pos] == '.':
-                tok_type = "NUMBER"
-                val = current_lexeme[0:-1]
-            # bedain . (dot) sama .. (range)
-            if tok_type == "RANGE_OPERATOR" and val == ".":
-                tok_type = "DOT"
-
-            tokens.append((tok_type, val))
+            if kind == identifier_kind:
+                kind = reserved.get(text[start:end].lower(), kind)
+            # state edge case hasil CompiledDFA._fold_edge_cases (number sebelum .., dot vs range)
+            if stop_kinds[state] >= 0:
+                kind = stop_kinds[state]
+                end -= stop_trims[state]
+
+            append_kind(kind)
+            append_start(start)
+            append_end(end)
             pos = last_accept_pos
-        elif state in dfa.get("Error_states", {}):
-            print(f"Error: invalid '{current_lexeme}' ({dfa['Error_states'][state]})")
+            if ((kind == identifier_kind or kind == keyword_kind) and len(kinds) >= 3
+                    and kinds[-2] == arithmetic_kind and kinds[-3] == identifier_kind):
+                _merge_compound_tail(tokens, merges)
         else:
+            report(f"Error: invalid '{text[start:pos]}' ({error_message})")
+
+    return tokens, False, reached_end
+
+def _reserved_kinds(keywords, logical_operators, arithmetic_operators):
+    # reklasifikasi identifier jadi keyword/operator, urutan prioritas sama kayak sebelumnya
+    reserved = {}
+    for word in arithmetic_operators:
+        reserved[word] = kind_id("ARITHMETIC_OPERATOR")
+    for word in logical_operators:
+        reserved[word] = kind_id("LOGICAL_OPERATOR")
+    for word in keywords:
+        reserved[word] = kind_id("KEYWORD")
+    return reserved
+
+def _char_at(data, pos):
+    # decode satu karakter UTF-8 yang mulai di offset byte pos
+    lead = data[pos]
+    size = 1 if lead < 0xc0 else 2 if lead < 0xe0 else 3 if lead < 0xf0 else 4
+    return data[pos:pos + size].decode("utf-8"), size
+
+def _char_offset(data, pos):
+    # offset byte -> offset karakter, cuma dipake buat pesan error
+    return len(data[:pos].decode("utf-8"))
+
+def _skip_comment_bytes(data, pos):
+    # versi bytes dari skip_comment, posisi di pesan error tetep offset karakter
+    if data[pos] == 0x7b:
+        end = data.find(b"}", pos + 1)
+        if end < 0:
+            raise Exception(f"Unclosed comment '{{' starting at position {_char_offset(data, pos)}")
+        return end + 1
+    end = data.find(b"*)", pos + 2)
+    if end < 0:
+        raise Exception(f"Unclosed comment '(*' starting at position {_char_offset(data, pos)}")
+    return end + 2
+
+def _lexical_analyze_bytes(data, engine, reserved):
+    # sama kayak lexical_analyze tapi langsung di bytes UTF-8, gak pernah decode seluruh file
+    # cuma awal token non-ASCII sama value token yang diminta yang di-decode
+    type_kinds = [kind_id(t) for t in engine.token_types]
+    stop_kinds = [-1 if t is None else kind_id(t) for t in engine.stop_types]
+    stop_trims = engine.stop_trims
+    error_messages = engine.error_messages
+    identifier_kind = kind_id("IDENTIFIER")
+    keyword_kind = kind_id("KEYWORD")
+    arithmetic_kind = kind_id("ARITHMETIC_OPERATOR")
+    reserved_bytes = {word.encode("utf-8"): kind for word, kind in reserved.items()}
+    scan = engine.scan_bytes
+    is_space = _IS_SPACE_BYTE
+
+    tokens = TokenStream(data)
+    kinds = tokens.kinds
+    append_kind = kinds.append
+    append_start = tokens.starts.append
+    append_end = tokens.ends.append
+    merges = []
+    pos = 0
+    n = len(data)
+    while pos < n:
+        b = data[pos]
+        # skip whitespace ASCII (sekaligus satu blok)
+        if is_space[b]:
             pos += 1
+            if pos < n and is_space[data[pos]]:
+                pos = _WHITESPACE_BYTES.match(data, pos).end()
+            continue
+        # whitespace non-ASCII (misal no-break space) harus di-decode dulu
+        if b >= 0x80:
+            ch, size = _char_at(data, pos)
+            if ch.isspace():
+                pos += size
+                continue
+
+        # skip comment
+        if b == 0x7b or (b == 0x28 and data[pos + 1:pos + 2] == b"*"):
+            pos = _skip_comment_bytes(data, pos)
+            continue
+
+        start = pos
+        state, pos, last_accept_state, last_accept_pos = scan(data, pos, n)
+        error_message = error_messages[state]
+
+        if pos == n and error_message is not None:
+            print(f"Error: invalid '{data[start:pos].decode('utf-8')}' ({error_message})")
+            _undo_compound_merges(tokens, merges)
+            tokens.stopped = True
+            return tokens
+
+        if last_accept_state < 0:
+            print(f"Error: Unknown symbol '{_char_at(data, pos - engine.stop_backs[state])[0]}'")
+            _undo_compound_merges(tokens, merges)
+            tokens.stopped = True
+            return tokens
+
+        if error_message is None:
+            kind = type_kinds[last_accept_state]
+            end = pos
+            if kind == identifier_kind:
+                word = data[start:end]
+                if word.isascii():
+                    kind = reserved_bytes.get(word.lower(), kind)
+                else:
+                    kind = reserved.get(word.decode("utf-8").lower(), kind)
+            if stop_kinds[state] >= 0:
+                kind = stop_kinds[state]
+                end -= stop_trims[state]
+
+            append_kind(kind)
+            append_start(start)
+            append_end(end)
+            pos = last_accept_pos
+            if ((kind == identifier_kind or kind == keyword_kind) and len(kinds) >= 3
+                    and kinds[-2] == arithmetic_kind and kinds[-3] == identifier_kind):
+                _merge_compound_tail(tokens, merges)
+        else:
+            print(f"Error: invalid '{data[start:pos].decode('utf-8')}' ({error_message})")
 
-    # merge compound keywords kayak selain-itu dan turun-ke
-    tokens = merge_compound_keywords(tokens)
     return tokens
 
+class LexerStream:
+    # mode streaming lexical_analyze: source dibaca per potongan dan token-nya di-yield satu-satu
+    # isinya tuple (type, value, offset), compound keyword udah digabung
+    # yang disimpen cuma potongan source yang lagi di-scan + 3 token buat merge
+    def __init__(self, source, engine, keywords, logical_operators, arithmetic_operators,
+                 chunk_size=STREAM_CHUNK_SIZE, close_source=False):
+        self.source = source
+        self.engine = engine
+        self.reserved = _reserved_kinds(keywords, logical_operators, arithmetic_operators)
+        self.chunk_size = chunk_size
+        self.close_source = close_source
+        self._read_pos = 0
+        # posisi line/column dicatet sambil jalan
+        self.source_map = SourceMap()
+        self._tokens = iter_merge_compound_keywords(self._scan())
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._tokens)
+
+    def _read(self):
+        source = self.source
+        if isinstance(source, str):
+            # str biasa dipotong-potong juga biar jalurnya sama
+            start = self._read_pos
+            self._read_pos = start + self.chunk_size
+            return source[start:self._read_pos]
+        return source.read(self.chunk_size)
+
+    def _scan(self):
+        try:
+            yield from self._scan_chunks()
+        finally:
+            if self.close_source:
+                self.source.close()
+
+    def _scan_chunks(self):
+        engine = self.engine
+        scan = engine.scan
+        type_names = engine.token_types
+        error_messages = engine.error_messages
+        stop_types = engine.stop_types
+        stop_trims = engine.stop_trims
+        reserved = {word: TOKEN_KINDS[kind] for word, kind in self.reserved.items()}
+        feed = self.source_map.feed
+
+        buf = ""
+        base = 0        # offset absolut buf[0]
+        pos = 0
+        n = 0
+        eof = False
+        more = False    # token di pos kepotong ujung buffer, baca potongan berikutnya dulu
+        while True:
+            if more or pos >= n:
+                if eof:
+                    break
+                chunk = self._read()
+                if chunk:
+                    feed(chunk, base + n)
+                else:
+                    eof = True
+                # buang bagian buffer yang udah selesai diproses
+                buf = buf[pos:] + chunk
+                base += pos
+                pos = 0
+                n = len(buf)
+                more = False
+                continue
+
+            ch = buf[pos]
+            # skip whitespace (sekaligus satu blok)
+            if ch.isspace():
+                pos += 1
+                if pos < n and buf[pos].isspace():
+                    pos = _WHITESPACE.match(buf, pos).end()
+                continue
+
+            # skip comment, penutupnya bisa aja ada di potongan berikutnya
+            if ch == '(' and pos + 1 == n and not eof:
+                more = True
+                continue
+            if ch == '{' or (ch == '(' and buf.startswith('*', pos + 1)):
+                opening, closing = ('{', '}') if ch == '{' else ('(*', '*)')
+                end = buf.find(closing, pos + len(opening))
+                if end < 0:
+                    if not eof:
+                        more = True
+                        continue
+                    raise Exception(f"Unclosed comment '{opening}' starting at position {base + pos}")
+                pos = end + len(closing)
+                continue
+
+            # jalanin DFA, kalo mentok di ujung buffer token-nya mungkin masih lanjut
+            start = pos
+            state, stop, last_accept_state, last_accept_pos = scan(buf, pos, n)
+            if stop == n and not eof:
+                more = True
+                continue
+            error_message = error_messages[state]
+
+            if stop == n and error_message is not None:
+                print(f"Error: invalid '{buf[start:stop]}' ({error_message})")
+                return
+
+            if last_accept_state < 0:
+                print(f"Error: Unknown symbol '{buf[stop - engine.stop_backs[state]]}'")
+                return
+
+            if error_message is None:
+                token_type = type_names[last_accept_state]
+                end = stop
+                value = buf[start:end]
+                if token_type == "IDENTIFIER":
+                    token_type = reserved.get(value.lower(), token_type)
+                # state edge case hasil CompiledDFA._fold_edge_cases (number sebelum .., dot vs range)
+                if stop_types[state] is not None:
+                    token_type = stop_types[state]
+                    end -= stop_trims[state]
+                    value = buf[start:end]
+                yield (token_type, value, base + start)
+                pos = last_accept_pos
+            else:
+                print(f"Error: invalid '{buf[start:stop]}' ({error_message})")
+                pos = stop
+
+def _compound_keyword(tok1, tok2, tok3):
+    # nama compound keyword kalo tiga token ini pola selain - itu / turun - ke, selain itu None
+    if tok2[0] != "ARITHMETIC_OPERATOR" or tok2[1] != "-" or tok1[0] != "IDENTIFIER":
+        return None
+    # cek pattern selain - itu
+    if tok1[1].lower() == "selain" and tok3[0] == "IDENTIFIER" and tok3[1].lower() == "itu":
+        return "selain-itu"
+    # cek pattern turun - ke
+    if (tok1[1].lower() == "turun" and (tok3[0] == "IDENTIFIER" or tok3[0] == "KEYWORD")
+            and tok3[1].lower() == "ke"):
+        return "turun-ke"
+    return None
+
+def iter_merge_compound_keywords(tokens):
+    # versi streaming merge_compound_keywords, cukup nyimpen 3 token terakhir
+    # kalo token-nya punya offset, compound keyword dapet offset token pertama
+    window = deque()
+    for token in tokens:
+        window.append(token)
+        if len(window) == 3:
+            merged = _compound_keyword(window[0], window[1], window[2])
+            if merged is not None:
+                yield ("KEYWORD", merged) + tuple(window[0][2:])
+                window.clear()
+            else:
+                yield window.popleft()
+    yield from window
+
 def merge_compound_keywords(tokens):
     # gabungin token yang pisah jadi compound keyword
     # misal: selain - itu -> selain-itu
+    # lexical_analyze udah nge-merge sendiri, ini buat list token dari tempat lain
     result = []
     i = 0
     while i < len(tokens):
         if i + 2 < len(tokens):
-            tok1, tok2, tok3 = tokens[i], tokens[i+1], tokens[i+2]
-            # cek pattern selain - itu
-            if (tok1[0] == "IDENTIFIER" and tok1[1].lower() == "selain" and
-                tok2[0] == "ARITHMETIC_OPERATOR" and tok2[1] == "-" and
-                tok3[0] == "IDENTIFIER" and tok3[1].lower() == "itu"):
-                result.append(("KEYWORD", "selain-itu"))
-                i += 3
-                continue
-            # cek pattern turun - ke
-            elif (tok1[0] == "IDENTIFIER" and tok1[1].lower() == "turun" and
-                  tok2[0] == "ARITHMETIC_OPERATOR" and tok2[1] == "-" and
-                  (tok3[0] == "IDENTIFIER" or tok3[0] == "KEYWORD") and tok3[1].lower() == "ke"):
-                result.append(("KEYWORD", "turun-ke"))
+            merged = _compound_keyword(tokens[i], tokens[i + 1], tokens[i + 2])
+            if merged is not None:
+                result.append(("KEYWORD", merged))
                 i += 3
                 continue
         result.append(tokens[i])
         i += 1
     return result
 
-def tokenize_from_file(dfa_path, source_path):
-    # baca file pascal dan tokenize
-    dfa = load_rules(dfa_path)
+def _merge_compound_tail(tokens, merges):
+    # gabungin 3 token terakhir TokenStream kalo polanya compound keyword
+    # token aslinya dicatet di merges biar bisa dibalikin kalo lexing-nya error
+    first = len(tokens) - 3
+    merged = _compound_keyword(tokens[first], tokens[first + 1], tokens[first + 2])
+    if merged is None:
+        return
+    kinds, starts, ends = tokens.kinds, tokens.starts, tokens.ends
+    merges.append((first, kinds[first:], starts[first:], ends[first:]))
+    start = starts[first]
+    end = ends[-1]
+    del kinds[first:]
+    del starts[first:]
+    del ends[first:]
+    tokens.append(kind_id("KEYWORD"), start, end, merged)
 
-    # auto detect encoding (utf-16-le atau utf-8)
-    with open(source_path, 'rb') as f:
-        first_bytes = f.read(2)
+def _undo_compound_merges(tokens, merges):
+    # lexing berhenti gara-gara error: compound keyword dipecah lagi jadi 3 token aslinya
+    # dibalikin dari belakang, jadi index merge yang lebih awal gak geser
+    for index, kinds, starts, ends in reversed(merges):
+        tokens.kinds[index:index + 1] = kinds
+        tokens.starts[index:index + 1] = starts
+        tokens.ends[index:index + 1] = ends
+        del tokens.overrides[index]
 
+def open_source_file(source_path):
+    # buka file pascal sebagai file teks, file cuma dibuka sekali
+    f = open(source_path, "rb")
+    # auto detect encoding (utf-16-le atau utf-8)
+    first_bytes = f.read(2)
     encoding = 'utf-16-le' if first_bytes == b'\xff\xfe' else 'utf-8'
+    f.seek(0)
+    return io.TextIOWrapper(f, encoding=encoding)
+
+def read_source_file(source_path):
+    # baca file pascal jadi str
+    with open_source_file(source_path) as f:
+        return f.read()
+
+def map_source_file(source_path):
+    # buka file pascal pake mmap buat di-lex langsung per byte
+    # return None kalo file-nya harus lewat read_source_file: kosong, UTF-16, atau ada \r
+    # (mode teks nerjemahin \r\n jadi \n, jadi hasilnya bisa beda)
+    with open(source_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if data[:2] == b'\xff\xfe' or data.find(b"\r") >= 0:
+        data.close()
+        return None
+    # validasi UTF-8 per potongan, error-nya sama kayak pas decode biasa
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        for i in range(0, len(data), _UTF8_CHECK_CHUNK):
+            chunk = data[i:i + _UTF8_CHECK_CHUNK]
+            # potongan ASCII murni gak perlu di-decode, kecuali ada sisa karakter dari potongan sebelumnya
+            if not chunk.isascii() or decoder.getstate()[0]:
+                decoder.decode(chunk)
+        decoder.decode(b"", True)
+    except UnicodeDecodeError:
+        # decode ulang semuanya biar posisi di pesan error-nya posisi di file
+        data[:].decode("utf-8")
+        raise
+    return data
 
-    with open(source_path, "r", encoding=encoding) as f:
-        source = f.read()
+def tokenize_from_file(dfa_path, source_path, use_mmap=None, stream=False):
+    # baca file pascal dan tokenize
+    # use_mmap: True = lex langsung dari mmap, False = decode ke str, None = otomatis
+    # (mmap kalo file-nya >= MMAP_MIN_SIZE)
+    # stream=True: return LexerStream yang baca file per potongan sambil di-parse
+    dfa = load_engine(dfa_path)
+    if stream:
+        return LexerStream(open_source_file(source_path), dfa, KEYWORDS, LOGICAL_OPERATORS,
+                           ARITHMETIC_OPERATORS, close_source=True)
+    if use_mmap is None:
+        use_mmap = os.path.getsize(source_path) >= MMAP_MIN_SIZE
+    if use_mmap and dfa.bytes_safe:
+        data = map_source_file(source_path)
+        if data is not None:
+            return lexical_analyze(data, dfa, KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
+    source = read_source_file(source_path)
     return lexical_analyze(source, dfa, KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
 
 def tokenize_from_text(text, dfa_path):
-    dfa = load_rules(dfa_path)
+    dfa = load_engine(dfa_path)
     return lexical_analyze(text, dfa, KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
 
 if __name__ == "__main__":
-    if len(sys.argv) != 3:
-        print("Usage: python3 lexer.py <dfa_rules.json> <source_file.pas>")
+    args = sys.argv[1:]
+    use_mmap = None
+    stream = False
+    output_path = None
+    if "--mmap" in args:
+        args.remove("--mmap")
+        use_mmap = True
+    if "--stream" in args:
+        # token langsung di-print sambil file-nya dibaca
+        args.remove("--stream")
+        stream = True
+    if "-o" in args:
+        # simpen token ke file binary .ptk (lihat token_file.py) daripada di-print
+        i = args.index("-o")
+        output_path = args[i + 1] if i + 1 < len(args) else ""
+        del args[i:i + 2]
+    if len(args) != 2 or (output_path is not None and (stream or not output_path)):
+        print("Usage: python3 lexer.py <dfa_rules.json> <source_file.pas> [--mmap | --stream | -o tokens.ptk]")
         sys.exit(1)
 
-    dfa = load_rules(sys.argv[1])
-
-    # auto detect encoding (utf-16-le atau utf-8)
-    with open(sys.argv[2], 'rb') as f:
-        first_bytes = f.read(2)
-
-    encoding = 'utf-16-le' if first_bytes == b'\xff\xfe' else 'utf-8'
-
-    with open(sys.argv[2], "r", encoding=encoding) as f:
-        source = f.read()
-
-    result = lexical_analyze(source, dfa, KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
-    for t in result:
-        print(f"{t[0]}({t[1]})")
+    result = tokenize_from_file(args[0], args[1], use_mmap, stream)
+    if output_path is not None:
+        write_token_file(result, output_path)
+        print(f"{len(result)} tokens saved to: {output_path}")
+    else:
+        for t in result:
+            print(f"{t[0]}({t[1]})")
@@ -0,0 +1,229 @@
+# generator lexer khusus dari DFA rules (mirip re2c)
+# baca file json DFA terus tulis module python yang transisinya udah di-hardcode
+# jadi pas runtime gak ada json/tabel yang di-interpret sama sekali
+#
+# cara pake (dari root folder):
+#   python3 src/lexer_codegen.py rules/dfa_rules_final.json
+#   python3 src/lexer_codegen.py dumps/dfa_rules_alternative.json [output.py]
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lexer import (
+    GENERATED_LEXER_VERSION, CompiledDFA, generated_lexer_path, load_rules, pattern_chars,
+    rules_hash
+)
+
+def pattern_condition(pattern, constants, binary=False):
+    # ubah pattern DFA jadi ekspresi python buat variabel ch
+    # semantik harus sama persis kayak lexer.match()
+    # binary=True: ch itu nilai byte (int), karakter dibandingin pake kode ASCII-nya
+    lit = ord if binary else (lambda c: c)
+    if "ALL_EXCEPT " in pattern:
+        exceptions = pattern[len("ALL_EXCEPT "):].split(", ")
+        if len(exceptions) == 1:
+            return f"ch != {lit(exceptions[0])!r}"
+        return f"ch not in {_constant(constants, frozenset(lit(e) for e in exceptions))}"
+    if len(pattern) == 1:
+        return f"ch == {lit(pattern)!r}"
+
+    chars = pattern_chars(pattern)
+    if chars is None:
+        raise ValueError(f"Pattern '{pattern}' tidak didukung codegen")
+    if not chars:
+        return "False"
+    if len(chars) == 1:
+        return f"ch == {lit(next(iter(chars)))!r}"
+    return f"ch in {_constant(constants, frozenset(lit(c) for c in chars))}"
+
+def _constant(constants, value):
+    # simpen frozenset jadi konstanta module biar gak dibikin ulang tiap karakter
+    for name, existing in constants:
+        if existing == value:
+            return name
+    name = f"_SET_{len(constants)}"
+    constants.append((name, value))
+    return name
+
+# state dengan transisi sebanyak ini (dan semuanya himpunan terbatas) dibikin jump table
+JUMP_TABLE_MIN_TRANSITIONS = 4
+
+def _jump_table(transitions, state, binary=False):
+    # dict karakter -> state tujuan, None kalo state ini gak cocok pake jump table
+    if len(transitions) < JUMP_TABLE_MIN_TRANSITIONS:
+        return None
+    jump = {}
+    for pattern, target in transitions:
+        chars = pattern_chars(pattern)
+        if chars is None or target == state:
+            return None
+        for ch in chars:
+            # transisi yang lebih awal menang
+            jump.setdefault(ord(ch) if binary else ch, target)
+    return jump
+
+def _scan_body(engine, constants, jumps, runs, binary=False):
+    # isi fungsi scan (binary=False) atau scan_bytes (binary=True)
+    body = []
+
+    def emit(indent, line):
+        body.append("    " * indent + line)
+
+    def emit_enter(indent, target):
+        # pindah state + catet last accept kalo state tujuannya final
+        emit(indent, f"state = {target}")
+        emit(indent, "pos += 1")
+        if engine.is_final(target):
+            emit(indent, f"last_state = {target}")
+            emit(indent, "last_pos = pos")
+
+    emit(1, f"state = {engine.start}")
+    emit(1, "last_state = -1")
+    emit(1, "last_pos = pos")
+    emit(1, "while pos < n:")
+    emit(2, "ch = text[pos]")
+    if binary:
+        # byte lanjutan UTF-8 (0x80-0xBF) gak ngubah state, satu karakter = satu transisi
+        emit(2, "if 0x80 <= ch < 0xc0:")
+        emit(3, "pos += 1")
+        emit(3, "if FINAL[state]:")
+        emit(4, "last_state = state")
+        emit(4, "last_pos = pos")
+        emit(3, "continue")
+
+    first_state = True
+    for state, transitions in enumerate(engine._transitions):
+        if not transitions:
+            continue
+        emit(2, f"{'if' if first_state else 'elif'} state == {state}:")
+        emit(3, f"# {engine.state_names[state]}")
+        first_state = False
+
+        jump = _jump_table(transitions, state, binary)
+        if jump is not None:
+            # banyak cabang: satu lookup dict, final state dicek lewat tuple FINAL
+            name = f"_JUMP_{len(jumps)}"
+            jumps.append((name, jump))
+            emit(3, f"nxt = {name}.get(ch, -1)")
+            emit(3, "if nxt < 0:")
+            emit(4, "break")
+            emit(3, "state = nxt")
+            emit(3, "pos += 1")
+            emit(3, "if FINAL[nxt]:")
+            emit(4, "last_state = nxt")
+            emit(4, "last_pos = pos")
+            continue
+
+        conditions = [pattern_condition(pattern, constants, binary) for pattern, _ in transitions]
+        for i, (cond, (_, target)) in enumerate(zip(conditions, transitions)):
+            emit(3, f"{'if' if i == 0 else 'elif'} {cond}:")
+            if target != state:
+                emit_enter(4, target)
+                continue
+            # self loop: langsung makan semua karakter yang tetep di state ini
+            run_pattern = engine.run_patterns[state]
+            if run_pattern is not None:
+                name = f"_RUN_{len(runs)}"
+                runs.append((name, run_pattern.encode("ascii") if binary else run_pattern))
+                emit(4, f"pos = {name}(text, pos + 1).end()")
+                if engine.is_final(state):
+                    emit(4, f"last_state = {state}")
+                    emit(4, "last_pos = pos")
+                continue
+            emit(4, "pos += 1")
+            emit(4, "while pos < n:")
+            emit(5, "ch = text[pos]")
+            if binary:
+                emit(5, "if 0x80 <= ch < 0xc0:")
+                emit(6, "pos += 1")
+                emit(6, "continue")
+            earlier = conditions[:i]
+            if earlier:
+                emit(5, f"if {' or '.join(f'({c})' for c in earlier)}:")
+                emit(6, "break")
+            emit(5, f"if not ({cond}):")
+            emit(6, "break")
+            emit(5, "pos += 1")
+            if engine.is_final(state):
+                emit(4, f"last_state = {state}")
+                emit(4, "last_pos = pos")
+        emit(3, "else:")
+        emit(4, "break")
+    if first_state:
+        emit(2, "break")
+    else:
+        emit(2, "else:")
+        emit(3, "break")
+    emit(1, "return state, pos, last_state, last_pos")
+    return body
+
+def generate_lexer_source(dfa, digest, rules_path):
+    # hasilin source code module lexer dari DFA rules
+    engine = CompiledDFA(dfa)
+    constants = []
+    jumps = []
+    runs = []
+    body = _scan_body(engine, constants, jumps, runs)
+    # versi bytes (buat mode mmap) cuma kalo rules-nya aman di-scan per byte
+    bytes_body = _scan_body(engine, constants, jumps, runs, binary=True) if engine.bytes_safe else None
+
+    lines = [
+        f"# file ini di-generate otomatis oleh src/lexer_codegen.py dari {rules_path}",
+        "# jangan diedit manual, generate ulang kalo rules-nya berubah",
+        "",
+        "import re",
+        "",
+        f"GENERATOR_VERSION = {GENERATED_LEXER_VERSION}",
+        f"RULES_HASH = {digest!r}",
+        "",
+        f"STATE_NAMES = {engine.state_names!r}",
+        f"START = {engine.start}",
+        f"TOKEN_TYPES = {engine.token_types!r}",
+        f"ERROR_MESSAGES = {engine.error_messages!r}",
+        f"STOP_TYPES = {engine.stop_types!r}",
+        f"STOP_TRIMS = {engine.stop_trims!r}",
+        f"STOP_BACKS = {engine.stop_backs!r}",
+        f"FINAL = {tuple(engine.is_final(i) for i in range(engine.n_states))!r}",
+        "",
+    ]
+    for name, value in constants:
+        lines.append(f"{name} = frozenset({sorted(value)!r})")
+    for name, jump in jumps:
+        lines.append(f"{name} = {dict(sorted(jump.items()))!r}")
+    for name, pattern in runs:
+        lines.append(f"{name} = re.compile({pattern!r}).match")
+    lines.append("")
+    lines.append("def scan(text, pos, n):")
+    lines.append("    # sama kayak CompiledDFA.scan tapi transisinya udah di-hardcode")
+    lines.extend(body)
+    if bytes_body is not None:
+        lines.append("")
+        lines.append("def scan_bytes(text, pos, n):")
+        lines.append("    # sama kayak CompiledDFA.scan_bytes, text berupa bytes/mmap UTF-8")
+        lines.extend(bytes_body)
+    lines.append("")
+    return "\n".join(lines)
+
+def generate_lexer(rules_path, output_path=None):
+    # generate module lexer buat rules_path, return path file yang ditulis
+    if output_path is None:
+        output_path = generated_lexer_path(rules_path)
+    dfa = load_rules(rules_path)
+    source = generate_lexer_source(dfa, rules_hash(rules_path), rules_path)
+
+    output_dir = os.path.dirname(output_path)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(output_path, "w", encoding="utf-8") as f:
+        f.write(source)
+    return output_path
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python3 lexer_codegen.py <dfa_rules.json> [output.py]")
+        sys.exit(1)
+
+    output = generate_lexer(sys.argv[1], sys.argv[2] if len(sys.argv) == 3 else None)
+    print(f"Generated lexer saved to: {output}")
@@ -0,0 +1,483 @@
+# parser LL(1) table-driven: tabel parsing di-generate dari file grammar (rules/pascal_s.grammar)
+# - generator: baca grammar, hitung nullable, FIRST, FOLLOW, terus bikin tabel
+#   (nonterminal, lookahead) -> alternatif, konflik dilaporin
+# - driver: parsing pake stack eksplisit (gak rekursif, jadi gak kena recursion limit Python),
+#   parse tree-nya sama persis kayak Parser (recursive descent)
+#
+# konflik di tabel diselesaiin kayak Parser: kalo token kedua bisa ngebedain alternatifnya
+# (misal IDENTIFIER diikuti := atau ( di statement) sel-nya dipecah per token kedua dan
+# alternatif terakhir jadi default (cabang else di Parser), kalo gak bisa alternatif yang
+# ditulis duluan yang menang (misal selain-itu nempel ke jika yang paling deket)
+#
+# cara pake (dari root folder):
+#   python3 src/ll1.py rules/pascal_s.grammar                  # laporan FIRST/FOLLOW/konflik
+#   python3 src/ll1.py rules/pascal_s.grammar <source_file.pas> # parse pake driver LL(1)
+
+import os
+import re
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from parser import NODE_KINDS, Parser
+
+GRAMMAR_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "rules", "pascal_s.grammar")
+
+# penanda akhir input di FOLLOW
+END = "$"
+EPSILON = "ε"
+
+_TERMINAL = re.compile(r"^([A-Z_]+)(?:\((.+)\))?(!?)$")
+
+# operasi di stack driver
+_MATCH, _EXPAND, _CLOSE, _ACTION = range(4)
+
+def _negative_number(parser, children):
+    # minus + NUMBER di deklarasi konstanta -> satu token NUMBER bernilai negatif
+    minus, number = children
+    return [parser.negative_number(minus, number)]
+
+# aksi yang bisa dipasang di alternatif pake @nama: (parser, list anak) -> list anak pengganti
+ACTIONS = {
+    "negative-number": _negative_number,
+}
+
+def terminal_name(terminal):
+    # nama terminal kayak di file grammar: TYPE atau TYPE(value)
+    if isinstance(terminal, tuple):
+        return f"{terminal[0]}({terminal[1]})"
+    return terminal
+
+class Production:
+    # satu alternatif: lhs ::= rhs, rhs isinya nama nonterminal (str) atau terminal
+    # terminal: str TYPE atau tuple (TYPE, value lowercase), keep=False buat terminal X!
+    def __init__(self, index, lhs, rhs, keep, guard, action):
+        self.index = index
+        self.lhs = lhs
+        self.rhs = rhs
+        self.keep = keep
+        self.guard = guard
+        self.action = action
+
+    def __repr__(self):
+        words = [terminal_name(symbol) + ("" if keep else "!") for symbol, keep in zip(self.rhs, self.keep)]
+        return f"{self.lhs} ::= {' '.join(words) or EPSILON}"
+
+class Grammar:
+    def __init__(self, productions, start):
+        self.productions = productions
+        self.start = start
+        self.nonterminals = []
+        self.alternatives = {}
+        for production in productions:
+            if production.lhs not in self.alternatives:
+                self.nonterminals.append(production.lhs)
+                self.alternatives[production.lhs] = []
+            self.alternatives[production.lhs].append(production)
+        for production in productions:
+            for symbol in production.rhs:
+                if self.is_nonterminal(symbol) and symbol not in self.alternatives:
+                    raise ValueError(f"nonterminal {symbol} dipake tapi gak didefinisiin")
+        # terminal TYPE(value) yang ada di grammar, token lain dicari pake TYPE-nya aja
+        self.literals = {symbol for production in productions for symbol in production.rhs + tuple(production.guard or ())
+                         if isinstance(symbol, tuple)}
+
+        self.nullable = self._compute_nullable()
+        self.first = self._compute_first()
+        self.follow = self._compute_follow()
+        self.first2 = self._compute_first2()
+        self.table, self.conflicts = self._build_table()
+
+    def is_nonterminal(self, symbol):
+        return isinstance(symbol, str) and (symbol.startswith("<") or symbol[:1].islower())
+
+    # --- FIRST / FOLLOW ---
+
+    def _compute_nullable(self):
+        nullable = set()
+        changed = True
+        while changed:
+            changed = False
+            for production in self.productions:
+                if production.lhs not in nullable and production.guard is None and all(
+                        symbol in nullable for symbol in production.rhs):
+                    nullable.add(production.lhs)
+                    changed = True
+        return nullable
+
+    def first_of(self, symbols, first=None):
+        # (FIRST barisan simbol, apa barisannya nullable)
+        first = first or self.first
+        result = set()
+        for symbol in symbols:
+            if not self.is_nonterminal(symbol):
+                result.add(symbol)
+                return result, False
+            result |= first[symbol]
+            if symbol not in self.nullable:
+                return result, False
+        return result, True
+
+    def _alternative_first(self, production, first):
+        result, _ = self.first_of(production.rhs, first)
+        if production.guard is not None:
+            result &= production.guard
+        return result
+
+    def _compute_first(self):
+        first = {name: set() for name in self.nonterminals}
+        changed = True
+        while changed:
+            changed = False
+            for production in self.productions:
+                result = self._alternative_first(production, first)
+                if not result <= first[production.lhs]:
+                    first[production.lhs] |= result
+                    changed = True
+        return first
+
+    def _compute_follow(self):
+        follow = {name: set() for name in self.nonterminals}
+        follow[self.start].add(END)
+        changed = True
+        while changed:
+            changed = False
+            for production in self.productions:
+                rhs = production.rhs
+                for i, symbol in enumerate(rhs):
+                    if not self.is_nonterminal(symbol):
+                        continue
+                    result, nullable = self.first_of(rhs[i + 1:])
+                    if nullable:
+                        result |= follow[production.lhs]
+                    if not result <= follow[symbol]:
+                        follow[symbol] |= result
+                        changed = True
+        return follow
+
+    def _compute_first2(self):
+        # FIRST_2: tuple 2 terminal pertama (atau kurang) yang bisa diturunin tiap nonterminal
+        # cuma dipake buat mecah sel tabel yang konflik pake token kedua
+        first2 = {name: set() for name in self.nonterminals}
+        changed = True
+        while changed:
+            changed = False
+            for production in self.productions:
+                result = self._sequence_first2(production.rhs, first2)
+                if production.guard is not None:
+                    result = {prefix for prefix in result if prefix and prefix[0] in production.guard}
+                if not result <= first2[production.lhs]:
+                    first2[production.lhs] |= result
+                    changed = True
+        return first2
+
+    def _sequence_first2(self, symbols, first2):
+        prefixes = {()}
+        for symbol in symbols:
+            if all(len(prefix) == 2 for prefix in prefixes):
+                break
+            options = first2[symbol] if self.is_nonterminal(symbol) else {(symbol,)}
+            prefixes = {(prefix + option)[:2] if len(prefix) < 2 else prefix
+                        for prefix in prefixes for option in options}
+        return prefixes
+
+    # --- tabel ---
+
+    def _matches(self, symbol, terminal):
+        # terminal grammar symbol cocok sama lookahead terminal (TYPE cocok sama TYPE(value))
+        return symbol == terminal or (isinstance(terminal, tuple) and symbol == terminal[0])
+
+    def _build_table(self):
+        cells = {name: {} for name in self.nonterminals}
+        for production in self.productions:
+            predict, nullable = self.first_of(production.rhs)
+            if nullable:
+                predict = predict | self.follow[production.lhs]
+            if production.guard is not None:
+                predict &= production.guard
+            for terminal in predict:
+                cells[production.lhs].setdefault(terminal, []).append(production)
+        # TYPE(value) juga ketemu alternatif yang nerima TYPE apa aja
+        for row in cells.values():
+            for terminal in list(row):
+                if isinstance(terminal, tuple) and terminal[0] in row:
+                    merged = row[terminal] + [p for p in row[terminal[0]] if p not in row[terminal]]
+                    row[terminal] = sorted(merged, key=lambda p: p.index)
+
+        table = {}
+        conflicts = []
+        for name, row in cells.items():
+            table[name] = {}
+            for terminal, candidates in row.items():
+                if len(candidates) == 1:
+                    table[name][terminal] = candidates[0]
+                    continue
+                split = self._split_by_second_token(name, terminal, candidates)
+                if split is not None:
+                    table[name][terminal] = split
+                    conflicts.append((name, terminal, candidates, "second token"))
+                else:
+                    table[name][terminal] = candidates[0]
+                    conflicts.append((name, terminal, candidates, "first alternative"))
+        return table, conflicts
+
+    def _split_by_second_token(self, name, terminal, candidates):
+        # {token kedua: alternatif, None: alternatif default}, None kalo gak bisa dipecah
+        # (ada alternatif yang bisa kosong, atau token kedua-nya tumpang tindih)
+        split = {}
+        for production in candidates:
+            seconds = set()
+            for prefix in self._sequence_first2(production.rhs, self.first2):
+                if not prefix:
+                    return None
+                if not self._matches(prefix[0], terminal):
+                    continue
+                if len(prefix) == 2:
+                    seconds.add(prefix[1])
+                else:
+                    seconds |= self.follow[production.lhs]
+            for second in seconds:
+                for other in split:
+                    if self._matches(other, second) or self._matches(second, other):
+                        return None
+            split.update(dict.fromkeys(seconds, production))
+        split[None] = candidates[-1]
+        return split
+
+    def report(self):
+        lines = []
+        for name in self.nonterminals:
+            first = sorted(map(terminal_name, self.first[name]))
+            follow = sorted(map(terminal_name, self.follow[name]))
+            nullable = " (nullable)" if name in self.nullable else ""
+            lines.append(f"{name}{nullable}")
+            lines.append(f"    FIRST  = {{{', '.join(first)}}}")
+            lines.append(f"    FOLLOW = {{{', '.join(follow)}}}")
+        lines.append("")
+        entries = sum(len(row) for row in self.table.values())
+        lines.append(f"{len(self.nonterminals)} nonterminals, {len(self.productions)} alternatives, {entries} table entries")
+        for name, terminal, candidates, resolution in self.conflicts:
+            lines.append(f"conflict {name} on {terminal_name(terminal)}: resolved by {resolution}")
+            for production in candidates:
+                lines.append(f"    {production!r}")
+        return "\n".join(lines)
+
+def load_grammar(path):
+    # baca file grammar jadi object Grammar (tabel langsung dibikin)
+    productions = []
+    start = None
+    lhs = None
+    with open(path, encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.split("#", 1)[0].strip()
+            if not line:
+                continue
+            if "::=" in line:
+                lhs, body = (part.strip() for part in line.split("::=", 1))
+                if not (lhs.startswith("<") and lhs.endswith(">")) and not lhs[:1].islower():
+                    raise ValueError(f"{path}:{number}: nama nonterminal '{lhs}' gak valid")
+                start = start or lhs
+            elif line.startswith("|") and lhs is not None:
+                body = line[1:]
+            else:
+                raise ValueError(f"{path}:{number}: baris harus '<nama> ::= ...' atau '| ...'")
+            for alternative in body.split("|"):
+                productions.append(_parse_alternative(path, number, len(productions), lhs, alternative))
+    if start is None:
+        raise ValueError(f"{path}: grammar kosong")
+    return Grammar(productions, start)
+
+def _parse_alternative(path, number, index, lhs, text):
+    words = text.split()
+    guard = None
+    action = None
+    if words and words[0].startswith("["):
+        # [A B] di awal: lookahead yang boleh buat alternatif ini
+        end = next((i for i, word in enumerate(words) if word.endswith("]")), None)
+        if end is None:
+            raise ValueError(f"{path}:{number}: '[' tanpa ']'")
+        guard_words = " ".join(words[:end + 1])[1:-1].split()
+        guard = {_parse_terminal(path, number, word)[0] for word in guard_words}
+        words = words[end + 1:]
+    if words and words[-1].startswith("@"):
+        name = words.pop()[1:]
+        if name not in ACTIONS:
+            raise ValueError(f"{path}:{number}: aksi '@{name}' gak dikenal")
+        action = ACTIONS[name]
+    if not words:
+        raise ValueError(f"{path}:{number}: alternatif kosong, tulis {EPSILON}")
+    if words == [EPSILON]:
+        words = []
+    rhs = []
+    keep = []
+    for word in words:
+        if word.startswith("<") or word[:1].islower():
+            rhs.append(word)
+            keep.append(True)
+        else:
+            terminal, kept = _parse_terminal(path, number, word)
+            rhs.append(terminal)
+            keep.append(kept)
+    return Production(index, lhs, tuple(rhs), tuple(keep), guard, action)
+
+def _parse_terminal(path, number, word):
+    match = _TERMINAL.match(word)
+    if not match:
+        raise ValueError(f"{path}:{number}: simbol '{word}' gak dikenal")
+    token_type, value, drop = match.groups()
+    terminal = (token_type, value.lower()) if value is not None else token_type
+    return terminal, not drop
+
+# cache grammar per proses: abspath -> (mtime, size, CompiledGrammar)
+_GRAMMAR_CACHE = {}
+
+def load_compiled_grammar(path=GRAMMAR_PATH):
+    key = os.path.abspath(path)
+    stat = os.stat(path)
+    cached = _GRAMMAR_CACHE.get(key)
+    if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+        return cached[2]
+    compiled = CompiledGrammar(load_grammar(path))
+    _GRAMMAR_CACHE[key] = (stat.st_mtime_ns, stat.st_size, compiled)
+    return compiled
+
+class CompiledGrammar:
+    # tabel dalam bentuk yang siap dipake driver: nonterminal jadi index, tiap alternatif
+    # udah jadi list operasi stack (urutan kebalik, tinggal di-extend ke stack)
+    def __init__(self, grammar):
+        self.grammar = grammar
+        self.literals = frozenset(grammar.literals)
+        index = {name: i for i, name in enumerate(grammar.nonterminals)}
+        self.names = grammar.nonterminals
+        self.start = index[grammar.start]
+        self.kinds = [_node_kind(name) for name in grammar.nonterminals]
+
+        ops = {}
+        for production in grammar.productions:
+            body = []
+            for symbol, keep in zip(production.rhs, production.keep):
+                if grammar.is_nonterminal(symbol):
+                    body.append((_EXPAND, index[symbol]))
+                elif isinstance(symbol, tuple):
+                    body.append((_MATCH, (symbol[0], symbol[1], keep)))
+                else:
+                    body.append((_MATCH, (symbol, None, keep)))
+            body.reverse()
+            ops[production.index] = (production.action, tuple(body))
+
+        self.rows = []
+        for name in grammar.nonterminals:
+            row = {}
+            for terminal, entry in grammar.table[name].items():
+                if isinstance(entry, dict):
+                    row[terminal] = {second: ops[production.index] for second, production in entry.items()}
+                else:
+                    row[terminal] = ops[entry.index]
+            # TYPE(value) yang gak punya sel sendiri ikut sel TYPE, biar driver cukup sekali lookup
+            for literal in self.literals:
+                if literal not in row and literal[0] in row:
+                    row[literal] = row[literal[0]]
+            self.rows.append(row)
+
+    def expected(self, nonterminal):
+        return sorted(terminal_name(terminal) for terminal in self.grammar.table[self.names[nonterminal]])
+
+def _node_kind(name):
+    # kind ParseNode buat nonterminal <...>, None buat nonterminal bantu
+    if not name.startswith("<"):
+        return None
+    if name not in NODE_KINDS:
+        NODE_KINDS.append(name)
+    return NODE_KINDS.index(name)
+
+class LL1Parser(Parser):
+    # parser yang jalanin tabel LL(1) pake stack eksplisit, token handling diwarisin dari Parser
+    def __init__(self, tokens, compress=False, grammar_path=GRAMMAR_PATH):
+        super().__init__(tokens, compress)
+        self.grammar = load_compiled_grammar(grammar_path)
+
+    def lookahead_key(self, token):
+        # terminal tabel buat token: TYPE(value) kalo ada di grammar, selain itu TYPE
+        if token is None:
+            return END
+        literal = (token.type, token.name)
+        return literal if literal in self.grammar.literals else token.type
+
+    def _select(self, nonterminal, key):
+        entry = self.grammar.rows[nonterminal].get(key)
+        if entry is None:
+            expected = ", ".join(self.grammar.expected(nonterminal))
+            if self.current_token is None:
+                self.error(f"Expected one of {expected}, but reached end of input")
+            token = self.current_token
+            self.error(f"unexpected token {token.type}({token.value}), expected one of {expected}")
+        if isinstance(entry, dict):
+            # sel konflik yang dipecah pake token kedua
+            second = self.lookahead_key(self.peek(1))
+            choice = entry.get(second)
+            if choice is None and isinstance(second, tuple):
+                choice = entry.get(second[0])
+            entry = choice if choice is not None else entry[None]
+        return entry
+
+    def parse(self):
+        grammar = self.grammar
+        rows = grammar.rows
+        kinds = grammar.kinds
+        make_node = self.make_node
+        lookahead_key = self.lookahead_key
+        # stack operasi, plus stack list anak buat node <...> yang lagi dibangun
+        stack = [(_EXPAND, grammar.start)]
+        nodes = [[]]
+        # key lookahead cuma berubah tiap token di-match
+        key = lookahead_key(self.current_token)
+        while stack:
+            op, arg = stack.pop()
+            if op == _MATCH:
+                token_type, value, keep = arg
+                token = self.current_token
+                if token is not None and token.type == token_type and (value is None or key == (token_type, value)):
+                    self.advance()
+                else:
+                    token = self.expect(token_type, value)
+                if keep:
+                    nodes[-1].append(token)
+                key = lookahead_key(self.current_token)
+            elif op == _EXPAND:
+                entry = rows[arg].get(key)
+                if entry is None or type(entry) is dict:
+                    entry = self._select(arg, key)
+                action, body = entry
+                kind = kinds[arg]
+                if kind is not None:
+                    nodes.append([])
+                    stack.append((_CLOSE, kind))
+                if action is not None:
+                    stack.append((_ACTION, (action, len(nodes[-1]))))
+                stack.extend(body)
+            elif op == _CLOSE:
+                children = nodes.pop()
+                nodes[-1].append(make_node(arg, tuple(children)))
+            else:
+                action, start = arg
+                children = nodes[-1]
+                children[start:] = action(self, children[start:])
+        return nodes[0][0]
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python3 ll1.py <grammar_file> [source_file.pas]")
+        sys.exit(1)
+
+    if len(sys.argv) == 2:
+        print(load_grammar(sys.argv[1]).report())
+    else:
+        from lexer import tokenize_from_file
+        from tree_printer import print_tree
+
+        tokens = tokenize_from_file("rules/dfa_rules_final.json", sys.argv[2])
+        try:
+            print_tree(LL1Parser(tokens, grammar_path=sys.argv[1]).parse(), is_root=True)
+        except Exception as e:
+            print(f"Error: {e}")
+            sys.exit(1)
@@ -0,0 +1,177 @@
+# lexer paralel buat satu file source yang gede banget
+# source dipotong di newline yang aman (di luar comment dan string literal), tiap potongan
+# di-lex di process terpisah (ProcessPoolExecutor), terus hasilnya disambung lagi
+# hasilnya harus sama persis kayak lexical_analyze, kalo ada yang meragukan (error lexer,
+# sambungan yang gak bersih) fallback ke lexical_analyze biasa
+#
+# cara pake (dari root folder):
+#   python3 src/parallel_lexer.py rules/dfa_rules_final.json <source_file.pas> [workers]
+
+import os
+import re
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lexer import (
+    ARITHMETIC_OPERATORS, KEYWORDS, LOGICAL_OPERATORS, _compound_keyword, _lex_text, _reserved_kinds,
+    lexical_analyze, load_engine, read_source_file
+)
+from token_stream import TOKEN_KINDS, TokenStream, kind_id
+
+# file yang lebih kecil dari ini gak usah diparalel, overhead process-nya lebih gede
+PARALLEL_MIN_SIZE = 1 << 20
+# tiap worker dapet beberapa potongan biar bebannya rata
+CHUNKS_PER_WORKER = 4
+
+# karakter yang mulai comment atau string literal
+_OPENER = re.compile(r"['{]|\(\*")
+_CLOSER = {"'": "'", "{": "}", "(*": "*)"}
+
+def _skip_construct(text, m):
+    # posisi setelah comment/string yang mulai di match m (ujung text kalo gak ditutup)
+    opener = m.group()
+    end = text.find(_CLOSER[opener], m.end())
+    if end < 0:
+        return len(text)
+    return end + len(_CLOSER[opener])
+
+def find_split_points(text, n_chunks):
+    # pre-scan murah: cari newline di luar comment dan string deket tiap target posisi
+    # string literal dianggap dari ' sampe ' berikutnya ('' di dalam string = tutup + buka lagi)
+    n = len(text)
+    points = []
+    pos = 0
+    for i in range(1, n_chunks):
+        target = n * i // n_chunks
+        # lewatin comment/string sampe posisi target, posisi target harus di luar semuanya
+        while True:
+            m = _OPENER.search(text, pos)
+            if m is None or m.start() >= target:
+                break
+            pos = _skip_construct(text, m)
+        pos = max(pos, target)
+        # newline pertama setelah pos yang gak ketutup comment/string baru
+        while pos < n:
+            newline = text.find("\n", pos)
+            if newline < 0:
+                pos = n
+                break
+            m = _OPENER.search(text, pos, newline)
+            if m is None:
+                pos = newline + 1
+                break
+            pos = _skip_construct(text, m)
+        if pos >= n:
+            break
+        if not points or pos > points[-1]:
+            points.append(pos)
+    return points
+
+# engine per worker process, di-load sekali lewat initializer
+_worker_engine = None
+_worker_reserved = None
+
+def _init_worker(dfa_path):
+    global _worker_engine, _worker_reserved
+    _worker_engine = load_engine(dfa_path)
+    _worker_reserved = _reserved_kinds(KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
+
+def _lex_chunk(chunk, base):
+    # lex satu potongan, offset token digeser ke offset absolut di file
+    # return None kalo potongan ini harus di-lex ulang pake lexical_analyze biasa
+    messages = []
+    try:
+        tokens, stopped, reached_end = _lex_text(chunk, _worker_engine, _worker_reserved, messages.append)
+    except Exception:
+        # misal unclosed comment, biar lexical_analyze yang ngasih error aslinya
+        return None
+    if stopped:
+        return None
+    # compound keyword udah di-merge _lex_text, pola-nya gak mungkin tumpang tindih jadi
+    # yang kepotong sambungan aja yang digabung belakangan (_join_chunk)
+    starts = array("I", [start + base for start in tokens.starts])
+    ends = array("I", [end + base for end in tokens.ends])
+    # kode kind bisa beda antar process (kind baru didaftarin pas ketemu), jadi ikut dikirim
+    return tokens.kinds, starts, ends, tokens.overrides, messages, reached_end, list(TOKEN_KINDS)
+
+def _join_chunk(result, chunk):
+    # tempel token satu potongan ke result (source-nya sama), compound keyword yang
+    # kepotong sambungan (2 token kiri + 1 kanan, atau 1 kiri + 2 kanan) digabung di sini
+    skip = 0
+    for back in (2, 1):
+        need = 3 - back
+        if len(result) < back or len(chunk) < need:
+            continue
+        first = len(result) - back
+        window = [result[first + k] for k in range(back)] + [chunk[k] for k in range(need)]
+        merged = _compound_keyword(*window)
+        if merged is None:
+            continue
+        start = result.starts[first]
+        end = chunk.ends[need - 1]
+        del result.kinds[first:]
+        del result.starts[first:]
+        del result.ends[first:]
+        for k in range(first, first + back):
+            result.overrides.pop(k, None)
+        result.append(kind_id("KEYWORD"), start, end, merged)
+        skip = need
+        break
+
+    offset = len(result) - skip
+    result.kinds.extend(chunk.kinds[skip:])
+    result.starts.extend(chunk.starts[skip:])
+    result.ends.extend(chunk.ends[skip:])
+    for index, value in chunk.overrides.items():
+        if index >= skip:
+            result.overrides[index + offset] = value
+
+def parallel_lexical_analyze(text, dfa_path, workers=None, n_chunks=None):
+    # hasilnya sama kayak lexical_analyze(text, load_engine(dfa_path), KEYWORDS, ...)
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(text) < PARALLEL_MIN_SIZE:
+        return _serial(text, dfa_path)
+
+    points = find_split_points(text, n_chunks or workers * CHUNKS_PER_WORKER)
+    bounds = [0] + points + [len(text)]
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(dfa_path,)) as pool:
+        futures = [pool.submit(_lex_chunk, text[a:b], a) for a, b in zip(bounds, bounds[1:])]
+        results = [future.result() for future in futures]
+
+    # potongan yang error, atau yang token terakhirnya nyentuh ujung potongan (berarti
+    # pre-scan-nya kecolongan), bikin hasilnya gak bisa dipercaya -> lex ulang biasa
+    if any(r is None for r in results) or any(r[5] for r in results[:-1]):
+        return _serial(text, dfa_path)
+
+    tokens = TokenStream(text)
+    for kinds, starts, ends, overrides, messages, _, kind_names in results:
+        for message in messages:
+            print(message)
+        remap = [kind_id(name) for name in kind_names]
+        if remap != list(range(len(remap))):
+            kinds = array("H", [remap[kind] for kind in kinds])
+        chunk = TokenStream(text)
+        chunk.kinds, chunk.starts, chunk.ends, chunk.overrides = kinds, starts, ends, overrides
+        _join_chunk(tokens, chunk)
+    return tokens
+
+def _serial(text, dfa_path):
+    return lexical_analyze(text, load_engine(dfa_path), KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
+
+def parallel_tokenize_from_file(dfa_path, source_path, workers=None):
+    # versi paralel tokenize_from_file
+    return parallel_lexical_analyze(read_source_file(source_path), dfa_path, workers)
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python3 parallel_lexer.py <dfa_rules.json> <source_file.pas> [workers]")
+        sys.exit(1)
+
+    workers = int(sys.argv[3]) if len(sys.argv) == 4 else None
+    result = parallel_tokenize_from_file(sys.argv[1], sys.argv[2], workers)
+    for t in result:
+        print(f"{t[0]}({t[1]})")
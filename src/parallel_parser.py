@@ -0,0 +1,225 @@
+# parser paralel buat program gede: prosedur/fungsi level atas di-parse di process terpisah
+# - pre-scan token stream nyari batas tiap prosedur/fungsi level atas (mulai/selesai seimbang,
+#   prosedur/fungsi nested dihitung kayak Parser.skip_block)
+# - tiap worker (ProcessPoolExecutor) dapet TokenStream-nya sekali lewat initializer, task-nya
+#   cuma range index token, hasilnya dikirim balik sebagai array integer (lihat _encode)
+# - process utama nge-parse sisanya (header, deklarasi lain, program utama) sambil worker jalan,
+#   pas sampe di prosedur/fungsi level atas tinggal nempelin hasil worker di <declaration-part>
+# hasilnya harus sama persis kayak Parser.parse(), kalo worker gagal (error sintaks, batasnya
+# gak pas) prosedur/fungsi itu di-parse biasa di process utama, jadi error-nya juga sama
+#
+# cara pake (dari root folder):
+#   python3 src/parallel_parser.py rules/dfa_rules_final.json <source_file.pas> [workers]
+
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from parser import _CHAINS, ParseNode, Parser, Token, UnitChainNode
+from token_stream import KIND_IDS, WORD_IDS
+
+# program yang lebih kecil dari ini gak usah diparalel, overhead process-nya lebih gede
+PARALLEL_MIN_TOKENS = 1 << 15
+# tiap worker dapet beberapa batch prosedur/fungsi biar bebannya rata
+BATCHES_PER_WORKER = 4
+
+# kode di array hasil _encode (postfix, anak-anak dulu baru node-nya): token = index token relatif
+# ke awal prosedur/fungsi (>= 0), node = -(id chain + 2) lalu jumlah anak, NUMBER negatif hasil
+# gabungan minus + angka = -1 lalu index minus. id chain = index di tabel chain per batch
+_NEGATIVE_NUMBER = -1
+
+def find_subprogram_bounds(tokens):
+    # [(start, end)] range index token tiap prosedur/fungsi level atas, dari keyword
+    # prosedur/fungsi sampe titik koma setelah selesai body-nya. berhenti di mulai program utama
+    keyword = KIND_IDS["KEYWORD"]
+    semicolon = KIND_IDS["SEMICOLON"]
+    mulai, selesai = WORD_IDS["mulai"], WORD_IDS["selesai"]
+    subprogram = (WORD_IDS["prosedur"], WORD_IDS["fungsi"])
+    kinds = tokens.kinds
+    words = tokens.words(0, len(kinds))
+    bounds = []
+    start = None
+    pending = 0
+    depth = 0
+    for i in range(len(kinds)):
+        if kinds[i] != keyword:
+            continue
+        word = words[i]
+        if word == mulai:
+            if depth == 0 and pending == 0:
+                break
+            depth += 1
+        elif word == selesai:
+            depth -= 1
+            if depth < 0:
+                break
+            if depth == 0:
+                # body satu prosedur/fungsi (level atas atau nested) ketutup
+                pending -= 1
+                if pending == 0:
+                    if i + 1 >= len(kinds) or kinds[i + 1] != semicolon:
+                        break
+                    bounds.append((start, i + 2))
+        elif word in subprogram and depth == 0:
+            if pending == 0:
+                start = i
+            pending += 1
+    return bounds
+
+# TokenStream per worker process, dikirim sekali lewat initializer
+_worker_tokens = None
+_worker_compress = False
+
+def _init_worker(tokens, compress):
+    global _worker_tokens, _worker_compress
+    _worker_tokens = tokens
+    _worker_compress = compress
+
+def _parse_batch(bounds):
+    # (tabel chain, [kode tiap prosedur/fungsi]), kodenya None kalo gagal atau gak berhenti pas
+    # di ujungnya
+    tokens = _worker_tokens
+    chain_ids = {}
+    results = []
+    for start, end in bounds:
+        parser = Parser(tokens, _worker_compress, start=start)
+        try:
+            node = parser.parse_subprogram_declaration()
+        except Exception:
+            results.append(None)
+            continue
+        if parser.pos != end:
+            results.append(None)
+            continue
+        results.append(_encode(node, tokens, start, end, chain_ids))
+    return list(chain_ids), results
+
+def _encode(node, tokens, start, end, chain_ids):
+    # iteratif: node dikunjungi sebelum anaknya (anak terakhir duluan), urutan kodenya dibalik
+    # di akhir jadi postfix. kode node/NUMBER negatif ditulis kebalik juga
+    index_of = {tokens.offset(i): i - start for i in range(start, end)}
+    codes = []
+    emit = codes.append
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ParseNode):
+            emit(len(node.children))
+            emit(-chain_ids.setdefault(node.chain, len(chain_ids)) - 2)
+            stack.extend(node.children)
+            continue
+        index = index_of[node.offset]
+        emit(index)
+        if node.type != tokens.type(start + index):
+            # konstanta negatif: token NUMBER baru yang offset-nya offset minus
+            emit(_NEGATIVE_NUMBER)
+    codes.reverse()
+    return array("i", codes)
+
+def _token_range(tokens, start, end):
+    # object Token buat index [start, end) sekaligus, jauh lebih cepet daripada satu-satu lewat
+    # tokens.type/value/offset (ini yang paling makan waktu di process utama)
+    return list(map(Token, tokens.types(start, end), tokens.values(start, end), tokens.offsets(start, end),
+                    repeat(tokens.source_map), tokens.words(start, end), tokens.names(start, end)))
+
+def _decoder(tokens):
+    source_map = tokens.source_map
+
+    def decode(chains, codes, start, end):
+        # kebalikan _encode, token dibikin ulang dari TokenStream process utama
+        token = _token_range(tokens, start, end)
+        makers = []
+        for chain in chains:
+            if len(chain) == 1:
+                makers.append((ParseNode, chain[0]))
+            else:
+                makers.append((UnitChainNode, _CHAINS.setdefault(chain, chain)))
+        stack = []
+        push = stack.append
+        codes = iter(codes)
+        next_code = codes.__next__
+        for code in codes:
+            if code >= 0:
+                push(token[code])
+            elif code == _NEGATIVE_NUMBER:
+                minus = next_code()
+                push(Token("NUMBER", "-" + token[minus + 1].value, token[minus].offset, source_map))
+            else:
+                count = next_code()
+                if count:
+                    children = tuple(stack[-count:])
+                    del stack[-count:]
+                else:
+                    children = ()
+                make, arg = makers[-code - 2]
+                push(make(arg, children))
+        return stack[0]
+
+    return decode
+
+class _JoiningParser(Parser):
+    # Parser biasa, cuma prosedur/fungsi level atas yang udah di-parse worker diambil hasilnya
+    def __init__(self, tokens, compress, pending):
+        super().__init__(tokens, compress)
+        # index token awal -> (future batch, posisi di batch, index token akhir)
+        self.pending = pending
+        self.decode = _decoder(tokens)
+
+    def parse_subprogram_declaration(self):
+        entry = self.pending.pop(self.pos, None)
+        if entry is None:
+            return super().parse_subprogram_declaration()
+        future, k, end = entry
+        chains, results = future.result()
+        if results[k] is None:
+            return super().parse_subprogram_declaration()
+        node = self.decode(chains, results[k], self.pos, end)
+        self._seek(end)
+        return node
+
+    def _seek(self, index):
+        # lompat ke token ke-index (token sebelumnya udah diwakilin hasil worker)
+        self._token_iter = self._iter_tokens(self.tokens, index)
+        self._lookahead.clear()
+        self.pos = index
+        tokens = self.tokens
+        self.last_token = Token(tokens.type(index - 1), tokens.value(index - 1), tokens.offset(index - 1), self.source_map)
+        self.current_token = self.peek(0)
+
+def parallel_parse(tokens, workers=None, compress=False):
+    # hasilnya sama kayak Parser(tokens, compress).parse(), tokens: TokenStream
+    if workers is None:
+        workers = os.cpu_count() or 1
+    bounds = find_subprogram_bounds(tokens) if workers > 1 and len(tokens) >= PARALLEL_MIN_TOKENS else []
+    if len(bounds) < 2:
+        return Parser(tokens, compress).parse()
+
+    n_batches = min(len(bounds), workers * BATCHES_PER_WORKER)
+    batches = [bounds[len(bounds) * b // n_batches:len(bounds) * (b + 1) // n_batches] for b in range(n_batches)]
+    with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(tokens, compress)) as pool:
+        pending = {}
+        for batch in batches:
+            future = pool.submit(_parse_batch, batch)
+            for k, (start, end) in enumerate(batch):
+                pending[start] = (future, k, end)
+        return _JoiningParser(tokens, compress, pending).parse()
+
+if __name__ == "__main__":
+    if len(sys.argv) not in (3, 4):
+        print("Usage: python3 parallel_parser.py <dfa_rules.json> <source_file.pas> [workers]")
+        sys.exit(1)
+
+    from lexer import tokenize_from_file
+    from tree_printer import print_tree
+
+    workers = int(sys.argv[3]) if len(sys.argv) == 4 else None
+    tokens = tokenize_from_file(sys.argv[1], sys.argv[2])
+    try:
+        print_tree(parallel_parse(tokens, workers), is_root=True)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
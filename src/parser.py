@@ -1,39 +1,353 @@
 # parser untuk pascal-s dengan bahasa indonesia
 # pake recursive descent buat parsing token jadi parse tree
 
+from collections import deque
+from itertools import repeat
+
+from token_stream import NO_WORD, NO_WORD_KINDS, WORD_IDS, WORDS, TokenStream, fold_name, word_id
+
+# nonterminal parse tree, index-nya jadi kode integer di ParseNode.kind
+NODE_KINDS = [
+    "<program>", "<program-header>", "<declaration-part>", "<const-declaration>",
+    "<type-declaration>", "<var-declaration>", "<identifier-list>", "<type>", "<array-type>",
+    "<range>", "<procedure-declaration>", "<function-declaration>", "<formal-parameter-list>",
+    "<parameter-group>", "<block>", "<compound-statement>", "<statement-list>",
+    "<empty-statement>", "<assignment-statement>", "<if-statement>", "<while-statement>",
+    "<for-statement>", "<repeat-statement>", "<procedure/function-call>", "<parameter-list>",
+    "<expression>", "<simple-expression>", "<term>", "<factor>", "<function-call>", "<error>",
+]
+(PROGRAM, PROGRAM_HEADER, DECLARATION_PART, CONST_DECLARATION,
+ TYPE_DECLARATION, VAR_DECLARATION, IDENTIFIER_LIST, TYPE, ARRAY_TYPE,
+ RANGE, PROCEDURE_DECLARATION, FUNCTION_DECLARATION, FORMAL_PARAMETER_LIST,
+ PARAMETER_GROUP, BLOCK, COMPOUND_STATEMENT, STATEMENT_LIST,
+ EMPTY_STATEMENT, ASSIGNMENT_STATEMENT, IF_STATEMENT, WHILE_STATEMENT,
+ FOR_STATEMENT, REPEAT_STATEMENT, PROCEDURE_CALL, PARAMETER_LIST,
+ EXPRESSION, SIMPLE_EXPRESSION, TERM, FACTOR, FUNCTION_CALL, ERROR) = range(len(NODE_KINDS))
+
+# keyword awal deklarasi
+DECLARATION_KEYWORDS = frozenset(("konstanta", "tipe", "variabel", "prosedur", "fungsi"))
+# titik sinkronisasi panic mode (mode recover), ; dan DOT ditulis pake simbolnya
+STATEMENT_SYNC = DECLARATION_KEYWORDS | {";", "selesai", "sampai", "."}
+DECLARATION_SYNC = DECLARATION_KEYWORDS | {";", "mulai", "."}
+PROGRAM_SYNC = frozenset((".",))
+# titik sinkron yang cuma berlaku di luar mulai..selesai / ulangi..sampai yang lagi dilewatin
+_NESTED_SYNC = frozenset((";", "mulai", "selesai", "sampai"))
+
+# node parse tree: kind nonterminal (integer) + tuple children (ParseNode atau Token)
+# pake __slots__ biar gak ada __dict__ per node, parse tree program gede bisa jutaan node
+class ParseNode:
+    __slots__ = ("kind", "children")
+
+    def __init__(self, kind, children):
+        self.kind = kind
+        self.children = children
+
+    @property
+    def type(self):
+        # nama nonterminal, misal "<factor>"
+        return NODE_KINDS[self.kind]
+
+    @property
+    def chain(self):
+        # rantai nonterminal dari node ini ke bawah (lihat UnitChainNode)
+        return (self.kind,)
+
+    def __repr__(self):
+        return f"{NODE_KINDS[self.kind]}{list(self.children)}"
+
+# node hasil pemadatan unit production (mode compress): rantai node yang anaknya cuma satu
+# nonterminal, misal <expression> -> <simple-expression> -> <term> -> <factor> -> NUMBER,
+# disimpen jadi satu node. chain = kind dari atas ke bawah (kind = chain[0]), children = anak
+# node paling bawah. tuple chain yang sama dipake bareng, jadi per node cuma nambah 1 slot
+class UnitChainNode(ParseNode):
+    __slots__ = ("chain",)
+
+    def __init__(self, chain, children):
+        self.kind = chain[0]
+        self.chain = chain
+        self.children = children
+
+    def __repr__(self):
+        return f"{'/'.join(NODE_KINDS[kind] for kind in self.chain)}{list(self.children)}"
+
+# tuple chain yang udah pernah dibikin, biar chain yang sama gak disimpen berkali-kali
+_CHAINS = {}
+
+def compress_node(kind, children):
+    # bikin node, kalo anaknya cuma satu nonterminal langsung digabung jadi UnitChainNode
+    if len(children) == 1:
+        child = children[0]
+        if isinstance(child, ParseNode):
+            chain = (kind,) + child.chain
+            return UnitChainNode(_CHAINS.setdefault(chain, chain), child.children)
+    return ParseNode(kind, children)
+
+def expand_unit_chains(node):
+    # balikin parse tree hasil mode compress jadi parse tree biasa (node per nonterminal)
+    if not isinstance(node, ParseNode):
+        return node
+    children = tuple(expand_unit_chains(child) for child in node.children)
+    chain = node.chain
+    for kind in reversed(chain[1:]):
+        children = (ParseNode(kind, children),)
+    return ParseNode(chain[0], children)
+
+# <block> prosedur/fungsi yang dilewatin di mode lazy: yang disimpen cuma range token-nya
+# (tokens[start:end], position = posisi token pertama di input asli), children baru di-parse
+# pas pertama kali diakses. blok nested di dalemnya juga lazy
+class LazyBlockNode(ParseNode):
+    __slots__ = ("tokens", "start", "end", "position", "compress", "_children")
+
+    def __init__(self, tokens, start, end, position, compress):
+        self.kind = BLOCK
+        self.tokens = tokens
+        self.start = start
+        self.end = end
+        self.position = position
+        self.compress = compress
+        self._children = None
+
+    @property
+    def parsed(self):
+        return self._children is not None
+
+    @property
+    def children(self):
+        if self._children is None:
+            self._children = self._parse()
+        return self._children
+
+    def _parse(self):
+        # error sintaks di body baru ketauan di sini, posisinya tetep posisi di input asli
+        try:
+            return self._parse_with(lazy=True)
+        except ParseError:
+            # body nested yang rusak bikin batas skip_block-nya meleset, error-nya jadi beda
+            # tempat. di-parse ulang eager biar error-nya sama kayak parser biasa
+            return self._parse_with(lazy=False)
+
+    def _parse_with(self, lazy):
+        parser = Parser(self.tokens, self.compress, lazy=lazy, start=self.start, position=self.position)
+        block = parser.parse_block()
+        if parser.pos != self.position + self.end - self.start:
+            token = parser.current_token
+            parser.error(f"unexpected token {token.type}({token.value}), expected end of block")
+        return block.children
+
+# node <error> di parse tree mode recover: bagian yang gagal di-parse diganti node ini,
+# children = token yang dilewatin pas sinkronisasi, error = ParseError-nya. cuma muncul
+# langsung di bawah <program>, <const-declaration>, <type-declaration>, <var-declaration>,
+# <procedure-declaration>, <function-declaration>, dan <statement-list>
+class ErrorNode(ParseNode):
+    __slots__ = ("error",)
+
+    def __init__(self, error, children):
+        self.kind = ERROR
+        self.children = children
+        self.error = error
+
+# error sintaks, position = posisi token tempat error, token = token-nya (None kalo input kosong)
+class ParseError(Exception):
+    def __init__(self, message, position, token):
+        super().__init__(message)
+        self.position = position
+        self.token = token
+
 # class buat nampung token supaya lebih gampang dipake
 class Token:
-    def __init__(self, token_type, value):
+    __slots__ = ("type", "value", "offset", "source_map", "word", "name")
+
+    def __init__(self, token_type, value, offset=None, source_map=None, word=None, name=None):
         self.type = token_type
         self.value = value
+        # offset karakter di source, line/column baru dihitung kalo diminta
+        self.offset = offset
+        self.source_map = source_map
+        # word ID reserved word / simbol (lihat token_stream.WORDS) dan nama versi case-fold yang
+        # udah di-intern (literal: value aslinya), dari TokenStream.words/names kalo ada
+        if word is None:
+            word = NO_WORD if token_type in NO_WORD_KINDS else word_id(value)
+        self.word = word
+        if name is None:
+            if word != NO_WORD:
+                name = WORDS[word]
+            elif token_type == "IDENTIFIER":
+                name = fold_name(value)
+            else:
+                name = value
+        self.name = name
+
+    def line_col(self):
+        if self.offset is None or self.source_map is None:
+            return None, None
+        return self.source_map.line_col(self.offset)
+
+    @property
+    def line(self):
+        return self.line_col()[0]
+
+    @property
+    def column(self):
+        return self.line_col()[1]
 
     def __repr__(self):
         return f"{self.type}({self.value})"
 
+# jumlah Token yang dibikin sekaligus dari TokenStream
+TOKEN_BATCH = 4096
+
 # parser utama pake recursive descent
 class Parser:
-    def __init__(self, tokens):
-        # convert tuple dari lexer jadi object Token
-        self.tokens = [Token(t[0], t[1]) for t in tokens]
-        self.pos = 0
-        self.current_token = self.tokens[0] if self.tokens else None
+    def __init__(self, tokens, compress=False, lazy=False, start=0, position=None, recover=False):
+        # tokens bisa TokenStream dari lexer, LexerStream (mode streaming), atau list of tuple
+        # (type, value) / (type, value, offset). token dibaca satu-satu lewat iterator, yang
+        # disimpen cuma lookahead di ring buffer, jadi parsing bisa jalan sambil lexer jalan
+        # compress=True: unit production dipadatin jadi UnitChainNode (hasil print-nya tetep sama)
+        # lazy=True: body prosedur/fungsi dilewatin jadi LazyBlockNode, di-parse pas diakses
+        # start: mulai dari token ke-start (TokenStream/list/tuple), position: posisi token itu
+        # di input asli buat pesan error (default start). dua-duanya dipake LazyBlockNode
+        # recover=True: error sintaks gak langsung dilempar tapi dicatet di self.errors, parsing
+        # lanjut dari titik sinkron berikutnya (panic mode), hasilnya parse tree parsial dengan
+        # ErrorNode di bagian yang gagal. body lazy tetep di-parse tanpa recover
+        self.tokens = tokens
+        self.compress = compress
+        self.lazy = lazy
+        self.make_node = compress_node if compress else ParseNode
+        self.parse_body = self.skip_block if lazy else self.parse_block
+        self.recover = recover
+        self.errors = []
+        self.parse_list_statement = self.recover_statement if recover else self.parse_statement
+        self.source_map = getattr(tokens, "source_map", None)
+        self._token_iter = self._iter_tokens(tokens, start)
+        # ring buffer lookahead: [0] = current token, [1] = hasil peek(1)
+        self._lookahead = deque()
+        self.pos = start if position is None else position
+        # selisih index di tokens sama pos
+        self._index_shift = start - self.pos
+        self.last_token = None
+        self.current_token = self.peek(0)
+
+    def _iter_tokens(self, tokens, start=0):
+        # ubah input apa aja jadi iterator object Token
+        source_map = self.source_map
+        if isinstance(tokens, TokenStream):
+            # dibikin per potongan dari slice types/values/offsets, bukan type()/value()/offset()
+            # per index (yang tiap kali cek override + geseran offset). potongannya mulai kecil
+            # terus dobel, biar parse body lazy / unit incremental gak bikin token kebanyakan
+            end = len(tokens)
+            size = 64
+            while start < end:
+                last = min(start + size, end)
+                yield from map(Token, tokens.types(start, last), tokens.values(start, last),
+                               tokens.offsets(start, last), repeat(source_map), tokens.words(start, last),
+                               tokens.names(start, last))
+                start = last
+                size = min(size * 2, TOKEN_BATCH)
+            return
+        if start:
+            tokens = map(tokens.__getitem__, range(start, len(tokens)))
+        for t in tokens:
+            if type(t) is Token:
+                # token body lazy yang dikumpulin dari input streaming
+                yield t
+            elif len(t) > 2:
+                yield Token(t[0], t[1], t[2], source_map)
+            else:
+                yield Token(t[0], t[1])
 
     def error(self, message):
-        # throw error dengan posisi token sekarang
-        raise Exception(f"Syntax error at position {self.pos}: {message}")
+        # throw error dengan posisi token sekarang (plus line/column kalo ada)
+        raise self.syntax_error(message)
+
+    def syntax_error(self, message):
+        location = ""
+        # kalo udah habis input, tunjuk token terakhir
+        token = self.current_token or self.last_token
+        if token is not None:
+            line, column = token.line_col()
+            if line is not None:
+                location = f" (line {line}, column {column})"
+        return ParseError(f"Syntax error at position {self.pos}{location}: {message}", self.pos, token)
+
+    def record(self, error):
+        # mode recover: catet error, kecuali posisinya gak maju dari error sebelumnya (error
+        # lanjutan dari titik yang sama pas naik ke titik recovery di atasnya)
+        if not self.errors or error.position > self.errors[-1].position:
+            self.errors.append(error)
+
+    def synchronize(self, stop):
+        # panic mode: lewatin token sampe ketemu token sinkron di stop (gak di-consume), return
+        # token yang dilewatin. mulai..selesai / ulangi..sampai yang kelewat dilewatin utuh
+        skipped = []
+        depth = 0
+        while self.current_token is not None:
+            token = self.current_token
+            if token.type == "KEYWORD":
+                key = token.name
+            elif token.type == "SEMICOLON":
+                key = ";"
+            elif token.type == "DOT":
+                key = "."
+            else:
+                key = None
+            if key in stop and (depth == 0 or key not in _NESTED_SYNC):
+                break
+            if key == "mulai" or key == "ulangi":
+                depth += 1
+            elif (key == "selesai" or key == "sampai") and depth > 0:
+                depth -= 1
+            skipped.append(token)
+            self.advance()
+        return skipped
+
+    def recover_from(self, error, stop):
+        # catet error terus sinkronisasi, token yang dilewatin jadi ErrorNode
+        self.record(error)
+        return ErrorNode(error, tuple(self.synchronize(stop)))
+
+    def recover_statement(self):
+        # parse_statement versi mode recover: statement yang gagal jadi ErrorNode, sinkron di
+        # ; selesai sampai (atau keyword deklarasi/DOT kalo blok-nya gak ketutup)
+        try:
+            return self.parse_statement()
+        except ParseError as error:
+            return self.recover_from(error, STATEMENT_SYNC)
+
+    def recovering(self, children, parse, *args, stop=DECLARATION_SYNC):
+        # parse(*args), hasilnya (kalo bukan None) ditambahin ke children. mode recover: kalo
+        # gagal, anak yang udah masuk children tetep, sisanya sampe titik sinkron jadi ErrorNode
+        # (; yang jadi titik sinkron ikut dilewatin, item deklarasi selalu diakhirin ;)
+        if not self.recover:
+            result = parse(*args)
+            if result is not None:
+                children.append(result)
+            return
+        try:
+            result = parse(*args)
+            if result is not None:
+                children.append(result)
+        except ParseError as error:
+            node = self.recover_from(error, stop)
+            if self.match("SEMICOLON"):
+                node.children += (self.expect("SEMICOLON"),)
+            children.append(node)
 
     def peek(self, offset=0):
-        # liat token ke depan tanpa advance posisi
-        index = self.pos + offset
-        if index < len(self.tokens):
-            return self.tokens[index]
-        return None
+        # liat token ke depan tanpa advance posisi (None kalo udah habis)
+        lookahead = self._lookahead
+        while len(lookahead) <= offset:
+            token = next(self._token_iter, None)
+            if token is None:
+                return None
+            lookahead.append(token)
+        return lookahead[offset]
 
     def advance(self):
         # maju ke token selanjutnya
-        if self.pos < len(self.tokens):
+        if self.current_token is not None:
+            self.last_token = self._lookahead.popleft()
             self.pos += 1
-            self.current_token = self.tokens[self.pos] if self.pos < len(self.tokens) else None
+            self.current_token = self.peek(0)
         return self.current_token
 
     def expect(self, token_type, value=None):
@@ -43,7 +357,7 @@ class Parser:
         if self.current_token.type != token_type:
             expected_str = f"{token_type}({self.get_expected_value(token_type)})"
             self.error(f"unexpected token {self.current_token.type}({self.current_token.value}), expected {expected_str}")
-        if value and self.current_token.value.lower() != value.lower():
+        if value and self.current_token.word != WORD_IDS[value]:
             self.error(f"unexpected token {self.current_token.value}, expected {value}")
         token = self.current_token
         self.advance()
@@ -71,184 +385,231 @@ class Parser:
             return False
         if self.current_token.type != token_type:
             return False
-        if value and self.current_token.value.lower() != value.lower():
+        if value and self.current_token.word != WORD_IDS[value]:
             return False
         return True
 
     def parse(self):
         # entry point parsing, mulai dari <program>
-        return self.parse_program()
+        if not self.lazy or not isinstance(self.tokens, (TokenStream, list, tuple)):
+            return self.parse_program()
+        # mode lazy: kalo input-nya rusak, batas body yang dilewatin skip_block bisa meleset
+        # dan error-nya muncul di tempat lain (misal expected DOT di level atas). input yang
+        # gagal di-parse ulang eager dari awal, jadi error-nya sama kayak parser biasa.
+        # input streaming gak bisa dibaca ulang, error-nya tetep error versi lazy
+        start = self.pos + self._index_shift
+        position = self.pos
+        try:
+            tree = self.parse_program()
+            if not self.errors:
+                return tree
+        except ParseError:
+            pass
+        eager = Parser(self.tokens, self.compress, start=start, position=position, recover=self.recover)
+        tree = eager.parse_program()
+        self.errors = eager.errors
+        return tree
 
     # grammar: <program> ::= <program-header> <declaration-part> <compound-statement> .
     def parse_program(self):
-        node = {"type": "<program>", "children": []}
-        node["children"].append(self.parse_program_header())
-        node["children"].append(self.parse_declaration_part())
-        node["children"].append(self.parse_compound_statement())
-        node["children"].append(self.expect("DOT"))
-        return node
+        children = []
+        self.recovering(children, self.parse_program_header)
+        children.append(self.parse_declaration_part())
+        # mode recover: program utama yang gagal dilewatin sampe titik akhir program
+        self.recovering(children, self.parse_compound_statement, stop=PROGRAM_SYNC)
+        self.recovering(children, self.expect, "DOT", stop=PROGRAM_SYNC)
+        return self.make_node(PROGRAM, tuple(children))
 
     # grammar: <program-header> ::= program <identifier> ;
     def parse_program_header(self):
-        node = {"type": "<program-header>", "children": []}
-        node["children"].append(self.expect("KEYWORD", "program"))
-        node["children"].append(self.expect("IDENTIFIER"))
-        node["children"].append(self.expect("SEMICOLON"))
-        return node
+        return self.make_node(PROGRAM_HEADER, (
+            self.expect("KEYWORD", "program"),
+            self.expect("IDENTIFIER"),
+            self.expect("SEMICOLON"),
+        ))
 
     # parse bagian deklarasi (konstanta, tipe, variabel, prosedur/fungsi)
     def parse_declaration_part(self):
-        node = {"type": "<declaration-part>", "children": []}
+        children = []
 
         # parse semua deklarasi konstanta kalo ada
         while self.match("KEYWORD", "konstanta"):
-            node["children"].append(self.parse_const_declaration())
+            children.append(self.parse_const_declaration())
 
         # parse semua deklarasi tipe kalo ada
         while self.match("KEYWORD", "tipe"):
-            node["children"].append(self.parse_type_declaration())
+            children.append(self.parse_type_declaration())
 
         # parse semua deklarasi variabel kalo ada
         while self.match("KEYWORD", "variabel"):
-            node["children"].append(self.parse_var_declaration())
+            children.append(self.parse_var_declaration())
 
         # parse semua prosedur/fungsi kalo ada
         while self.match("KEYWORD", "prosedur") or self.match("KEYWORD", "fungsi"):
-            node["children"].append(self.parse_subprogram_declaration())
+            children.append(self.parse_subprogram_declaration())
+
+        # mode recover: deklarasi yang urutannya salah dicatet error-nya (sama kayak error
+        # tanpa recover), tapi tetep di-parse
+        while self.recover and self.match("KEYWORD") and self.current_token.name in DECLARATION_KEYWORDS:
+            word = self.current_token.name
+            self.record(self.syntax_error(f"unexpected token {self.current_token.value}, expected mulai"))
+            if word == "konstanta":
+                children.append(self.parse_const_declaration())
+            elif word == "tipe":
+                children.append(self.parse_type_declaration())
+            elif word == "variabel":
+                children.append(self.parse_var_declaration())
+            else:
+                children.append(self.parse_subprogram_declaration())
 
-        return node
+        return self.make_node(DECLARATION_PART, tuple(children))
 
     # parse deklarasi konstanta
     def parse_const_declaration(self):
-        node = {"type": "<const-declaration>", "children": []}
-        node["children"].append(self.expect("KEYWORD", "konstanta"))
+        children = []
+        children.append(self.expect("KEYWORD", "konstanta"))
 
         while True:
-            node["children"].append(self.expect("IDENTIFIER"))
-            node["children"].append(self.expect("RELATIONAL_OPERATOR", "="))
+            self.recovering(children, self.parse_const_item, children)
 
-            # value bisa number, char, string, atau identifier lain
-            # handle negative numbers (bisa ADDITIVE_OPERATOR atau ARITHMETIC_OPERATOR)
-            if self.match("ARITHMETIC_OPERATOR", "-") or self.match("ADDITIVE_OPERATOR", "-"):
-                self.advance()
-                if self.match("NUMBER"):
-                    # combine minus with number
-                    num_token = self.current_token
-                    combined_token = Token("NUMBER", "-" + num_token.value)
-                    node["children"].append(combined_token)
-                    self.advance()
-                else:
-                    self.error("Expected number after minus sign")
-            elif self.match("ARITHMETIC_OPERATOR", "+") or self.match("ADDITIVE_OPERATOR", "+"):
-                # handle unary plus (just skip it)
+            # kalo gak ada identifier lagi berarti udah selesai
+            if not self.match("IDENTIFIER"):
+                break
+
+        return self.make_node(CONST_DECLARATION, tuple(children))
+
+    # parse satu konstanta (nama = value ;), anaknya langsung ditambahin ke children
+    def parse_const_item(self, children):
+        children.append(self.expect("IDENTIFIER"))
+        children.append(self.expect("RELATIONAL_OPERATOR", "="))
+
+        # value bisa number, char, string, atau identifier lain
+        # handle negative numbers (bisa ADDITIVE_OPERATOR atau ARITHMETIC_OPERATOR)
+        if self.match("ARITHMETIC_OPERATOR", "-") or self.match("ADDITIVE_OPERATOR", "-"):
+            minus_token = self.current_token
+            self.advance()
+            if self.match("NUMBER"):
+                # combine minus with number
+                children.append(self.negative_number(minus_token, self.current_token))
                 self.advance()
-                if self.match("NUMBER"):
-                    node["children"].append(self.current_token)
-                    self.advance()
-                else:
-                    self.error("Expected number after plus sign")
-            elif self.match("NUMBER") or self.match("CHAR_LITERAL") or self.match("STRING_LITERAL"):
-                node["children"].append(self.current_token)
+            else:
+                self.error("Expected number after minus sign")
+        elif self.match("ARITHMETIC_OPERATOR", "+") or self.match("ADDITIVE_OPERATOR", "+"):
+            # handle unary plus (just skip it)
+            self.advance()
+            if self.match("NUMBER"):
+                children.append(self.current_token)
                 self.advance()
-            elif self.match("IDENTIFIER"):
-                node["children"].append(self.expect("IDENTIFIER"))
             else:
-                self.error("Expected constant value")
-
-            node["children"].append(self.expect("SEMICOLON"))
+                self.error("Expected number after plus sign")
+        elif self.match("NUMBER") or self.match("CHAR_LITERAL") or self.match("STRING_LITERAL"):
+            children.append(self.current_token)
+            self.advance()
+        elif self.match("IDENTIFIER"):
+            children.append(self.expect("IDENTIFIER"))
+        else:
+            self.error("Expected constant value")
 
-            # kalo gak ada identifier lagi berarti udah selesai
-            if not self.match("IDENTIFIER"):
-                break
+        children.append(self.expect("SEMICOLON"))
 
-        return node
+    # token NUMBER baru hasil gabungan minus + angka, offset-nya offset minus
+    def negative_number(self, minus_token, number_token):
+        return Token("NUMBER", "-" + number_token.value, minus_token.offset, minus_token.source_map)
 
     # parse deklarasi tipe
     def parse_type_declaration(self):
-        node = {"type": "<type-declaration>", "children": []}
-        node["children"].append(self.expect("KEYWORD", "tipe"))
+        children = []
+        children.append(self.expect("KEYWORD", "tipe"))
 
         while True:
-            node["children"].append(self.expect("IDENTIFIER"))
-            node["children"].append(self.expect("RELATIONAL_OPERATOR", "="))
-            node["children"].append(self.parse_type())
-            node["children"].append(self.expect("SEMICOLON"))
+            self.recovering(children, self.parse_type_item, children)
 
             if not self.match("IDENTIFIER"):
                 break
 
-        return node
+        return self.make_node(TYPE_DECLARATION, tuple(children))
+
+    # parse satu deklarasi tipe (nama = tipe ;)
+    def parse_type_item(self, children):
+        children.append(self.expect("IDENTIFIER"))
+        children.append(self.expect("RELATIONAL_OPERATOR", "="))
+        children.append(self.parse_type())
+        children.append(self.expect("SEMICOLON"))
 
     # parse deklarasi variabel
     def parse_var_declaration(self):
-        node = {"type": "<var-declaration>", "children": []}
-        node["children"].append(self.expect("KEYWORD", "variabel"))
+        children = []
+        children.append(self.expect("KEYWORD", "variabel"))
 
         while True:
-            node["children"].append(self.parse_identifier_list())
-            node["children"].append(self.expect("COLON"))
-            node["children"].append(self.parse_type())
-            node["children"].append(self.expect("SEMICOLON"))
+            self.recovering(children, self.parse_var_item, children)
 
             if not self.match("IDENTIFIER"):
                 break
 
-        return node
+        return self.make_node(VAR_DECLARATION, tuple(children))
+
+    # parse satu deklarasi variabel (x, y: tipe ;)
+    def parse_var_item(self, children):
+        children.append(self.parse_identifier_list())
+        children.append(self.expect("COLON"))
+        children.append(self.parse_type())
+        children.append(self.expect("SEMICOLON"))
 
     # parse list identifier yang dipisah koma (misal: x, y, z)
     def parse_identifier_list(self):
-        node = {"type": "<identifier-list>", "children": []}
-        node["children"].append(self.expect("IDENTIFIER"))
+        children = []
+        children.append(self.expect("IDENTIFIER"))
 
         while self.match("COMMA"):
-            node["children"].append(self.expect("COMMA"))
-            node["children"].append(self.expect("IDENTIFIER"))
+            children.append(self.expect("COMMA"))
+            children.append(self.expect("IDENTIFIER"))
 
-        return node
+        return self.make_node(IDENTIFIER_LIST, tuple(children))
 
     # parse tipe data (primitif, array, atau custom type)
     def parse_type(self):
-        node = {"type": "<type>", "children": []}
+        children = []
 
         if self.match("KEYWORD", "larik"):
             # array type
-            node["children"].append(self.parse_array_type())
+            children.append(self.parse_array_type())
         elif self.match("KEYWORD"):
             # primitive type (integer, real, boolean, char, string)
-            if self.current_token.value.lower() in ["integer", "real", "boolean", "char", "string"]:
-                node["children"].append(self.current_token)
+            if self.current_token.name in ["integer", "real", "boolean", "char", "string"]:
+                children.append(self.current_token)
                 self.advance()
             else:
                 self.error("Expected type keyword")
         elif self.match("IDENTIFIER"):
             # custom type (user-defined)
-            node["children"].append(self.expect("IDENTIFIER"))
+            children.append(self.expect("IDENTIFIER"))
         elif self.match("NUMBER") or self.match("CHAR_LITERAL"):
             # range type
-            node["children"].append(self.parse_range())
+            children.append(self.parse_range())
         else:
             self.error("Expected type")
 
-        return node
+        return self.make_node(TYPE, tuple(children))
 
     # parse tipe array (larik[1..10] dari integer)
     def parse_array_type(self):
-        node = {"type": "<array-type>", "children": []}
-        node["children"].append(self.expect("KEYWORD", "larik"))
-        node["children"].append(self.expect("LBRACKET"))
-        node["children"].append(self.parse_range())
-        node["children"].append(self.expect("RBRACKET"))
-        node["children"].append(self.expect("KEYWORD", "dari"))
-        node["children"].append(self.parse_type())
-        return node
+        return self.make_node(ARRAY_TYPE, (
+            self.expect("KEYWORD", "larik"),
+            self.expect("LBRACKET"),
+            self.parse_range(),
+            self.expect("RBRACKET"),
+            self.expect("KEYWORD", "dari"),
+            self.parse_type(),
+        ))
 
     # parse range (1..10 atau 'a'..'z')
     def parse_range(self):
-        node = {"type": "<range>", "children": []}
-        node["children"].append(self.parse_expression())
-        node["children"].append(self.expect("RANGE_OPERATOR"))
-        node["children"].append(self.parse_expression())
-        return node
+        return self.make_node(RANGE, (
+            self.parse_expression(),
+            self.expect("RANGE_OPERATOR"),
+            self.parse_expression(),
+        ))
 
     # parse deklarasi prosedur atau fungsi
     def parse_subprogram_declaration(self):
@@ -261,93 +622,162 @@ class Parser:
 
     # parse deklarasi prosedur
     def parse_procedure_declaration(self):
-        node = {"type": "<procedure-declaration>", "children": []}
-        node["children"].append(self.expect("KEYWORD", "prosedur"))
-        node["children"].append(self.expect("IDENTIFIER"))
+        children = []
+        # header sama body di-recover sendiri-sendiri, header yang rusak gak bikin body-nya ilang
+        self.recovering(children, self.parse_procedure_heading, children)
+        self.recovering(children, self.parse_subprogram_body, children)
+        return self.make_node(PROCEDURE_DECLARATION, tuple(children))
+
+    # prosedur <identifier> [<formal-parameter-list>] ;
+    def parse_procedure_heading(self, children):
+        children.append(self.expect("KEYWORD", "prosedur"))
+        children.append(self.expect("IDENTIFIER"))
 
         # parameter list opsional
         if self.match("LPARENTHESIS"):
-            node["children"].append(self.parse_formal_parameter_list())
+            children.append(self.parse_formal_parameter_list())
 
-        node["children"].append(self.expect("SEMICOLON"))
-        node["children"].append(self.parse_block())
-        node["children"].append(self.expect("SEMICOLON"))
-        return node
+        children.append(self.expect("SEMICOLON"))
 
     # parse deklarasi fungsi
     def parse_function_declaration(self):
-        node = {"type": "<function-declaration>", "children": []}
-        node["children"].append(self.expect("KEYWORD", "fungsi"))
-        node["children"].append(self.expect("IDENTIFIER"))
+        children = []
+        self.recovering(children, self.parse_function_heading, children)
+        self.recovering(children, self.parse_subprogram_body, children)
+        return self.make_node(FUNCTION_DECLARATION, tuple(children))
+
+    # fungsi <identifier> [<formal-parameter-list>] : <type> ;
+    def parse_function_heading(self, children):
+        children.append(self.expect("KEYWORD", "fungsi"))
+        children.append(self.expect("IDENTIFIER"))
 
         # parameter list opsional
         if self.match("LPARENTHESIS"):
-            node["children"].append(self.parse_formal_parameter_list())
+            children.append(self.parse_formal_parameter_list())
 
         # return type
-        node["children"].append(self.expect("COLON"))
-        node["children"].append(self.parse_type())
-        node["children"].append(self.expect("SEMICOLON"))
-        node["children"].append(self.parse_block())
-        node["children"].append(self.expect("SEMICOLON"))
-        return node
+        children.append(self.expect("COLON"))
+        children.append(self.parse_type())
+        children.append(self.expect("SEMICOLON"))
+
+    # <block> ; di akhir prosedur/fungsi
+    def parse_subprogram_body(self, children):
+        children.append(self.parse_body())
+        children.append(self.expect("SEMICOLON"))
 
     # parse formal parameter list (misal: (x, y: integer; z: real))
     def parse_formal_parameter_list(self):
-        node = {"type": "<formal-parameter-list>", "children": []}
-        node["children"].append(self.expect("LPARENTHESIS"))
+        children = []
+        children.append(self.expect("LPARENTHESIS"))
 
-        node["children"].append(self.parse_parameter_group())
+        children.append(self.parse_parameter_group())
 
         # multiple parameter groups dipisah semicolon
         while self.match("SEMICOLON"):
-            node["children"].append(self.expect("SEMICOLON"))
-            node["children"].append(self.parse_parameter_group())
+            children.append(self.expect("SEMICOLON"))
+            children.append(self.parse_parameter_group())
 
-        node["children"].append(self.expect("RPARENTHESIS"))
-        return node
+        children.append(self.expect("RPARENTHESIS"))
+        return self.make_node(FORMAL_PARAMETER_LIST, tuple(children))
 
     # parse satu group parameter (x, y: integer)
     def parse_parameter_group(self):
-        node = {"type": "<parameter-group>", "children": []}
-        node["children"].append(self.parse_identifier_list())
-        node["children"].append(self.expect("COLON"))
-        node["children"].append(self.parse_type())
-        return node
+        return self.make_node(PARAMETER_GROUP, (
+            self.parse_identifier_list(),
+            self.expect("COLON"),
+            self.parse_type(),
+        ))
 
     # parse block (deklarasi + statement)
     def parse_block(self):
-        node = {"type": "<block>", "children": []}
-        node["children"].append(self.parse_declaration_part())
-        node["children"].append(self.parse_compound_statement())
-        return node
+        return self.make_node(BLOCK, (
+            self.parse_declaration_part(),
+            self.parse_compound_statement(),
+        ))
+
+    # mode lazy: lewatin block tanpa parsing, cukup cocokin mulai/selesai yang seimbang.
+    # prosedur/fungsi nested di bagian deklarasi masing-masing punya satu blok mulai..selesai
+    # yang muncul duluan, jadi blok level atas yang dilewatin dikurangin dulu dari jumlah
+    # prosedur/fungsi nested sebelum ketemu blok mulai..selesai punya block ini
+    def skip_block(self):
+        position = self.pos
+        indexable = isinstance(self.tokens, (TokenStream, list, tuple))
+        # input streaming gak bisa diakses ulang, token body-nya dikumpulin
+        skipped = None if indexable else []
+        nested = 0
+        depth = 0
+        while True:
+            token = self.current_token
+            if token is None:
+                self.error("Expected selesai, but reached end of input")
+            word = token.name if token.type == "KEYWORD" else None
+            if word == "mulai":
+                depth += 1
+            elif word == "selesai":
+                depth -= 1
+                if depth < 0:
+                    self.error(f"unexpected token {token.type}({token.value}), expected mulai")
+            elif word in ("prosedur", "fungsi") and depth == 0:
+                nested += 1
+            if skipped is not None:
+                skipped.append(token)
+            self.advance()
+            if word == "selesai" and depth == 0:
+                if nested == 0:
+                    break
+                nested -= 1
+        if skipped is None:
+            shift = self._index_shift
+            return LazyBlockNode(self.tokens, position + shift, self.pos + shift, position, self.compress)
+        return LazyBlockNode(tuple(skipped), 0, len(skipped), position, self.compress)
 
     # parse compound statement (mulai...selesai)
     def parse_compound_statement(self):
-        node = {"type": "<compound-statement>", "children": []}
-        node["children"].append(self.expect("KEYWORD", "mulai"))
-        node["children"].append(self.parse_statement_list())
-        node["children"].append(self.expect("KEYWORD", "selesai"))
-        return node
+        return self.make_node(COMPOUND_STATEMENT, (
+            self.expect("KEYWORD", "mulai"),
+            self.parse_statement_list(),
+            self.expect("KEYWORD", "selesai"),
+        ))
 
     # parse list statement yang dipisah semicolon
-    def parse_statement_list(self):
-        node = {"type": "<statement-list>", "children": []}
-        node["children"].append(self.parse_statement())
+    # closer: keyword penutup list-nya (selesai, atau sampai buat ulangi)
+    def parse_statement_list(self, closer="selesai"):
+        children = []
+        # mode recover: statement yang gagal jadi ErrorNode (lihat recover_statement)
+        children.append(self.parse_list_statement())
+        wrong_closer = "sampai" if closer == "selesai" else "selesai"
 
-        while self.match("SEMICOLON"):
-            node["children"].append(self.expect("SEMICOLON"))
-            # kalo ketemu 'selesai' atau 'sampai' berarti udah akhir list
-            if not self.match("KEYWORD", "selesai") and not self.match("KEYWORD", "sampai"):
-                node["children"].append(self.parse_statement())
+        while True:
+            while self.match("SEMICOLON"):
+                children.append(self.expect("SEMICOLON"))
+                # kalo ketemu 'selesai' atau 'sampai' berarti udah akhir list
+                if not self.match("KEYWORD", "selesai") and not self.match("KEYWORD", "sampai"):
+                    children.append(self.parse_list_statement())
+                else:
+                    break
+
+            # validasi akhir statement list
+            if self.match("KEYWORD", "selesai") or self.match("KEYWORD", "sampai") or self.match("SEMICOLON"):
+                # mode recover: selesai/sampai yang bukan penutup list ini error-nya dicatet di
+                # sini (pesannya sama kayak error dari expect penutupnya), tokennya dilewatin
+                if not self.recover or not self.match("KEYWORD", wrong_closer):
+                    break
+                error = self.syntax_error(f"unexpected token {self.current_token.value}, expected {closer}")
+                skipped = [self.current_token]
+                self.advance()
             else:
+                error = self.syntax_error(f"Expected SEMICOLON(;) or KEYWORD(selesai/sampai), but got {self.current_token}")
+                if not self.recover:
+                    raise error
+                skipped = []
+            # mode recover: sisa statement-nya dilewatin, lanjut kalo berhentinya di ; (atau di
+            # penutup yang salah lagi)
+            self.record(error)
+            children.append(ErrorNode(error, tuple(skipped + self.synchronize(STATEMENT_SYNC))))
+            if not self.match("SEMICOLON") and not self.match("KEYWORD", wrong_closer):
                 break
 
-        # validasi akhir statement list
-        if not self.match("KEYWORD", "selesai") and not self.match("KEYWORD", "sampai") and not self.match("SEMICOLON"):
-            self.error(f"Expected SEMICOLON(;) or KEYWORD(selesai/sampai), but got {self.current_token}")
-
-        return node
+        return self.make_node(STATEMENT_LIST, tuple(children))
 
     # parse statement (if, while, for, repeat, assignment, procedure call)
     def parse_statement(self):
@@ -370,197 +800,199 @@ class Parser:
                 return self.parse_procedure_call()
         else:
             # empty statement
-            return {"type": "<empty-statement>", "children": []}
+            return self.make_node(EMPTY_STATEMENT, ())
 
     # parse assignment (x := 10 atau arr[i] := 5)
     def parse_assignment_statement(self):
-        node = {"type": "<assignment-statement>", "children": []}
-        node["children"].append(self.expect("IDENTIFIER"))
+        children = []
+        children.append(self.expect("IDENTIFIER"))
 
         # array indexing opsional
         if self.match("LBRACKET"):
-            node["children"].append(self.expect("LBRACKET"))
-            node["children"].append(self.parse_expression())
-            node["children"].append(self.expect("RBRACKET"))
+            children.append(self.expect("LBRACKET"))
+            children.append(self.parse_expression())
+            children.append(self.expect("RBRACKET"))
 
-        node["children"].append(self.expect("ASSIGN_OPERATOR"))
-        node["children"].append(self.parse_expression())
-        return node
+        children.append(self.expect("ASSIGN_OPERATOR"))
+        children.append(self.parse_expression())
+        return self.make_node(ASSIGNMENT_STATEMENT, tuple(children))
 
     # parse if statement (jika...maka...selain-itu)
     def parse_if_statement(self):
-        node = {"type": "<if-statement>", "children": []}
-        node["children"].append(self.expect("KEYWORD", "jika"))
-        node["children"].append(self.parse_expression())
-        node["children"].append(self.expect("KEYWORD", "maka"))
-        node["children"].append(self.parse_statement())
+        children = []
+        children.append(self.expect("KEYWORD", "jika"))
+        children.append(self.parse_expression())
+        children.append(self.expect("KEYWORD", "maka"))
+        children.append(self.parse_statement())
 
         # else clause opsional
         if self.match("KEYWORD", "selain-itu"):
-            node["children"].append(self.expect("KEYWORD", "selain-itu"))
-            node["children"].append(self.parse_statement())
+            children.append(self.expect("KEYWORD", "selain-itu"))
+            children.append(self.parse_statement())
 
-        return node
+        return self.make_node(IF_STATEMENT, tuple(children))
 
     # parse while loop (selama...lakukan)
     def parse_while_statement(self):
-        node = {"type": "<while-statement>", "children": []}
-        node["children"].append(self.expect("KEYWORD", "selama"))
-        node["children"].append(self.parse_expression())
-        node["children"].append(self.expect("KEYWORD", "lakukan"))
-        node["children"].append(self.parse_statement())
-        return node
+        return self.make_node(WHILE_STATEMENT, (
+            self.expect("KEYWORD", "selama"),
+            self.parse_expression(),
+            self.expect("KEYWORD", "lakukan"),
+            self.parse_statement(),
+        ))
 
     # parse for loop (untuk...ke/turun-ke...lakukan)
     def parse_for_statement(self):
-        node = {"type": "<for-statement>", "children": []}
-        node["children"].append(self.expect("KEYWORD", "untuk"))
-        node["children"].append(self.expect("IDENTIFIER"))
-        node["children"].append(self.expect("ASSIGN_OPERATOR"))
-        node["children"].append(self.parse_expression())
+        children = []
+        children.append(self.expect("KEYWORD", "untuk"))
+        children.append(self.expect("IDENTIFIER"))
+        children.append(self.expect("ASSIGN_OPERATOR"))
+        children.append(self.parse_expression())
 
         # direction bisa 'ke' (increment) atau 'turun-ke' (decrement)
         if self.match("KEYWORD", "ke"):
-            node["children"].append(self.expect("KEYWORD", "ke"))
+            children.append(self.expect("KEYWORD", "ke"))
         elif self.match("KEYWORD", "turun-ke"):
-            node["children"].append(self.expect("KEYWORD", "turun-ke"))
+            children.append(self.expect("KEYWORD", "turun-ke"))
         else:
             self.error("Expected 'ke' or 'turun-ke'")
 
-        node["children"].append(self.parse_expression())
-        node["children"].append(self.expect("KEYWORD", "lakukan"))
-        node["children"].append(self.parse_statement())
-        return node
+        children.append(self.parse_expression())
+        children.append(self.expect("KEYWORD", "lakukan"))
+        children.append(self.parse_statement())
+        return self.make_node(FOR_STATEMENT, tuple(children))
 
     # parse repeat-until loop (ulangi...sampai)
     def parse_repeat_statement(self):
-        node = {"type": "<repeat-statement>", "children": []}
-        node["children"].append(self.expect("KEYWORD", "ulangi"))
-        node["children"].append(self.parse_statement_list())
-        node["children"].append(self.expect("KEYWORD", "sampai"))
-        node["children"].append(self.parse_expression())
-        return node
+        return self.make_node(REPEAT_STATEMENT, (
+            self.expect("KEYWORD", "ulangi"),
+            self.parse_statement_list("sampai"),
+            self.expect("KEYWORD", "sampai"),
+            self.parse_expression(),
+        ))
 
     # parse procedure/function call
     def parse_procedure_call(self):
-        node = {"type": "<procedure/function-call>", "children": []}
+        children = []
 
         # procedure name hanya identifier
-        node["children"].append(self.expect("IDENTIFIER"))
+        children.append(self.expect("IDENTIFIER"))
 
-        node["children"].append(self.expect("LPARENTHESIS"))
+        children.append(self.expect("LPARENTHESIS"))
         # parameter list opsional
         if not self.match("RPARENTHESIS"):
-            node["children"].append(self.parse_parameter_list())
-        node["children"].append(self.expect("RPARENTHESIS"))
+            children.append(self.parse_parameter_list())
+        children.append(self.expect("RPARENTHESIS"))
 
-        return node
+        return self.make_node(PROCEDURE_CALL, tuple(children))
 
     # parse actual parameter list saat function/procedure call
     def parse_parameter_list(self):
-        node = {"type": "<parameter-list>", "children": []}
-        node["children"].append(self.parse_expression())
+        children = []
+        children.append(self.parse_expression())
 
         # multiple parameters dipisah koma
         while self.match("COMMA"):
-            node["children"].append(self.expect("COMMA"))
-            node["children"].append(self.parse_expression())
+            children.append(self.expect("COMMA"))
+            children.append(self.parse_expression())
 
-        return node
+        return self.make_node(PARAMETER_LIST, tuple(children))
 
     # parse expression (simple-expression dengan relational operator opsional)
     def parse_expression(self):
-        node = {"type": "<expression>", "children": []}
-        node["children"].append(self.parse_simple_expression())
+        left = self.parse_simple_expression()
 
         # relational operator opsional (=, <>, <, >, <=, >=)
         if self.match("RELATIONAL_OPERATOR"):
-            node["children"].append(self.current_token)
+            operator = self.current_token
             self.advance()
-            node["children"].append(self.parse_simple_expression())
+            return self.make_node(EXPRESSION, (left, operator, self.parse_simple_expression()))
 
-        return node
+        return self.make_node(EXPRESSION, (left,))
 
     # parse simple expression (term dengan + - atau opsional)
     def parse_simple_expression(self):
-        node = {"type": "<simple-expression>", "children": []}
+        children = []
 
         # unary + atau - di depan opsional
         if self.match("ARITHMETIC_OPERATOR") and self.current_token.value in ["+", "-"]:
-            node["children"].append(self.current_token)
+            children.append(self.current_token)
             self.advance()
 
-        node["children"].append(self.parse_term())
+        children.append(self.parse_term())
 
         # + - atau 'atau' bisa lebih dari satu
         while (self.match("ARITHMETIC_OPERATOR") and self.current_token.value in ["+", "-"]) or self.match("LOGICAL_OPERATOR", "atau"):
-            node["children"].append(self.current_token)
+            children.append(self.current_token)
             self.advance()
-            node["children"].append(self.parse_term())
+            children.append(self.parse_term())
 
-        return node
+        return self.make_node(SIMPLE_EXPRESSION, tuple(children))
 
     # parse term (factor dengan * / bagi mod dan opsional)
     def parse_term(self):
-        node = {"type": "<term>", "children": []}
-        node["children"].append(self.parse_factor())
+        children = [self.parse_factor()]
 
         # * / bagi mod 'dan' bisa lebih dari satu
         while (self.match("ARITHMETIC_OPERATOR") and self.current_token.value in ["*", "/"]) or self.match("ARITHMETIC_OPERATOR", "bagi") or self.match("ARITHMETIC_OPERATOR", "mod") or self.match("LOGICAL_OPERATOR", "dan"):
-            node["children"].append(self.current_token)
+            children.append(self.current_token)
             self.advance()
-            node["children"].append(self.parse_factor())
+            children.append(self.parse_factor())
 
-        return node
+        return self.make_node(TERM, tuple(children))
 
     # parse factor (identifier, number, literal, function call, array access, parenthesis, not)
     def parse_factor(self):
-        node = {"type": "<factor>", "children": []}
-
         if self.match("IDENTIFIER"):
             # liat next token buat bedain variable, function call, atau array access
             peek = self.peek(1)
             if peek and peek.type == "LPARENTHESIS":
                 # function call
-                node["children"].append(self.parse_function_call())
+                children = (self.parse_function_call(),)
             elif peek and peek.type == "LBRACKET":
                 # array access
-                node["children"].append(self.expect("IDENTIFIER"))
-                node["children"].append(self.expect("LBRACKET"))
-                node["children"].append(self.parse_expression())
-                node["children"].append(self.expect("RBRACKET"))
+                children = (
+                    self.expect("IDENTIFIER"),
+                    self.expect("LBRACKET"),
+                    self.parse_expression(),
+                    self.expect("RBRACKET"),
+                )
             else:
                 # variable biasa
-                node["children"].append(self.expect("IDENTIFIER"))
+                children = (self.expect("IDENTIFIER"),)
         elif self.match("NUMBER"):
-            node["children"].append(self.expect("NUMBER"))
+            children = (self.expect("NUMBER"),)
         elif self.match("CHAR_LITERAL"):
-            node["children"].append(self.expect("CHAR_LITERAL"))
+            children = (self.expect("CHAR_LITERAL"),)
         elif self.match("STRING_LITERAL"):
-            node["children"].append(self.expect("STRING_LITERAL"))
+            children = (self.expect("STRING_LITERAL"),)
         elif self.match("LPARENTHESIS"):
             # parenthesized expression
-            node["children"].append(self.expect("LPARENTHESIS"))
-            node["children"].append(self.parse_expression())
-            node["children"].append(self.expect("RPARENTHESIS"))
+            children = (
+                self.expect("LPARENTHESIS"),
+                self.parse_expression(),
+                self.expect("RPARENTHESIS"),
+            )
         elif self.match("LOGICAL_OPERATOR", "tidak"):
             # logical not
-            node["children"].append(self.expect("LOGICAL_OPERATOR", "tidak"))
-            node["children"].append(self.parse_factor())
+            children = (
+                self.expect("LOGICAL_OPERATOR", "tidak"),
+                self.parse_factor(),
+            )
         else:
             self.error(f"Unexpected token in factor: {self.current_token}")
 
-        return node
+        return self.make_node(FACTOR, children)
 
     # parse function call dalam expression
     def parse_function_call(self):
-        node = {"type": "<function-call>", "children": []}
-        node["children"].append(self.expect("IDENTIFIER"))
-        node["children"].append(self.expect("LPARENTHESIS"))
+        children = []
+        children.append(self.expect("IDENTIFIER"))
+        children.append(self.expect("LPARENTHESIS"))
 
         # parameter list opsional
         if not self.match("RPARENTHESIS"):
-            node["children"].append(self.parse_parameter_list())
+            children.append(self.parse_parameter_list())
 
-        node["children"].append(self.expect("RPARENTHESIS"))
-        return node
+        children.append(self.expect("RPARENTHESIS"))
+        return self.make_node(FUNCTION_CALL, tuple(children))
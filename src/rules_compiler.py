@@ -0,0 +1,445 @@
+# compiler buat file DFA rules: konversi format teks ke json, validasi, dan minimisasi
+# - format teks (rules/DFA.txt) diubah jadi json yang sama kayak rules/dfa_rules_final.json
+# - laporan: pattern yang tumpang tindih, state yang gak kecapai, dead state, transisi yang kurang
+# - minimisasi pake algoritma Hopcroft, hasilnya dicek ekuivalen sama rules aslinya
+# - hasil minimisasi ditulis jadi file json biasa, jadi bisa langsung di-load lexer.py
+#
+# cara pake (dari root folder):
+#   python3 src/rules_compiler.py rules/dfa_rules_final.json
+#   python3 src/rules_compiler.py rules/dfa_rules_final.json -o rules/dfa_rules_min.json
+#   python3 src/rules_compiler.py rules/dfa_rules_final.json --cache
+#   python3 src/rules_compiler.py rules/DFA.txt -o rules/dfa_rules_txt.json
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from lexer import compile_rules, load_rules, match, pattern_chars, rules_hash, save_cached_rules
+from token_stream import TOKEN_KINDS
+
+# state yang dicari lexer pake namanya, gak boleh digabung sama state lain
+SPECIAL_STATES = ("NUMBER_DOT",)
+
+# simbol khusus di format teks
+_TEXT_SYMBOLS = {
+    "whitespace": [" ", "\t", "\n", "\r"],
+    "space": [" "],
+    "newline": ["\n"],
+    "num": ["0..9"],
+}
+
+def _text_patterns(symbol):
+    # simbol transisi format teks -> list pattern json
+    if symbol in _TEXT_SYMBOLS:
+        return _TEXT_SYMBOLS[symbol]
+    if symbol.startswith("*"):
+        # * = karakter apa aja
+        return ["ALL_EXCEPT "]
+    if symbol.startswith("~") or symbol.startswith("not_"):
+        rest = symbol[1:] if symbol.startswith("~") else symbol[len("not_"):]
+        exceptions = []
+        for part in rest.split(","):
+            exceptions.extend(_TEXT_SYMBOLS.get(part, [part]) if part else [])
+        return ["ALL_EXCEPT " + ", ".join(exceptions)]
+    if len(symbol) == 3 and symbol[1] == "-":
+        return [f"{symbol[0]}..{symbol[2]}"]
+    if len(symbol) == 1:
+        return [symbol]
+    return None
+
+def load_dfa_text(path):
+    # baca DFA format teks (rules/DFA.txt):
+    #   start_state = <state>
+    #   final_state = <state>, <state>, ...
+    #   <dari> <simbol> [<simbol> ...] <ke>
+    # simbol: satu karakter, a-z, num, whitespace, ~x / ~x,y (selain itu), * (apa aja)
+    # ~x dan * artinya "selain transisi lain", jadi ditaruh paling belakang di state-nya
+    # token type final state = nama state-nya di-uppercase kalo itu token kind yang dikenal
+    start = None
+    finals = []
+    transitions = []
+    with open(path, "r", encoding="utf-8") as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            if "=" in line.split()[0] or (len(line.split()) > 1 and line.split()[1] == "="):
+                key, value = (part.strip() for part in line.split("=", 1))
+                if key.lower() == "start_state":
+                    start = value
+                    continue
+                if key.lower() == "final_state":
+                    finals = [name.strip() for name in value.split(",") if name.strip()]
+                    continue
+            parts = line.split()
+            if len(parts) < 3:
+                raise ValueError(f"{path}:{number}: transisi harus '<dari> <simbol> <ke>'")
+            for symbol in parts[1:-1]:
+                patterns = _text_patterns(symbol)
+                if patterns is None:
+                    raise ValueError(f"{path}:{number}: simbol '{symbol}' tidak dikenal")
+                transitions.extend([parts[0], pattern, parts[-1]] for pattern in patterns)
+    if start is None:
+        raise ValueError(f"{path}: start_state tidak ada")
+    order = {name: i for i, name in enumerate(dict.fromkeys(t[0] for t in transitions))}
+    transitions.sort(key=lambda t: (order[t[0]], "ALL_EXCEPT " in t[1]))
+    mapping = {name: name.upper() for name in finals if name.upper() in TOKEN_KINDS}
+    return {
+        "Start_state": start,
+        "Final_states": finals,
+        "Transitions": transitions,
+        "Token_mapping": mapping,
+        "Error_states": {},
+    }
+
+def load_any_rules(path):
+    # file .txt dibaca sebagai format teks, selain itu json
+    if path.endswith(".txt"):
+        return load_dfa_text(path)
+    return load_rules(path)
+
+class RulesTable:
+    # DFA rules dalam bentuk tabel per karakter, dipake buat analisis dan minimisasi
+    # alphabet = semua ASCII + karakter non-ASCII yang disebut rules + satu wakil non-ASCII lain
+    def __init__(self, dfa, alphabet=None):
+        self.dfa = dfa
+        names = [dfa["Start_state"]]
+        for s_from, _, s_to in dfa["Transitions"]:
+            names.append(s_from)
+            names.append(s_to)
+        names.extend(dfa["Final_states"])
+        names.extend(dfa.get("Error_states", {}))
+        self.names = list(dict.fromkeys(names))
+        self.ids = {name: i for i, name in enumerate(self.names)}
+        self.start = self.ids[dfa["Start_state"]]
+        finals = set(dfa["Final_states"])
+        mapping = dfa["Token_mapping"]
+        errors = dfa.get("Error_states", {})
+        self.final = [name in finals for name in self.names]
+        self.token_types = [mapping.get(name, "UNKNOWN") for name in self.names]
+        self.error_messages = [errors.get(name) for name in self.names]
+
+        self.transitions = [[] for _ in self.names]
+        for s_from, pattern, s_to in dfa["Transitions"]:
+            self.transitions[self.ids[s_from]].append((pattern, self.ids[s_to]))
+
+        self.alphabet = alphabet or rules_alphabet(dfa)
+        # targets[state][i] = state tujuan buat alphabet[i], -1 kalo gak ada transisi
+        self.targets = []
+        for transitions in self.transitions:
+            row = []
+            for ch in self.alphabet:
+                row.append(next((s_to for pattern, s_to in transitions if match(ch, pattern)), -1))
+            self.targets.append(row)
+
+    def label(self, state):
+        # yang keliatan dari luar kalo lexer berhenti / lewat di state ini
+        name = self.names[state]
+        return (self.final[state], self.token_types[state] if self.final[state] else None,
+                self.error_messages[state], name if name in SPECIAL_STATES else None)
+
+    def reachable(self):
+        seen = {self.start}
+        todo = [self.start]
+        while todo:
+            state = todo.pop()
+            for target in self.targets[state]:
+                if target >= 0 and target not in seen:
+                    seen.add(target)
+                    todo.append(target)
+        return seen
+
+    def live(self):
+        # state yang masih bisa nyampe ke final state
+        reverse = [set() for _ in self.names]
+        for state, row in enumerate(self.targets):
+            for target in row:
+                if target >= 0:
+                    reverse[target].add(state)
+        seen = {state for state in range(len(self.names)) if self.final[state]}
+        todo = list(seen)
+        while todo:
+            state = todo.pop()
+            for source in reverse[state]:
+                if source not in seen:
+                    seen.add(source)
+                    todo.append(source)
+        return seen
+
+def rules_alphabet(*dfas):
+    # karakter yang perlu dicek satu-satu, non-ASCII yang gak disebut rules diwakilin satu karakter
+    mentioned = set()
+    for dfa in dfas:
+        for _, pattern, _ in dfa["Transitions"]:
+            if "ALL_EXCEPT " in pattern:
+                mentioned.update(e for e in pattern[len("ALL_EXCEPT "):].split(", ") if len(e) == 1)
+            else:
+                mentioned.update(pattern_chars(pattern) or ())
+    extra = sorted(ch for ch in mentioned if ord(ch) >= 128)
+    other = next(chr(o) for o in range(0x80, 0x110000) if chr(o) not in mentioned)
+    return [chr(o) for o in range(128)] + extra + [other]
+
+def analyze_rules(dfa):
+    # cek rules, return list (kategori, pesan)
+    table = RulesTable(dfa)
+    names = table.names
+    problems = []
+
+    # pattern yang tumpang tindih: karakter yang match lebih dari satu transisi beda tujuan
+    for state, transitions in enumerate(table.transitions):
+        shadowed = {}
+        won = set()
+        for ch in table.alphabet:
+            matched = [i for i, (pattern, _) in enumerate(transitions) if match(ch, pattern)]
+            if matched:
+                won.add(matched[0])
+            for j in matched[1:]:
+                # ALL_EXCEPT yang ketimpa transisi sebelumnya itu wajar ("selain yang di atas")
+                if "ALL_EXCEPT " in transitions[j][0]:
+                    continue
+                if transitions[j][1] != transitions[matched[0]][1]:
+                    shadowed.setdefault((matched[0], j), []).append(ch)
+        for (i, j), chars in shadowed.items():
+            (pattern_i, target_i), (pattern_j, target_j) = transitions[i], transitions[j]
+            shown = ", ".join(repr(ch) for ch in chars[:5]) + (", ..." if len(chars) > 5 else "")
+            problems.append(("conflict", f"{names[state]}: {shown} match {pattern_i!r} -> {names[target_i]} "
+                                         f"and {pattern_j!r} -> {names[target_j]}, first one wins"))
+        for j, (pattern, target) in enumerate(transitions):
+            if j not in won:
+                problems.append(("conflict", f"{names[state]}: transition {pattern!r} -> {names[target]} "
+                                             f"is never taken"))
+
+    reachable = table.reachable()
+    live = table.live()
+    for state, name in enumerate(names):
+        if state not in reachable:
+            problems.append(("unreachable", f"{name} is not reachable from {names[table.start]}"))
+        elif state not in live:
+            if table.error_messages[state] is None:
+                problems.append(("dead", f"{name} can never reach a final state"))
+        if (not table.final[state] and table.error_messages[state] is None
+                and not table.transitions[state]):
+            problems.append(("missing", f"{name} is not final, has no error message and no transitions"))
+        if table.final[state] and name not in dfa["Token_mapping"]:
+            problems.append(("missing", f"final state {name} has no token mapping"))
+    for name in dfa["Token_mapping"]:
+        if name not in table.ids:
+            problems.append(("missing", f"token mapping for unknown state {name}"))
+    return problems
+
+def minimize_rules(dfa):
+    # minimisasi Hopcroft, state yang gak kecapai dibuang dulu
+    # partisi awal dipisah per (final, token type, error message, state khusus), jadi state yang
+    # digabung pasti ngasilin token dan pesan error yang sama persis di lexer
+    # dead state gak dibuang: lexer tetep makan karakternya sebelum mundur ke last accept
+    table = RulesTable(dfa)
+    reachable = sorted(table.reachable())
+    index = {state: i for i, state in enumerate(reachable)}
+    sink = len(reachable)
+    n_chars = len(table.alphabet)
+    delta = [[index[t] if t >= 0 else sink for t in table.targets[state]] for state in reachable]
+    delta.append([sink] * n_chars)
+
+    # partisi awal
+    blocks = {}
+    for i, state in enumerate(reachable):
+        blocks.setdefault(table.label(state), []).append(i)
+    partition = [set(members) for members in blocks.values()] + [{sink}]
+    block_of = [0] * (sink + 1)
+    for b, members in enumerate(partition):
+        for state in members:
+            block_of[state] = b
+
+    # transisi kebalik per karakter
+    reverse = [[[] for _ in range(sink + 1)] for _ in range(n_chars)]
+    for state, row in enumerate(delta):
+        for c, target in enumerate(row):
+            reverse[c][target].append(state)
+
+    work = set(range(len(partition)))
+    while work:
+        splitter = partition[work.pop()]
+        for c in range(n_chars):
+            sources = set()
+            for target in splitter:
+                sources.update(reverse[c][target])
+            if not sources:
+                continue
+            touched = {}
+            for state in sources:
+                touched.setdefault(block_of[state], set()).add(state)
+            for b, inside in touched.items():
+                block = partition[b]
+                if len(inside) == len(block):
+                    continue
+                outside = block - inside
+                partition[b] = inside
+                new = len(partition)
+                partition.append(outside)
+                for state in outside:
+                    block_of[state] = new
+                if b in work:
+                    work.add(new)
+                else:
+                    work.add(b if len(inside) <= len(outside) else new)
+
+    # satu state per block, namanya dari state pertama (start sama state khusus tetep namanya)
+    sink_block = block_of[sink]
+    order = sorted((b for b in range(len(partition)) if b != sink_block),
+                   key=lambda b: min(partition[b]))
+    names = {}
+    for b in order:
+        members = [table.names[reachable[i]] for i in sorted(partition[b])]
+        preferred = [m for m in members if m == dfa["Start_state"] or m in SPECIAL_STATES]
+        names[b] = preferred[0] if preferred else members[0]
+
+    transitions = []
+    for b in order:
+        row = delta[min(partition[b])]
+        targets = {}
+        for c, target in enumerate(row):
+            if block_of[target] != sink_block:
+                targets[table.alphabet[c]] = names[block_of[target]]
+        for pattern, target in _patterns(targets, table.alphabet):
+            transitions.append([names[b], pattern, target])
+
+    finals = [names[b] for b in order if table.final[reachable[min(partition[b])]]]
+    mapping = {}
+    errors = {}
+    for b in order:
+        state = reachable[min(partition[b])]
+        if names[b] in dfa["Token_mapping"] or table.final[state]:
+            if table.token_types[state] != "UNKNOWN":
+                mapping[names[b]] = table.token_types[state]
+        if table.error_messages[state] is not None:
+            errors[names[b]] = table.error_messages[state]
+    return {
+        "Start_state": dfa["Start_state"],
+        "Final_states": finals,
+        "Transitions": transitions,
+        "Token_mapping": mapping,
+        "Error_states": errors,
+    }
+
+# karakter yang gak bisa jadi bagian list pattern (dipisah koma dan di-strip) atau ujung range
+_UNSAFE_IN_LIST = {","} | {chr(o) for o in range(128) if chr(o).isspace()}
+_UNSAFE_RANGE_END = _UNSAFE_IN_LIST | {"."}
+
+def _patterns(targets, alphabet):
+    # karakter -> state tujuan jadi list (pattern, tujuan) format json
+    # karakter wakil non-ASCII (terakhir di alphabet) cuma bisa ditulis lewat ALL_EXCEPT
+    other = alphabet[-1]
+    other_target = targets.get(other)
+    groups = {}
+    for ch in alphabet[:-1]:
+        target = targets.get(ch)
+        if target is not None and target != other_target:
+            groups.setdefault(target, []).append(ch)
+    result = []
+    for target, chars in groups.items():
+        for pattern in _char_patterns(chars):
+            result.append((pattern, target))
+    if other_target is not None:
+        exceptions = [ch for ch in alphabet[:-1] if targets.get(ch) != other_target]
+        result.append(("ALL_EXCEPT " + ", ".join(exceptions), other_target))
+    return result
+
+def _char_patterns(chars):
+    # himpunan karakter jadi pattern sependek mungkin (range a..z digabung pake koma)
+    parts = []
+    singles = []
+    codes = sorted(ord(ch) for ch in chars)
+    i = 0
+    while i < len(codes):
+        j = i
+        while j + 1 < len(codes) and codes[j + 1] == codes[j] + 1:
+            j += 1
+        lo, hi = chr(codes[i]), chr(codes[j])
+        if j - i >= 2 and lo not in _UNSAFE_RANGE_END and hi not in _UNSAFE_RANGE_END:
+            parts.append(f"{lo}..{hi}")
+        else:
+            for code in codes[i:j + 1]:
+                ch = chr(code)
+                (singles if ch in _UNSAFE_IN_LIST else parts).append(ch)
+        i = j + 1
+    patterns = [",".join(parts)] if parts else []
+    return patterns + singles
+
+def check_equivalent(dfa_a, dfa_b):
+    # jalanin dua DFA barengan (product automaton), return None kalo lexer-nya bakal
+    # berperilaku sama persis, selain itu string contoh yang bikin beda
+    alphabet = rules_alphabet(dfa_a, dfa_b)
+    a = RulesTable(dfa_a, alphabet)
+    b = RulesTable(dfa_b, alphabet)
+    seen = {(a.start, b.start): ""}
+    todo = [(a.start, b.start)]
+    while todo:
+        pair = todo.pop(0)
+        state_a, state_b = pair
+        prefix = seen[pair]
+        if (state_a < 0) != (state_b < 0):
+            return prefix
+        if state_a < 0:
+            continue
+        if a.label(state_a) != b.label(state_b):
+            return prefix
+        for c, ch in enumerate(alphabet):
+            nxt = (a.targets[state_a][c], b.targets[state_b][c])
+            if nxt not in seen:
+                seen[nxt] = prefix + ch
+                todo.append(nxt)
+    return None
+
+def count_rules(dfa):
+    table = RulesTable(dfa)
+    return len(table.names), len(dfa["Transitions"])
+
+def compile_rules_file(path, output_path=None, cache=False):
+    # analisis + minimisasi satu file rules, hasilnya ditulis ke output_path (kalo ada)
+    # cache=True: tabel hasil minimisasi ditulis ke .dfacache rules-nya, jadi load_engine
+    # langsung pake tabel yang udah diminimisasi tanpa ganti file json-nya
+    dfa = load_any_rules(path)
+    problems = analyze_rules(dfa)
+    for kind in ("conflict", "unreachable", "dead", "missing"):
+        found = [message for category, message in problems if category == kind]
+        print(f"{kind}: {len(found)}")
+        for message in found:
+            print(f"  {message}")
+
+    minimized = minimize_rules(dfa)
+    states, transitions = count_rules(dfa)
+    min_states, min_transitions = count_rules(minimized)
+    print(f"states: {states} -> {min_states}, transitions: {transitions} -> {min_transitions}")
+    witness = check_equivalent(dfa, minimized)
+    if witness is not None:
+        raise ValueError(f"Minimized rules are not equivalent (differs after {witness!r})")
+    print("minimized rules verified equivalent")
+
+    if output_path:
+        with open(output_path, "w", encoding="utf-8") as f:
+            json.dump(minimized, f, indent=2, ensure_ascii=False)
+            f.write("\n")
+        print(f"Minimized rules saved to: {output_path}")
+    if cache:
+        save_cached_rules(path, rules_hash(path), compile_rules(minimized))
+        print(f"Minimized table cached for: {path}")
+    return minimized
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    output = None
+    cache = "--cache" in args
+    if cache:
+        args.remove("--cache")
+    if "-o" in args:
+        i = args.index("-o")
+        output = args[i + 1] if i + 1 < len(args) else None
+        del args[i:i + 2]
+    if len(args) != 1 or ("-o" in sys.argv and output is None) or (cache and args[0].endswith(".txt")):
+        print("Usage: python3 rules_compiler.py <dfa_rules.json | DFA.txt> [-o output.json] [--cache]")
+        print("       (--cache cuma buat rules json)")
+        sys.exit(1)
+
+    compile_rules_file(args[0], output, cache)
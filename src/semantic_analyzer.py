@@ -13,7 +13,7 @@ dan lakukan semantic analysis termasuk:
 kompatibel dengan ast_nodes.py dan symbol_table.py
 """
 
-from typing import Optional, List, Any, Union
+from typing import Optional, List, Dict, Tuple, Any, Union
 import sys
 import os
 
@@ -78,6 +78,8 @@ class SemanticVisitor:
         self.warnings: List[str] = []
         self.current_function: Optional[str] = None  # track current function buat return type checking
         self.current_function_return_type: Optional[DataType] = None
+        # deklarasi ganda yang ditolak, per entry lama yang bikin ditolak: (kind, type)
+        self.rejected_declarations: Dict[SymbolTableEntry, List[Tuple[ObjectType, Optional[DataType]]]] = {}
     
     def visit(self, node: ASTNode) -> Optional[DataType]:
         """
@@ -116,6 +118,23 @@ class SemanticVisitor:
         error = SemanticError(message, line, column)
         self.errors.append(error)
     
+    def reject_duplicate(self, existing: SymbolTableEntry, obj: ObjectType,
+                         data_type: Optional[DataType], message: str, node: ASTNode):
+        """
+        laporin deklarasi ganda, entry lama tetap dipake apa adanya (kind-nya gak berubah)
+        deklarasi yang ditolak dicatat biar pemakaian nama itu sesuai deklarasi tsb
+        (misal manggil fungsi Max padahal yang kedaftar konstanta MAX) gak jadi error susulan
+        """
+        self.add_error(message, node)
+        self.rejected_declarations.setdefault(existing, []).append((obj, data_type))
+    
+    def rejected_as(self, entry: SymbolTableEntry, kinds=None, data_type: Optional[DataType] = None) -> bool:
+        """cek ada deklarasi ganda yang ditolak di entry ini dengan kind / type tsb"""
+        for obj, rejected_type in self.rejected_declarations.get(entry, ()):
+            if (kinds is None or obj in kinds) and (data_type is None or rejected_type == data_type):
+                return True
+        return False
+    
     def add_warning(self, message: str, node: Optional[ASTNode] = None):
         """add warning"""
         line = getattr(node, 'line', None) if node else None
@@ -127,7 +146,7 @@ class SemanticVisitor:
     def visit_ProgramNode(self, node: ProgramNode) -> None:
         """visit program node - entry point untuk analysis"""
         # Enter program name into symbol table
-        self.symbol_table.enter_program(node.name)  # Program identifier
+        self.symbol_table.enter_program(node.name, key=node.key)  # Program identifier
         
         # Visit declarations
         if node.declarations:
@@ -160,9 +179,10 @@ class SemanticVisitor:
     def visit_ConstDeclNode(self, node: ConstDeclNode) -> None:
         """visit constant declaration - add ke symbol table"""
         # Check for duplicate declaration
-        existing = self.symbol_table.lookup_in_current_scope(node.name)
+        existing = self.symbol_table.lookup_in_current_scope(node.key)
         if existing:
-            self.add_error(f"Duplicate declaration of constant '{node.name}'", node)
+            self.reject_duplicate(existing, ObjectType.CONSTANT, None,
+                                  f"Duplicate declaration of constant '{node.name}'", node)
             return
         
         # Determine type from value
@@ -179,7 +199,7 @@ class SemanticVisitor:
             data_type = DataType.INTEGER  # Default
         
         # Enter constant into symbol table and get index
-        tab_index = self.symbol_table.enter_constant(node.name, data_type, node.value)
+        tab_index = self.symbol_table.enter_constant(node.name, data_type, node.value, key=node.key)
         
         # Decorate the AST node
         node.tab_index = tab_index
@@ -189,9 +209,10 @@ class SemanticVisitor:
     def visit_TypeDeclNode(self, node: TypeDeclNode) -> None:
         """visit type declaration - add custom type ke symbol table"""
         # Check for duplicate declaration
-        existing = self.symbol_table.lookup_in_current_scope(node.name)
+        existing = self.symbol_table.lookup_in_current_scope(node.key)
         if existing:
-            self.add_error(f"Duplicate declaration of type '{node.name}'", node)
+            self.reject_duplicate(existing, ObjectType.TYPE, None,
+                                  f"Duplicate declaration of type '{node.name}'", node)
             return
         
         # Get the data type from AST
@@ -200,9 +221,9 @@ class SemanticVisitor:
         # Handle array types
         if isinstance(node.type_spec, ArrayTypeNode):
             array_ref = self._process_array_type(node.type_spec)
-            tab_index = self.symbol_table.enter_type(node.name, DataType.ARRAY, array_ref)
+            tab_index = self.symbol_table.enter_type(node.name, DataType.ARRAY, array_ref, key=node.key)
         else:
-            tab_index = self.symbol_table.enter_type(node.name, data_type)
+            tab_index = self.symbol_table.enter_type(node.name, data_type, key=node.key)
         
         # Decorate the AST node
         node.tab_index = tab_index
@@ -222,10 +243,12 @@ class SemanticVisitor:
         # Handle custom type references (e.g., arr: Larik1D where Larik1D is array type)
         elif isinstance(node.type_spec, CustomTypeNode):
             # Look up the custom type in symbol table
-            type_entry = self.symbol_table.lookup(node.type_spec.type_name)
+            type_entry = self.symbol_table.lookup(node.type_spec.key)
             if type_entry and type_entry.obj == ObjectType.TYPE:
                 data_type = type_entry.type
                 array_ref = type_entry.ref  # Get array reference if it's an array type
+            elif type_entry and self.rejected_as(type_entry, (ObjectType.TYPE,)):
+                data_type = DataType.INTEGER  # Fallback, duplicate type already reported
             else:
                 self.add_error(f"Unknown type '{node.type_spec.type_name}'", node)
                 data_type = DataType.INTEGER  # Fallback
@@ -234,15 +257,16 @@ class SemanticVisitor:
         tab_indices = []
 
         # Enter each variable name
-        for var_name in node.names:
+        for var_name, key in zip(node.names, node.keys):
             # Check for duplicate declaration in current scope
-            existing = self.symbol_table.lookup_in_current_scope(var_name)
+            existing = self.symbol_table.lookup_in_current_scope(key)
             if existing:
-                self.add_error(f"Duplicate declaration of variable '{var_name}'", node)
+                self.reject_duplicate(existing, ObjectType.VARIABLE, data_type,
+                                      f"Duplicate declaration of variable '{var_name}'", node)
                 tab_indices.append(-1)
                 continue
 
-            tab_index = self.symbol_table.enter_variable(var_name, data_type, array_ref)
+            tab_index = self.symbol_table.enter_variable(var_name, data_type, array_ref, key=key)
             tab_indices.append(tab_index)
 
         # Decorate the AST node
@@ -255,13 +279,14 @@ class SemanticVisitor:
     def visit_ProcedureDeclNode(self, node: ProcedureDeclNode) -> None:
         """visit procedure declaration"""
         # Check for duplicate declaration
-        existing = self.symbol_table.lookup_in_current_scope(node.name)
+        existing = self.symbol_table.lookup_in_current_scope(node.key)
         if existing:
-            self.add_error(f"Duplicate declaration of procedure '{node.name}'", node)
+            self.reject_duplicate(existing, ObjectType.PROCEDURE, DataType.VOID,
+                                  f"Duplicate declaration of procedure '{node.name}'", node)
             return
         
         # Enter procedure into symbol table (creates new scope)
-        tab_index = self.symbol_table.enter_procedure(node.name, DataType.VOID)
+        tab_index = self.symbol_table.enter_procedure(node.name, DataType.VOID, key=node.key)
         
         # Decorate the AST node
         node.tab_index = tab_index
@@ -286,16 +311,17 @@ class SemanticVisitor:
     def visit_FunctionDeclNode(self, node: FunctionDeclNode) -> None:
         """visit function declaration"""
         # Check for duplicate declaration
-        existing = self.symbol_table.lookup_in_current_scope(node.name)
+        existing = self.symbol_table.lookup_in_current_scope(node.key)
         if existing:
-            self.add_error(f"Duplicate declaration of function '{node.name}'", node)
+            self.reject_duplicate(existing, ObjectType.FUNCTION, None,
+                                  f"Duplicate declaration of function '{node.name}'", node)
             return
         
         # Get return type
         return_type = data_type_from_ast(node.return_type) if node.return_type else DataType.INTEGER
         
         # Enter function into symbol table (creates new scope)
-        tab_index = self.symbol_table.enter_procedure(node.name, return_type)
+        tab_index = self.symbol_table.enter_procedure(node.name, return_type, key=node.key)
         
         # Decorate the AST node
         node.tab_index = tab_index
@@ -332,15 +358,16 @@ class SemanticVisitor:
         param_type = data_type_from_ast(node.type_spec)
 
         tab_indices = []
-        for param_name in node.names:
+        for param_name, key in zip(node.names, node.keys):
             # Check for duplicate parameter
-            existing = self.symbol_table.lookup_in_current_scope(param_name)
+            existing = self.symbol_table.lookup_in_current_scope(key)
             if existing:
-                self.add_error(f"Duplicate parameter '{param_name}'", node)
+                self.reject_duplicate(existing, ObjectType.PARAMETER, param_type,
+                                      f"Duplicate parameter '{param_name}'", node)
                 tab_indices.append(-1)
                 continue
 
-            tab_index = self.symbol_table.enter_parameter(param_name, param_type)
+            tab_index = self.symbol_table.enter_parameter(param_name, param_type, key=key)
             tab_indices.append(tab_index)
 
         # Decorate the AST node
@@ -368,7 +395,9 @@ class SemanticVisitor:
     
     def visit_CustomTypeNode(self, node: CustomTypeNode) -> DataType:
         """visit custom type node - cek apakah type ada"""
-        type_entry = self.symbol_table.lookup(node.type_name)
+        type_entry = self.symbol_table.lookup(node.key)
+        if type_entry and type_entry.obj != ObjectType.TYPE and self.rejected_as(type_entry, (ObjectType.TYPE,)):
+            return DataType.INTEGER  # Duplicate type already reported
         if not type_entry or type_entry.obj != ObjectType.TYPE:
             self.add_error(f"Unknown type '{node.type_name}'", node)
             return DataType.INTEGER  # Default fallback
@@ -455,7 +484,7 @@ class SemanticVisitor:
     def visit_ForStatementNode(self, node: ForStatementNode) -> None:
         """visit for statement - cek loop variable dan bounds"""
         # Check loop variable exists and is integer
-        var_entry = self.symbol_table.lookup(node.var_name)
+        var_entry = self.symbol_table.lookup(node.key)
         if not var_entry:
             self.add_error(f"Undeclared loop variable '{node.var_name}'", node)
         elif var_entry.type != DataType.INTEGER:
@@ -488,11 +517,11 @@ class SemanticVisitor:
     def visit_ProcedureCallNode(self, node: ProcedureCallNode) -> None:
         """visit procedure call - cek procedure ada dan arguments match"""
         # Look up procedure
-        proc_entry, tab_index = self.symbol_table.lookup_with_index(node.name)
+        proc_entry, tab_index = self.symbol_table.lookup_with_index(node.key)
         
         if not proc_entry:
             # Built-in procedures are handled specially (not in symbol table)
-            if node.name.lower() in ['writeln', 'write', 'readln', 'read']:
+            if node.key in ('writeln', 'write', 'readln', 'read'):
                 # Visit arguments but don't type check built-ins strictly
                 for arg in node.args:
                     self.visit(arg)
@@ -506,6 +535,11 @@ class SemanticVisitor:
                 return
         
         if proc_entry.obj not in [ObjectType.PROCEDURE, ObjectType.FUNCTION]:
+            if self.rejected_as(proc_entry, (ObjectType.PROCEDURE, ObjectType.FUNCTION)):
+                # Duplicate declaration already reported, still check the arguments
+                for arg in node.args:
+                    self.visit(arg)
+                return
             self.add_error(f"'{node.name}' is not a procedure", node)
             return
         
@@ -572,13 +606,13 @@ class SemanticVisitor:
     def visit_VarNode(self, node: VarNode) -> DataType:
         """visit variable reference - look up di symbol table"""
         # Handle boolean literals (true, false) as special built-in constants
-        if node.name.lower() in ['true', 'false']:
+        if node.key in ('true', 'false'):
             node.tab_index = -1  # No symbol table entry (built-in)
             node.computed_type = DataType.BOOLEAN
             node.scope_level = 0  # Global level
             return DataType.BOOLEAN
 
-        entry, tab_index = self.symbol_table.lookup_with_index(node.name)
+        entry, tab_index = self.symbol_table.lookup_with_index(node.key)
 
         if not entry:
             self.add_error(f"Undeclared variable '{node.name}'", node)
@@ -587,7 +621,9 @@ class SemanticVisitor:
         # Allow FUNCTION in addition to VARIABLE, PARAMETER, CONSTANT
         # This is needed for function return value assignment (e.g., functionName := result)
         if entry.obj not in [ObjectType.VARIABLE, ObjectType.PARAMETER, ObjectType.CONSTANT, ObjectType.FUNCTION]:
-            self.add_error(f"'{node.name}' is not a variable", node)
+            if not self.rejected_as(entry, (ObjectType.VARIABLE, ObjectType.PARAMETER,
+                                            ObjectType.CONSTANT, ObjectType.FUNCTION)):
+                self.add_error(f"'{node.name}' is not a variable", node)
             return None
 
         # Decorate the AST node
@@ -599,14 +635,18 @@ class SemanticVisitor:
     
     def visit_ArrayAccessNode(self, node: ArrayAccessNode) -> DataType:
         """visit array access - cek array ada dan index type"""
-        entry, tab_index = self.symbol_table.lookup_with_index(node.array_name)
+        entry, tab_index = self.symbol_table.lookup_with_index(node.key)
         
         if not entry:
             self.add_error(f"Undeclared array '{node.array_name}'", node)
             return None
         
         if entry.type != DataType.ARRAY:
-            self.add_error(f"'{node.array_name}' is not an array", node)
+            if self.rejected_as(entry, data_type=DataType.ARRAY):
+                # Duplicate declaration already reported, still check the index
+                self.visit(node.index)
+            else:
+                self.add_error(f"'{node.array_name}' is not an array", node)
             return None
         
         # Check index type
@@ -630,14 +670,19 @@ class SemanticVisitor:
     
     def visit_FunctionCallNode(self, node: FunctionCallNode) -> DataType:
         """visit function call - cek function ada dan return type"""
-        entry, tab_index = self.symbol_table.lookup_with_index(node.name)
+        entry, tab_index = self.symbol_table.lookup_with_index(node.key)
         
         if not entry:
             self.add_error(f"Undeclared function '{node.name}'", node)
             return None
         
         if entry.obj != ObjectType.FUNCTION:
-            self.add_error(f"'{node.name}' is not a function", node)
+            if self.rejected_as(entry, (ObjectType.FUNCTION,)):
+                # Duplicate declaration already reported, still check the arguments
+                for arg in node.args:
+                    self.visit(arg)
+            else:
+                self.add_error(f"'{node.name}' is not a function", node)
             return None
         
         # Visit all arguments
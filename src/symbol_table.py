@@ -26,6 +26,7 @@ from ast_nodes import (
     ProcedureDeclNode, FunctionDeclNode, PrimitiveTypeNode, ArrayTypeNode,
     CustomTypeNode, RangeTypeNode, TypeSpecNode
 )
+from token_stream import fold_name
 
 class ObjectType(Enum):
     CONSTANT = "constant"
@@ -56,9 +57,13 @@ class SymbolTableEntry:
         nrm: bool = True,
         lev: int = 0,
         adr: int = 0,
-        link: int = -1
+        link: int = -1,
+        name: Optional[str] = None
     ):
         self.id = id
+        # pascal-s case-insensitive: nama versi case-fold yang di-intern (Token.name / node.key),
+        # dibandingin pake is. kalo gak dikasih baru di-fold dari id
+        self.name = fold_name(id) if name is None else name
         self.obj = obj
         self.type = type
         self.ref = ref
@@ -190,7 +195,8 @@ class SymbolTable:
     def exit_scope(self):
         self.exit_block()
     
-    def enter_procedure(self, name: str, return_type: DataType, level: int = None) -> int:
+    def enter_procedure(self, name: str, return_type: DataType, level: int = None,
+                        key: Optional[str] = None) -> int:
         if level is None:
             level = self.current_level
         
@@ -199,6 +205,7 @@ class SymbolTable:
         
         entry = SymbolTableEntry(
             id=name,
+            name=key,
             obj=ObjectType.PROCEDURE if return_type == DataType.VOID else ObjectType.FUNCTION,
             type=return_type,
             ref=block_index,
@@ -210,9 +217,11 @@ class SymbolTable:
         self.tab.append(entry)
         return len(self.tab) - 1
     
-    def enter_variable(self, name: str, data_type: DataType, array_ref: int = -1) -> int:
+    def enter_variable(self, name: str, data_type: DataType, array_ref: int = -1,
+                       key: Optional[str] = None) -> int:
         entry = SymbolTableEntry(
             id=name,
+            name=key,
             obj=ObjectType.VARIABLE,
             type=data_type,
             ref=array_ref,
@@ -229,9 +238,10 @@ class SymbolTable:
         self.next_address += self._get_type_size(data_type, array_ref)
         return tab_index
     
-    def enter_program(self, name: str) -> int:
+    def enter_program(self, name: str, key: Optional[str] = None) -> int:
         entry = SymbolTableEntry(
             id=name,
+            name=key,
             obj=ObjectType.PROGRAM,
             type=DataType.VOID,
             ref=-1,
@@ -246,9 +256,11 @@ class SymbolTable:
             self.btab[self.current_block].last = tab_index
         return tab_index
     
-    def enter_constant(self, name: str, data_type: DataType, value: Any) -> int:
+    def enter_constant(self, name: str, data_type: DataType, value: Any,
+                       key: Optional[str] = None) -> int:
         entry = SymbolTableEntry(
             id=name,
+            name=key,
             obj=ObjectType.CONSTANT,
             type=data_type,
             ref=0,
@@ -263,9 +275,11 @@ class SymbolTable:
             self.btab[self.current_block].last = tab_index
         return tab_index
     
-    def enter_type(self, name: str, type_def: DataType, ref: int = -1) -> int:
+    def enter_type(self, name: str, type_def: DataType, ref: int = -1,
+                   key: Optional[str] = None) -> int:
         entry = SymbolTableEntry(
             id=name,
+            name=key,
             obj=ObjectType.TYPE,
             type=type_def,
             ref=ref,
@@ -280,9 +294,11 @@ class SymbolTable:
             self.btab[self.current_block].last = tab_index
         return tab_index
     
-    def enter_parameter(self, name: str, data_type: DataType, by_reference: bool = False) -> int:
+    def enter_parameter(self, name: str, data_type: DataType, by_reference: bool = False,
+                        key: Optional[str] = None) -> int:
         entry = SymbolTableEntry(
             id=name,
+            name=key,
             obj=ObjectType.PARAMETER,
             type=data_type,
             nrm=not by_reference,
@@ -317,7 +333,9 @@ class SymbolTable:
         self.atab.append(entry)
         return len(self.atab) - 1
     
-    def lookup(self, name: str) -> Optional[SymbolTableEntry]:
+    # key = nama yang udah di-fold + di-intern (Token.name, node.key, atau fold_name(...)),
+    # lookup cuma bandingin identitas tanpa lowercase ulang
+    def lookup(self, key: str) -> Optional[SymbolTableEntry]:
         if len(self.tab) == 0:
             return None
         
@@ -326,29 +344,22 @@ class SymbolTable:
             self.display[self.current_level] >= 0):
             current_scope_start = max(self.RESERVED_COUNT, self.display[self.current_level])
         
-        for i in range(len(self.tab) - 1, self.RESERVED_COUNT - 1, -1):
-            entry = self.tab[i]
-            if entry is None:
-                continue
-            if entry.id == name:
-                if entry.lev <= self.current_level:
-                    return entry
-        return None
+        entry, _ = self.lookup_with_index(key)
+        return entry
     
-    def lookup_with_index(self, name: str) -> tuple:
+    def lookup_with_index(self, key: str) -> tuple:
         if len(self.tab) == 0:
             return (None, -1)
         
         for i in range(len(self.tab) - 1, self.RESERVED_COUNT - 1, -1):
             entry = self.tab[i]
-            if entry is None:
+            if entry is None or entry.lev > self.current_level:
                 continue
-            if entry.id == name:
-                if entry.lev <= self.current_level:
-                    return (entry, i)
+            if entry.name is key:
+                return (entry, i)
         return (None, -1)
     
-    def lookup_in_current_scope(self, name: str) -> Optional[SymbolTableEntry]:
+    def lookup_in_current_scope(self, key: str) -> Optional[SymbolTableEntry]:
         current_scope_start = self.RESERVED_COUNT
         if (self.current_level < len(self.display) and 
             self.display[self.current_level] >= 0):
@@ -358,7 +369,7 @@ class SymbolTable:
             entry = self.tab[i]
             if entry is None:
                 continue
-            if entry.id == name and entry.lev == self.current_level:
+            if entry.name is key and entry.lev == self.current_level:
                 return entry
         return None
     
@@ -459,23 +470,23 @@ if __name__ == "__main__":
     st.enter_variable("y", DataType.REAL)
     st.enter_constant("PI", DataType.REAL, 3.14159)
     
-    result = st.lookup("x")
+    result = st.lookup(fold_name("x"))
     print(f"Lookup 'x': {result}")
     
-    result = st.lookup("PI")
+    result = st.lookup(fold_name("PI"))
     print(f"Lookup 'PI': {result}")
     
-    result = st.lookup("nonexistent")
+    result = st.lookup(fold_name("nonexistent"))
     print(f"Lookup 'nonexistent': {result}")
     
     proc_idx = st.enter_procedure("test_proc", DataType.VOID)
     st.enter_parameter("param1", DataType.INTEGER)
     st.enter_variable("local_var", DataType.BOOLEAN)
     
-    result = st.lookup("param1")
+    result = st.lookup(fold_name("param1"))
     print(f"Lookup 'param1' in procedure: {result}")
     
-    result = st.lookup("x")
+    result = st.lookup(fold_name("x"))
     print(f"Lookup global 'x' from procedure: {result}")
     
     st.print_table()
\ No newline at end of file
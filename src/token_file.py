@@ -0,0 +1,154 @@
+# format file token binary (.ptk) buat nyambung lexer dan parser antar stage/mesin
+# gantinya dump teks TYPE(value) per baris: gak perlu parsing per baris, file-nya di-mmap
+# dan array-nya langsung dipake (memoryview), value token diambil dari string table
+#
+# layout (little-endian, tiap section rata 4 byte):
+#   header      : magic "PTOK", version u16, flags u16 (bit 0 = lexing berhenti gara-gara error),
+#                 n_tokens, n_lines, n_strings, panjang blob nama kind, panjang blob string (u32)
+#   nama kind   : nama kind dipisah "\n", index-nya = kode kind di file
+#   kinds       : u16 x n_tokens
+#   value ids   : u32 x n_tokens, index ke string table (value yang sama cuma disimpen sekali)
+#   starts/ends : u32 x n_tokens, offset karakter token di source asli
+#   line starts : u32 x n_lines, offset awal tiap baris source (buat line/column pesan error)
+#   string table: offset u32 x (n_strings + 1) relatif ke awal blob, terus blob UTF-8-nya
+#
+# cara pake (dari root folder):
+#   python3 src/lexer.py rules/dfa_rules_final.json <source_file.pas> -o tokens.ptk
+#   python3 src/compiler.py tokens.ptk
+
+import mmap
+import struct
+import sys
+from array import array
+
+from token_stream import TOKEN_KINDS, SourceMap, TokenStream, kind_id
+
+PTK_MAGIC = b"PTOK"
+PTK_VERSION = 1
+_HEADER = struct.Struct("<4sHHIIIII")
+_FLAG_STOPPED = 1
+
+def _pad(size):
+    return -size % 4
+
+def _little_endian(values):
+    if sys.byteorder == "big":
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values
+
+def _char_offsets(data, positions):
+    # offset byte (urut naik, di batas karakter) -> offset karakter, sekali jalan
+    result = array("I")
+    last_byte = last_char = 0
+    for pos in positions:
+        last_char += len(data[last_byte:pos].decode("utf-8"))
+        last_byte = pos
+        result.append(last_char)
+    return result
+
+def write_token_file(tokens, path):
+    # simpen TokenStream ke file .ptk
+    n = len(tokens)
+    kinds = array("H", tokens.kinds)
+    starts = array("I", map(tokens.offset, range(n)))
+    ends = array("I", map(tokens.end, range(n)))
+    line_starts = array("I", tokens.source_map.line_starts())
+    if tokens.binary:
+        # source bytes/mmap: offset byte diubah jadi offset karakter biar column-nya bener
+        data = tokens.source
+        positions = sorted(set(starts).union(ends, line_starts))
+        chars = dict(zip(positions, _char_offsets(data, positions)))
+        starts = array("I", map(chars.__getitem__, starts))
+        ends = array("I", map(chars.__getitem__, ends))
+        line_starts = array("I", map(chars.__getitem__, line_starts))
+
+    ids = {}
+    value_ids = array("I")
+    string_offsets = array("I", [0])
+    blob = bytearray()
+    for value in map(tokens.value, range(n)):
+        sid = ids.get(value)
+        if sid is None:
+            sid = ids[value] = len(ids)
+            blob += value.encode("utf-8")
+            string_offsets.append(len(blob))
+        value_ids.append(sid)
+
+    names = "\n".join(TOKEN_KINDS).encode("utf-8")
+    flags = _FLAG_STOPPED if tokens.stopped else 0
+    with open(path, "wb") as f:
+        f.write(_HEADER.pack(PTK_MAGIC, PTK_VERSION, flags, n, len(line_starts), len(ids), len(names), len(blob)))
+        f.write(names + b"\0" * _pad(len(names)))
+        f.write(_little_endian(kinds).tobytes() + b"\0" * _pad(2 * n))
+        for values in (value_ids, starts, ends, line_starts, string_offsets):
+            f.write(_little_endian(values).tobytes())
+        f.write(blob)
+    return path
+
+class TokenFileStream(TokenStream):
+    # TokenStream read-only dari file .ptk yang di-mmap
+    # kinds/starts/ends langsung memoryview ke file, value di-decode dari string table pas
+    # pertama diminta terus disimpen, jadi value yang sama selalu object str yang sama
+    def __init__(self, data):
+        magic, version, flags, n, n_lines, n_strings, names_size, blob_size = _HEADER.unpack_from(data)
+        super().__init__(None)
+        # offset di file udah offset karakter, jadi gak dianggep binary walaupun source-nya mmap
+        self.source = data
+        self.stopped = bool(flags & _FLAG_STOPPED)
+
+        view = memoryview(data)
+        pos = _HEADER.size
+        names = bytes(view[pos:pos + names_size]).decode("utf-8").split("\n")
+        pos += names_size + _pad(names_size)
+
+        def section(typecode, count):
+            nonlocal pos
+            size = count * (2 if typecode == "H" else 4)
+            values = view[pos:pos + size].cast(typecode)
+            pos += size + _pad(size)
+            if sys.byteorder == "big":
+                values = _little_endian(array(typecode, values))
+            return values
+
+        kinds = section("H", n)
+        remap = [kind_id(name) for name in names]
+        if remap != list(range(len(remap))):
+            # kode kind di file beda sama di process ini
+            kinds = array("H", [remap[kind] for kind in kinds])
+        self.kinds = kinds
+        self.value_ids = section("I", n)
+        self.starts = section("I", n)
+        self.ends = section("I", n)
+        self.source_map = SourceMap(line_starts=section("I", n_lines))
+        self._string_offsets = section("I", n_strings + 1)
+        self._blob = pos
+        self._strings = [None] * n_strings
+
+    def value(self, index):
+        sid = self.value_ids[index]
+        value = self._strings[sid]
+        if value is None:
+            start = self._blob + self._string_offsets[sid]
+            end = self._blob + self._string_offsets[sid + 1]
+            value = self._strings[sid] = str(self.source[start:end], "utf-8")
+        return value
+
+    def values(self, start, end):
+        # source-nya isi file .ptk, value cuma bisa diambil dari string table
+        return [self.value(i) for i in range(start, end)]
+
+    def __repr__(self):
+        return f"TokenFileStream({len(self.kinds)} tokens)"
+
+def load_token_file(path):
+    # buka file .ptk jadi TokenFileStream (file-nya di-mmap, gak dibaca per baris)
+    with open(path, "rb") as f:
+        header = f.read(_HEADER.size)
+        if len(header) < _HEADER.size or header[:4] != PTK_MAGIC:
+            raise ValueError(f"'{path}' is not a .ptk token file")
+        version = _HEADER.unpack(header)[1]
+        if version != PTK_VERSION:
+            raise ValueError(f"Unsupported .ptk version {version} in '{path}' (expected {PTK_VERSION})")
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    return TokenFileStream(data)
@@ -0,0 +1,341 @@
+# token stream yang compact buat output lexer
+# token disimpen sebagai array paralel: kind (integer) + offset start/end ke source
+# value token baru di-slice dari source pas diminta, jadi tiap token cuma makan ~10 byte
+
+import sys
+from array import array
+from bisect import bisect_left, bisect_right
+
+# daftar token kind, index-nya jadi kode integer di TokenStream.kinds
+TOKEN_KINDS = [
+    "KEYWORD", "IDENTIFIER", "NUMBER", "CHAR_LITERAL", "STRING_LITERAL",
+    "ARITHMETIC_OPERATOR", "LOGICAL_OPERATOR", "RELATIONAL_OPERATOR", "ASSIGN_OPERATOR",
+    "SEMICOLON", "COLON", "COMMA", "DOT", "RANGE_OPERATOR",
+    "LPARENTHESIS", "RPARENTHESIS", "LBRACKET", "RBRACKET",
+    "UNKNOWN", "START",
+]
+KIND_IDS = {name: i for i, name in enumerate(TOKEN_KINDS)}
+
+# batas jumlah potongan geseran offset yang ditunda di TokenStream.splice
+MAX_PENDING_SHIFTS = 32
+
+def kind_id(name):
+    # kode integer buat token kind, kind baru (misal dari rules lain) didaftarin otomatis
+    kind = KIND_IDS.get(name)
+    if kind is None:
+        kind = KIND_IDS[name] = len(TOKEN_KINDS)
+        TOKEN_KINDS.append(name)
+    return kind
+
+# pascal-s case-insensitive: reserved word + simbol operator/tanda baca punya word ID tetep
+# (index di WORDS, lowercase), Token.word / TokenStream.words. tabelnya gak nambah pas lexing,
+# identifier sama literal gak dapet word ID (NO_WORD)
+WORDS = (
+    "program", "variabel", "mulai", "selesai", "jika", "maka", "selain-itu", "selama", "lakukan",
+    "untuk", "ke", "turun-ke", "integer", "real", "boolean", "char", "larik", "dari", "prosedur",
+    "fungsi", "konstanta", "tipe", "string", "kasus", "ulangi", "sampai", "rekaman",
+    "dan", "atau", "tidak", "bagi", "mod",
+    "+", "-", "*", "/", "=", "<>", "<", ">", "<=", ">=", ":=",
+    ";", ":", ",", ".", "..", "(", ")", "[", "]",
+)
+WORD_IDS = {word: i for i, word in enumerate(WORDS)}
+NO_WORD = -1
+# token kind yang value-nya gak pernah dibandingin sama reserved word / simbol
+NO_WORD_KINDS = frozenset(("IDENTIFIER", "NUMBER", "CHAR_LITERAL", "STRING_LITERAL"))
+
+def word_id(value):
+    word = WORD_IDS.get(value)
+    if word is None:
+        return WORD_IDS.get(value.lower(), NO_WORD)
+    return word
+
+def fold_name(value):
+    # nama identifier versi case-fold yang di-intern, ejaan yang cuma beda huruf besar/kecil
+    # hasilnya object yang sama, jadi bisa dibandingin pake is (lihat TokenStream.names)
+    return sys.intern(value.lower())
+
+class SourceMap:
+    # ubah offset karakter jadi (line, column), dua-duanya mulai dari 1
+    # index awal tiap baris baru dibikin pas pertama kali ada yang nanya posisi
+    # text bisa str (offset karakter) atau bytes/mmap UTF-8 (offset byte, column tetep karakter)
+    # text=None buat mode streaming: awal baris dicatet lewat feed() sambil text-nya dibaca
+    # atau line_starts udah dikasih dari luar (misal dari file token .ptk)
+    def __init__(self, text=None, line_starts=None):
+        self.text = text
+        self.binary = text is not None and not isinstance(text, str)
+        # (start, end, delta, source map baru) kalo source-nya udah diedit (lihat forward)
+        self._forward = None
+        if line_starts is not None:
+            self._line_starts = line_starts
+        else:
+            self._line_starts = None if text is not None else array("I", [0])
+
+    def feed(self, chunk, offset):
+        # mode streaming: catet awal baris dari potongan text yang mulai di offset
+        starts = self._line_starts
+        i = chunk.find("\n")
+        while i >= 0:
+            starts.append(offset + i + 1)
+            i = chunk.find("\n", i + 1)
+
+    def line_starts(self):
+        if self._line_starts is None:
+            text = self.text
+            newline = b"\n" if self.binary else "\n"
+            starts = array("I", [0])
+            i = text.find(newline)
+            while i >= 0:
+                starts.append(i + 1)
+                i = text.find(newline, i + 1)
+            self._line_starts = starts
+        return self._line_starts
+
+    def forward(self, start, end, delta, successor):
+        # source-nya diedit: karakter [start, end) diganti, text setelahnya geser delta, posisinya
+        # sekarang dijawab successor. offset lama yang masih dipegang (misal Token di parse tree
+        # yang dipake ulang parser incremental) diterjemahin dulu, jadi line/column-nya tetep
+        # bener tanpa harus ngubah token-nya satu-satu
+        self._forward = (start, end, delta, successor)
+        self.text = None
+        self._line_starts = None
+
+    def line_col(self, offset):
+        source_map = self
+        while source_map._forward is not None:
+            start, end, delta, source_map = source_map._forward
+            if offset >= end:
+                offset += delta
+            elif offset > start:
+                # offset di dalem daerah yang diedit, tunjuk awal edit
+                offset = start
+        starts = source_map.line_starts()
+        line = bisect_right(starts, offset)
+        if source_map.binary:
+            return line, len(source_map.text[starts[line - 1]:offset].decode("utf-8")) + 1
+        return line, offset - starts[line - 1] + 1
+
+class TokenStream:
+    # source bisa str atau bytes/mmap UTF-8, kalo bytes value-nya di-decode pas diminta
+    def __init__(self, source):
+        self.source = source
+        self.source_map = SourceMap(source)
+        self.binary = self.source_map.binary
+        self.kinds = array("H")
+        self.starts = array("I")
+        self.ends = array("I")
+        # index -> value buat token yang value-nya bukan slice source (misal selain-itu)
+        self.overrides = {}
+        # True kalo lexing-nya berhenti di tengah gara-gara error
+        self.stopped = False
+        # geseran offset yang ditunda (lihat splice): token index >= _shift_at[k] (sampe batas
+        # berikutnya) offset aslinya offset di array + _shift_by[k]
+        self._shift_at = []
+        self._shift_by = []
+        # word ID / nama semua token (lihat words, names), dihitung sekali pas pertama diminta
+        self._words = None
+        self._names = None
+
+    def append(self, kind, start, end, value=None):
+        if value is not None:
+            self.overrides[len(self.kinds)] = value
+        self.kinds.append(kind)
+        self.starts.append(start)
+        self.ends.append(end)
+
+    def __len__(self):
+        return len(self.kinds)
+
+    def type(self, index):
+        return TOKEN_KINDS[self.kinds[index]]
+
+    def _shift(self, index):
+        k = bisect_right(self._shift_at, index) - 1
+        return self._shift_by[k] if k >= 0 else 0
+
+    def offset(self, index):
+        if self._shift_at:
+            return self.starts[index] + self._shift(index)
+        return self.starts[index]
+
+    def end(self, index):
+        if self._shift_at:
+            return self.ends[index] + self._shift(index)
+        return self.ends[index]
+
+    def line_col(self, index):
+        # posisi (line, column) token ke-index di source
+        return self.source_map.line_col(self.offset(index))
+
+    def value(self, index):
+        if self.overrides:
+            value = self.overrides.get(index)
+            if value is not None:
+                return value
+        if self._shift_at:
+            shift = self._shift(index)
+            value = self.source[self.starts[index] + shift:self.ends[index] + shift]
+        else:
+            value = self.source[self.starts[index]:self.ends[index]]
+        if self.binary:
+            return value.decode("utf-8")
+        return value
+
+    def types(self, start, end):
+        # type token [start, end) sekaligus (lebih cepet daripada type() satu-satu)
+        return [TOKEN_KINDS[kind] for kind in self.kinds[start:end]]
+
+    def offsets(self, start, end):
+        if self._shift_at:
+            return [self.offset(i) for i in range(start, end)]
+        return list(self.starts[start:end])
+
+    def values(self, start, end):
+        # value token [start, end) sekaligus, slice source-nya langsung tanpa lewat value()
+        if self._shift_at or self.binary:
+            return [self.value(i) for i in range(start, end)]
+        source = self.source
+        values = [source[a:b] for a, b in zip(self.starts[start:end], self.ends[start:end])]
+        overrides = self.overrides
+        if len(overrides) < end - start:
+            for index, value in overrides.items():
+                if start <= index < end:
+                    values[index - start] = value
+        else:
+            for index in range(start, end):
+                value = overrides.get(index)
+                if value is not None:
+                    values[index - start] = value
+        return values
+
+    def words(self, start, end):
+        # word ID token [start, end) (NO_WORD buat identifier/literal). word ID satu stream
+        # dihitung sekali terus disimpen, dibuang kalo token-nya berubah (append/splice)
+        words = self._words
+        if words is None or len(words) != len(self.kinds):
+            no_word = frozenset(KIND_IDS[kind] for kind in NO_WORD_KINDS if kind in KIND_IDS)
+            get = WORD_IDS.get
+            words = [NO_WORD if kind in no_word else get(value)
+                     for kind, value in zip(self.kinds, self.values(0, len(self.kinds)))]
+            # spelling yang gak persis sama (huruf besar) dicari lagi versi lowercase-nya
+            if None in words:
+                for index, word in enumerate(words):
+                    if word is None:
+                        words[index] = word_id(self.value(index))
+            words = self._words = array("b", words)
+        return words[start:end]
+
+    def names(self, start, end):
+        # Token.name token [start, end): identifier di-case-fold + di-intern sekali per ejaan
+        # (fold_name), reserved word / simbol pake WORDS, literal value aslinya. dihitung sekali
+        # per stream terus disimpen kayak words
+        names = self._names
+        if names is None or len(names) != len(self.kinds):
+            identifier = KIND_IDS.get("IDENTIFIER")
+            folded = {}
+            names = []
+            append = names.append
+            for kind, word, value in zip(self.kinds, self.words(0, len(self.kinds)),
+                                         self.values(0, len(self.kinds))):
+                if word != NO_WORD:
+                    append(WORDS[word])
+                elif kind == identifier:
+                    name = folded.get(value)
+                    if name is None:
+                        name = folded[value] = fold_name(value)
+                    append(name)
+                else:
+                    append(value)
+            self._names = names
+        return names[start:end]
+
+    def _segments(self):
+        # (index awal, index akhir, geseran) tiap potongan token yang geserannya sama
+        bounds = [0] + self._shift_at + [len(self.kinds)]
+        shifts = [0] + self._shift_by
+        return [(bounds[k], bounds[k + 1], shifts[k]) for k in range(len(shifts))]
+
+    def index_at(self, offset):
+        # index token pertama yang offset-nya >= offset
+        for first, last, shift in self._segments():
+            if last > first and self.starts[last - 1] + shift >= offset:
+                return bisect_left(self.starts, offset - shift, first, last)
+        return len(self.kinds)
+
+    def splice(self, first, last, fresh, delta, source):
+        # ganti token [first, last) pake token dari TokenStream fresh (offset-nya udah offset
+        # source baru), token last.. offset-nya geser sejauh delta, source diganti source baru
+        # geseran offset gak ditulis ke array, cukup dicatet per potongan (_shift_at, _shift_by)
+        # jadi biayanya gak tergantung panjang file
+        grow = len(fresh) - (last - first)
+        shift_at, shift_by = [], []
+        for index, shift in zip(self._shift_at, self._shift_by):
+            if index < first:
+                shift_at.append(index)
+                shift_by.append(shift)
+        # token baru geserannya 0, token lama setelah last ikut geser delta
+        bounds = [(first, 0), (last + grow, self._shift(last) + delta if last < len(self.kinds) else 0)]
+        bounds += [(index + grow, shift + delta) for index, shift in zip(self._shift_at, self._shift_by)
+                   if index > last]
+        for index, shift in bounds:
+            if shift_at and shift_at[-1] == index:
+                shift_at.pop()
+                shift_by.pop()
+            if shift != (shift_by[-1] if shift_by else 0):
+                shift_at.append(index)
+                shift_by.append(shift)
+
+        self.kinds[first:last] = fresh.kinds
+        self.starts[first:last] = fresh.starts
+        self.ends[first:last] = fresh.ends
+        if grow:
+            overrides = {}
+            for index, value in self.overrides.items():
+                if index < first:
+                    overrides[index] = value
+                elif index >= last:
+                    overrides[index + grow] = value
+            self.overrides = overrides
+        else:
+            # jumlah token sama (edit biasa di tengah identifier/angka), index lain gak berubah
+            for index in range(first, last):
+                self.overrides.pop(index, None)
+        for index, value in fresh.overrides.items():
+            self.overrides[index + first] = value
+        self._shift_at, self._shift_by = shift_at, shift_by
+        while len(shift_at) > MAX_PENDING_SHIFTS:
+            self._merge_smallest_segment()
+
+        self.source = source
+        self.source_map = SourceMap(source)
+        self._words = None
+        self._names = None
+
+    def _merge_smallest_segment(self):
+        # potongan token paling sedikit geserannya ditulis beneran ke array, disamain sama
+        # potongan sebelumnya (offset gak bakal negatif: offset asli >= geseran potongan sebelumnya)
+        segments = self._segments()
+        k = min(range(1, len(segments)), key=lambda k: segments[k][1] - segments[k][0])
+        first, last, shift = segments[k]
+        diff = shift - segments[k - 1][2]
+        self.starts[first:last] = array("I", map(diff.__add__, self.starts[first:last]))
+        self.ends[first:last] = array("I", map(diff.__add__, self.ends[first:last]))
+        del self._shift_at[k - 1]
+        del self._shift_by[k - 1]
+        if k - 1 < len(self._shift_by) and self._shift_by[k - 1] == segments[k - 1][2]:
+            del self._shift_at[k - 1]
+            del self._shift_by[k - 1]
+
+    def __getitem__(self, index):
+        # akses kayak list of tuple (type, value) biar kode lama tetep jalan
+        if index < 0:
+            index += len(self.kinds)
+        if not 0 <= index < len(self.kinds):
+            raise IndexError("token index out of range")
+        return (TOKEN_KINDS[self.kinds[index]], self.value(index))
+
+    def __iter__(self):
+        for i in range(len(self.kinds)):
+            yield (TOKEN_KINDS[self.kinds[i]], self.value(i))
+
+    def __repr__(self):
+        return f"TokenStream({len(self.kinds)} tokens)"
@@ -1,45 +1,79 @@
+from parser import NODE_KINDS, ParseNode
+from event_tree import FINISH, EventTree
 
+# node hasil mode compress (UnitChainNode) dijabarin lagi per nonterminal di chain-nya,
+# jadi output-nya sama persis kayak parse tree biasa. tree-nya dijalanin pake stack eksplisit
+# (gak rekursif), jadi tree yang nesting-nya dalem banget (misal hasil LL1Parser) tetep bisa di-print
 
+def tree_lines(node, indent="", is_last=True, is_root=False):
+    # baris-baris hasil print tree, satu per node/token
+    stack = [(node, indent, is_last, is_root)]
+    while stack:
+        node, indent, is_last, is_root = stack.pop()
+        connector = "" if is_root else ("└── " if is_last else "├── ")
+
+        if isinstance(node, ParseNode):
+            for kind in node.chain:
+                yield indent + connector + NODE_KINDS[kind]
+                indent = indent if is_root else (indent + ("    " if is_last else "│   "))
+                # nonterminal berikutnya di chain itu anak satu-satunya
+                connector, is_last, is_root = "└── ", True, False
+            children = node.children
+
+            # dimasukin kebalik biar anak pertama keluar duluan
+            last = len(children) - 1
+            for i in range(last, -1, -1):
+                stack.append((children[i], indent, i == last, False))
+        else:
+            token_str = f"{node.type}({node.value})"
+            yield indent + connector + token_str
 
 def print_tree(node, indent="", is_last=True, is_root=False):
     if node is None:
         return
+    if isinstance(node, EventTree):
+        print(events_to_string(node))
+        return
 
-    connector = "" if is_root else ("└── " if is_last else "├── ")
-
-    if isinstance(node, dict):
-        if "type" in node:
-            print(indent + connector + node["type"])
-            children = node.get("children", [])
-            new_indent = indent if is_root else (indent + ("    " if is_last else "│   "))
-
-            for i, child in enumerate(children):
-                print_tree(child, new_indent, i == len(children) - 1, is_root=False)
-        else:
-            print(indent + connector + str(node))
-    else:
-        token_str = f"{node.type}({node.value})"
-        print(indent + connector + token_str)
+    for line in tree_lines(node, indent, is_last, is_root):
+        print(line)
 
 def tree_to_string(node, indent="", is_last=True, is_root=False):
     if node is None:
         return ""
+    if isinstance(node, EventTree):
+        return events_to_string(node)
 
-    result = []
-    connector = "" if is_root else ("└── " if is_last else "├── ")
-
-    if isinstance(node, dict):
-        if "type" in node:
-            result.append(indent + connector + node["type"])
-            children = node.get("children", [])
-            new_indent = indent if is_root else (indent + ("    " if is_last else "│   "))
+    return "\n".join(tree_lines(node, indent, is_last, is_root))
 
-            for i, child in enumerate(children):
-                result.append(tree_to_string(child, new_indent, i == len(children) - 1, is_root=False))
+# render EventTree (hasil EventParser) langsung dari array event-nya, tanpa rekursi dan tanpa
+# bikin object node. hasilnya sama kayak tree_to_string(root, is_root=True)
+def events_to_string(tree):
+    events = tree.events
+    ends = tree.ends
+    types, values = tree.token_fields()
+    result = [NODE_KINDS[-events[0] - 2]]
+    append = result.append
+    # indent anak-anak node yang lagi kebuka, paling atas punya node terdalam
+    indents = [""]
+    for position in range(1, len(events)):
+        code = events[position]
+        if code == FINISH:
+            indents.pop()
+            continue
+        indent = indents[-1]
+        # anak terakhir kalo abis subtree-nya langsung finish parent-nya
+        if events[ends[position]] == FINISH:
+            connector, child_indent = "└── ", "    "
         else:
-            result.append(indent + connector + str(node))
-    else:
-        token_str = f"{node.type}({node.value})"
-        result.append(indent + connector + token_str)
-
+            connector, child_indent = "├── ", "│   "
+        if code < 0:
+            append(indent + connector + NODE_KINDS[-code - 2])
+            indents.append(indent + child_indent)
+        elif code & 1:
+            # NUMBER negatif gabungan minus + angka
+            append(f"{indent}{connector}NUMBER(-{values[(code >> 1) + 1]})")
+        else:
+            index = code >> 1
+            append(f"{indent}{connector}{types[index]}({values[index]})")
     return "\n".join(result)
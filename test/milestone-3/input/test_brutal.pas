@@ -60,20 +60,20 @@ mulai
     IsPrime := isPrime
 selesai;
 
-fungsi Max(a, b: integer): integer;
+fungsi Terbesar(a, b: integer): integer;
 mulai
     jika a > b maka
-        Max := a
+        Terbesar := a
     selain-itu
-        Max := b
+        Terbesar := b
 selesai;
 
-fungsi Min(a, b: integer): integer;
+fungsi Terkecil(a, b: integer): integer;
 mulai
     jika a < b maka
-        Min := a
+        Terkecil := a
     selain-itu
-        Min := b
+        Terkecil := b
 selesai;
 
 prosedur BubbleSort(n: integer);
@@ -225,13 +225,13 @@ mulai
 
     { Test 10: Function calls dalam expressions }
     writeln('=== Test 10: Function Calls ===');
-    i := Max(15, 20);
-    j := Min(15, 20);
-    writeln('Max(15, 20) = ', i);
-    writeln('Min(15, 20) = ', j);
+    i := Terbesar(15, 20);
+    j := Terkecil(15, 20);
+    writeln('Terbesar(15, 20) = ', i);
+    writeln('Terkecil(15, 20) = ', j);
 
-    k := Max(Fibonacci(5), Fibonacci(6));
-    writeln('Max(Fib(5), Fib(6)) = ', k);
+    k := Terbesar(Fibonacci(5), Fibonacci(6));
+    writeln('Terbesar(Fib(5), Fib(6)) = ', k);
 
     { Test 11: Array dengan real numbers }
     writeln('=== Test 11: Real Arrays ===');
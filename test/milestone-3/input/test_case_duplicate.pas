@@ -0,0 +1,28 @@
+program CaseDuplicate;
+
+konstanta
+    MAX = 100;
+
+variabel
+    total, n: integer;
+    Data: integer;
+    data: larik[1..5] dari integer;
+
+fungsi Max(a, b: integer): integer;
+mulai
+    jika a > b maka
+        Max := a
+    selain-itu
+        Max := b
+selesai;
+
+mulai
+    { Max and data were rejected as duplicates, using them like the rejected
+      declarations reports nothing else }
+    total := Max(MAX, 20);
+    writeln(Max(1, 2));
+    data[1] := 3;
+    { n is a plain variable, so these are still errors }
+    n(1);
+    total := n(2)
+selesai.
@@ -0,0 +1,18 @@
+program CaseShadow;
+
+variabel
+    X: integer;
+
+prosedur Ubah(n: integer);
+variabel
+    x: boolean;
+mulai
+    { local x shadows global X, so X here is boolean }
+    X := n;
+    x := true
+selesai;
+
+mulai
+    x := 2;
+    Ubah(x)
+selesai.
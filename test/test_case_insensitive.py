@@ -0,0 +1,60 @@
+# test aturan nama pascal-s yang case-insensitive di symbol table: lookup ambil entry paling
+# dalem yang namanya sama (beda huruf besar/kecil dianggep sama), deklarasi ulang juga dicek gitu
+#
+# cara pake (dari root folder):
+#   python3 -m pytest test/test_case_insensitive.py
+#   python3 test/test_case_insensitive.py
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from ast_parser import ASTParser
+from lexer import tokenize_from_text
+from semantic_analyzer import SemanticVisitor
+from symbol_table import DataType, SymbolTable
+from token_stream import fold_name
+
+DFA_PATH = os.path.join(ROOT, "rules", "dfa_rules_final.json")
+INPUT_DIR = os.path.join(ROOT, "test", "milestone-3", "input")
+
+def analyze(name):
+    with open(os.path.join(INPUT_DIR, name)) as f:
+        tokens = tokenize_from_text(f.read(), DFA_PATH)
+    visitor = SemanticVisitor()
+    visitor.visit(ASTParser(tokens).parse())
+    return visitor.errors
+
+def test_lookup_innermost_folded_name():
+    st = SymbolTable()
+    st.enter_variable("X", DataType.INTEGER)
+    st.enter_procedure("Ubah", DataType.VOID)
+    st.enter_variable("x", DataType.BOOLEAN)
+    # X di dalem prosedur itu x lokal, bukan X global yang ejaannya persis
+    assert st.lookup(fold_name("X")).type == DataType.BOOLEAN
+    assert st.lookup_in_current_scope(fold_name("X")).id == "x"
+
+def test_case_variant_local_shadows_global():
+    errors = analyze("test_case_shadow.pas")
+    assert [(e.line, e.message) for e in errors] == [
+        (11, "Type mismatch in assignment: cannot assign 1 to 3"),
+    ]
+
+def test_case_variant_redeclaration():
+    # konstanta MAX sama fungsi Max (juga Data sama data) di scope yang sama. pemakaian nama itu
+    # sesuai deklarasi yang ditolak gak jadi error susulan, entry lamanya tetap konstanta/variabel
+    errors = analyze("test_case_duplicate.pas")
+    assert [(e.line, e.message) for e in errors] == [
+        (9, "Duplicate declaration of variable 'data'"),
+        (11, "Duplicate declaration of function 'Max'"),
+        (26, "'n' is not a procedure"),
+        (27, "'n' is not a function"),
+    ]
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
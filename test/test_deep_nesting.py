@@ -0,0 +1,103 @@
+# test input yang nesting-nya lebih dalem dari recursion limit Python: parse pake LL1Parser
+# (stack eksplisit) / parse_events terus di-print, gak boleh kena RecursionError
+#
+# cara pake (dari root folder):
+#   python3 -m pytest test/test_deep_nesting.py
+#   python3 test/test_deep_nesting.py
+
+import contextlib
+import io
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import ARITHMETIC_OPERATORS, KEYWORDS, LOGICAL_OPERATORS, lexical_analyze, load_engine
+from event_tree import LL1EventParser, parse_events
+from ll1 import LL1Parser
+from parser import ParseError, Parser
+from tree_printer import print_tree, tree_to_string
+
+DFA_PATH = os.path.join(ROOT, "rules", "dfa_rules_final.json")
+
+# 300 mulai + 300 kurung: tree-nya ~1500 level, di atas recursion limit default (1000)
+DEPTH = 300
+
+def deep_program(depth):
+    return ("program Dalam;\nvariabel x: integer;\nmulai\n" + "mulai\n" * depth
+            + "x := " + "(" * depth + "1" + ")" * depth + "\n" + "selesai\n" * depth + "selesai.\n")
+
+def lex(text):
+    return lexical_analyze(text, load_engine(DFA_PATH), KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
+
+def tree_depth(node):
+    depth = 0
+    stack = [(node, 1)]
+    while stack:
+        node, level = stack.pop()
+        depth = max(depth, level)
+        stack.extend((child, level + 1) for child in getattr(node, "children", ()))
+    return depth
+
+def test_ll1_deep_nesting_prints():
+    tokens = lex(deep_program(DEPTH))
+    tree = LL1Parser(tokens).parse()
+    assert tree_depth(tree) > sys.getrecursionlimit()
+
+    lines = tree_to_string(tree, is_root=True).split("\n")
+    assert lines[0] == "<program>"
+    assert sum(line.endswith("LPARENTHESIS(()") for line in lines) == DEPTH
+    assert sum(line.endswith("KEYWORD(mulai)") for line in lines) == DEPTH + 1
+    assert lines[-1].endswith("DOT(.)")
+
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        print_tree(tree, is_root=True)
+    assert out.getvalue() == "\n".join(lines) + "\n"
+
+def test_ll1_matches_parser_below_limit():
+    # nesting yang masih muat buat recursive descent: output LL(1) sama persis
+    tokens = lex(deep_program(20))
+    assert tree_to_string(LL1Parser(tokens).parse(), is_root=True) == tree_to_string(Parser(tokens).parse(), is_root=True)
+
+def test_event_tree_deep_nesting():
+    # parse_events harus jadi walaupun nesting-nya di atas recursion limit
+    tokens = lex(deep_program(DEPTH))
+    tree = parse_events(tokens)
+    expected = tree_to_string(LL1Parser(tokens).parse(), is_root=True)
+    assert tree_to_string(tree) == expected
+    assert tree_to_string(tree.root, is_root=True) == expected
+    assert not tree.errors
+
+    out = io.StringIO()
+    with contextlib.redirect_stdout(out):
+        print_tree(tree, is_root=True)
+    assert out.getvalue() == expected + "\n"
+
+def test_event_tree_deep_nesting_recover():
+    # input dalem yang valid tetep jalan pake recover=True
+    tokens = lex(deep_program(DEPTH))
+    assert tree_to_string(parse_events(tokens, recover=True)) == tree_to_string(parse_events(tokens))
+
+    # yang ada error sintaksnya: kalo di-parse driver LL(1) (gak bisa recover), error pertama
+    # dilempar dan pesannya bilang recover-nya gak jalan, gak diem-diem jadi mode biasa
+    broken = lex(deep_program(DEPTH).replace("x := (", "x := ;(", 1))
+    try:
+        errors = parse_events(broken, recover=True).errors
+    except ParseError as error:
+        assert "too deeply for error recovery" in str(error)
+        errors = [error]
+    assert errors[0].token.value == ";"
+
+def test_ll1_events_match_parser_below_limit():
+    # termasuk konstanta negatif (aksi @negative-number di grammar)
+    text = deep_program(20).replace("variabel", "konstanta n = -5;\nvariabel", 1)
+    tokens = lex(text)
+    assert tree_to_string(LL1EventParser(tokens).parse()) == tree_to_string(Parser(tokens).parse(), is_root=True)
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,119 @@
+# test lexer incremental: abis diedit, hasil relex harus sama persis kayak lex ulang semua
+# (token, offset, stopped), di semua input milestone plus edit yang bikin input-nya rusak
+#
+# cara pake (dari root folder):
+#   python3 -m pytest test/test_incremental_lexer.py
+#   python3 test/test_incremental_lexer.py
+
+import contextlib
+import glob
+import io
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from incremental_lexer import relex
+from lexer import ARITHMETIC_OPERATORS, KEYWORDS, LOGICAL_OPERATORS, lexical_analyze, load_engine, read_source_file
+
+DFA_PATH = os.path.join(ROOT, "rules", "dfa_rules_final.json")
+INPUTS = sorted(glob.glob(os.path.join(ROOT, "test", "milestone-*", "input", "*.pas")))
+
+# potongan yang disisipin: token biasa, compound keyword yang kepotong, sama yang bikin rusak
+# (comment / string gak ketutup, karakter yang gak dikenal)
+SNIPPETS = ["", " ", "x", "1", ".", "..", ":=", ";", "\n", "a b", "mulai", "selesai", "selain", "-itu",
+            "turun-ke", "1e+5", "'abc'", "'", "{", "}", "(*", "*)", "#"]
+
+def lex(text):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return lexical_analyze(text, load_engine(DFA_PATH), KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
+
+def snapshot(tokens):
+    return list(tokens), [tokens.offset(i) for i in range(len(tokens))], tokens.stopped
+
+def lex_input(path):
+    # input milestone yang lexer-nya exception (comment gak ketutup) gak punya token stream
+    try:
+        return lex(read_source_file(path))
+    except Exception:
+        return None
+
+def apply_edit(tokens, offset, removed, inserted):
+    # relex di tempat, terus dibandingin sama lex ulang source hasil edit dari nol
+    # kalo lex ulang-nya exception (comment gak ketutup), relex juga harus exception yang sama
+    # dan token stream-nya gak berubah
+    before = snapshot(tokens)
+    try:
+        expected = lex(tokens.source[:offset] + inserted + tokens.source[offset + removed:])
+    except Exception as error:
+        try:
+            relex(tokens, offset, removed, inserted, load_engine(DFA_PATH), report=lambda message: None)
+        except Exception as relex_error:
+            assert str(relex_error) == str(error)
+        else:
+            raise AssertionError(f"relex accepted an edit the full lexer rejects: {error}")
+        assert snapshot(tokens) == before
+        return False
+    _, (first, old_end, new_end) = relex(tokens, offset, removed, inserted, load_engine(DFA_PATH),
+                                         report=lambda message: None)
+    assert snapshot(tokens) == snapshot(expected)
+    # token di luar daerah yang dilaporin berubah emang sama kayak sebelumnya
+    assert before[0][:first] == list(tokens)[:first]
+    assert before[0][old_end:] == list(tokens)[new_end:]
+    return True
+
+def test_edit_script_matches_full_lex():
+    rng = random.Random(13)
+    for path in INPUTS:
+        tokens = lex_input(path)
+        if tokens is None:
+            continue
+        for _ in range(12):
+            offset = rng.randint(0, len(tokens.source))
+            removed = min(rng.choice([0, 0, 1, 2, 5, 20]), len(tokens.source) - offset)
+            apply_edit(tokens, offset, removed, rng.choice(SNIPPETS))
+
+def test_edit_inside_token_and_compound_keyword():
+    tokens = lex("program A;\nvariabel x: integer;\nmulai\n  jika x > 1 maka x := 2 selain-itu x := 3\nselesai.\n")
+    source = tokens.source
+    # pecah compound keyword selain-itu, terus disambung lagi
+    apply_edit(tokens, source.index("-itu"), 1, " ")
+    apply_edit(tokens, tokens.source.index(" itu"), 1, "-")
+    # ganti identifier di tengah
+    apply_edit(tokens, tokens.source.index("x :="), 1, "hasil")
+    assert snapshot(tokens) == snapshot(lex(tokens.source))
+
+def test_edit_that_breaks_and_repairs_input():
+    text = "program A;\nmulai\n  writeln('ok');\n  writeln(1)\nselesai.\n"
+    tokens = lex(text)
+    # comment gak ketutup: lexer-nya exception, token stream tetep yang lama
+    assert not apply_edit(tokens, text.index("writeln(1)"), 0, "{ ")
+    # string gak ketutup: lexing berhenti, relex fallback ke lex ulang semuanya
+    assert apply_edit(tokens, text.index("'ok'") + 3, 1, "")
+    assert tokens.stopped
+    # string-nya ditutup lagi, terus ada comment yang ketutup
+    assert apply_edit(tokens, tokens.source.index("'ok"), 3, "'ok'")
+    assert not tokens.stopped
+    assert apply_edit(tokens, tokens.source.index("writeln(1)"), 0, "{ }")
+    assert snapshot(tokens) == snapshot(lex(text.replace("writeln(1)", "{ }writeln(1)")))
+
+def test_relex_malformed_milestone_inputs():
+    # input yang dari awal udah error (string gak ketutup, identifier salah)
+    malformed = 0
+    for path in INPUTS:
+        name = os.path.basename(path)
+        tokens = lex_input(path)
+        if tokens is None or ("unclosed" not in name and "error" not in name):
+            continue
+        malformed += 1
+        apply_edit(tokens, 0, 0, " ")
+        apply_edit(tokens, len(tokens.source), 0, "\nx")
+    assert malformed > 0
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,160 @@
+# test parser incremental: abis tiap edit, parse tree-nya harus sama kayak parse ulang dari nol
+# (struktur, token, line/column), yang di-parse ulang cuma unit yang kena edit, dan edit yang
+# bikin error sintaks ngelempar error yang sama terus bisa lanjut diedit lagi
+#
+# cara pake (dari root folder):
+#   python3 -m pytest test/test_incremental_parser.py
+#   python3 test/test_incremental_parser.py
+
+import contextlib
+import glob
+import io
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from incremental_parser import IncrementalParser
+from lexer import ARITHMETIC_OPERATORS, KEYWORDS, LOGICAL_OPERATORS, lexical_analyze, load_engine, read_source_file
+from parser import PROCEDURE_DECLARATION, ParseError, ParseNode, Parser
+
+DFA_PATH = os.path.join(ROOT, "rules", "dfa_rules_final.json")
+INPUTS = sorted(glob.glob(os.path.join(ROOT, "test", "milestone-*", "input", "*.pas")))
+
+SNIPPETS = ["x", "1", " ", "\n", ";", "a := 1;", "mulai a := 2 selesai;", "selesai", "mulai", "(", ")",
+            "prosedur q; mulai selesai;", "+ 2", "{ c }", "'s'", "\n\n  "]
+
+PROGRAM = """program Dua;
+variabel a, b: integer;
+prosedur Satu(n: integer);
+mulai
+  a := n + 1
+selesai;
+fungsi Kali(n: integer): integer;
+mulai
+  Kali := n * 2
+selesai;
+mulai
+  Satu(1);
+  b := Kali(a)
+selesai.
+"""
+
+def lex(text):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return lexical_analyze(text, load_engine(DFA_PATH), KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
+
+def same(a, b):
+    # struktur tree, token, sama posisi line/column token-nya
+    stack = [(a, b)]
+    while stack:
+        a, b = stack.pop()
+        if isinstance(a, ParseNode):
+            if not isinstance(b, ParseNode) or a.chain != b.chain or len(a.children) != len(b.children):
+                return False
+            stack.extend(zip(a.children, b.children))
+        elif isinstance(b, ParseNode) or (a.type, a.value, a.line_col()) != (b.type, b.value, b.line_col()):
+            return False
+    return True
+
+def find(node, kind):
+    # node pertama yang kind paling bawahnya kind (di mode compress bisa node chain)
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ParseNode):
+            if node.chain[-1] == kind:
+                return node
+            stack.extend(reversed(node.children))
+    return None
+
+def full_parse(text, compress):
+    # hasil parse dari nol: tree, atau pesan error-nya
+    try:
+        return Parser(lex(text), compress).parse()
+    except Exception as error:
+        return str(error)
+
+def edit(parser, offset, removed, inserted):
+    # edit lewat IncrementalParser, dibandingin sama parse ulang dari nol
+    expected = full_parse(parser.tokens.source[:offset] + inserted + parser.tokens.source[offset + removed:],
+                          parser.compress)
+    try:
+        got = parser.edit(offset, removed, inserted, load_engine(DFA_PATH), report=lambda message: None)
+    except Exception as error:
+        assert str(error) == expected
+        return None
+    assert not isinstance(expected, str), f"incremental parse accepted an edit the parser rejects: {expected}"
+    assert same(got, expected)
+    assert same(got, parser.tree)
+    return got
+
+def test_edit_script_matches_full_parse():
+    rng = random.Random(21)
+    for path in INPUTS:
+        for compress in (False, True):
+            try:
+                parser = IncrementalParser(lex(read_source_file(path)), compress)
+            except Exception:
+                continue
+            for _ in range(10):
+                source = parser.tokens.source
+                if rng.random() < 0.5:
+                    # edit kecil di identifier/angka, biasanya cukup parse ulang satu unit
+                    offset = rng.choice([i for i, char in enumerate(source) if char.isalnum()])
+                    removed = 1
+                    inserted = rng.choice("abcxyz") if source[offset].isalpha() else rng.choice("0123456789")
+                else:
+                    offset = rng.randint(0, len(source))
+                    removed = min(rng.choice([0, 0, 1, 2, 5]), len(source) - offset)
+                    inserted = rng.choice(SNIPPETS)
+                if edit(parser, offset, removed, inserted) is None and parser.tokens.source != source:
+                    # edit-nya bikin error, dibalikin lagi harus dapet tree yang sama kayak awal
+                    edit(parser, offset, len(inserted), source[offset:offset + removed])
+
+def test_reparses_only_edited_subprogram():
+    for compress in (False, True):
+        parser = IncrementalParser(lex(PROGRAM), compress)
+        untouched = find(parser.tree, PROCEDURE_DECLARATION)
+
+        tree = edit(parser, PROGRAM.index("n * 2"), 1, "a")
+        assert parser.reparsed[0] in ("<function-declaration>", "<compound-statement>")
+        assert parser.reparsed[2] - parser.reparsed[1] < len(parser.tokens) // 2
+        # cuma node di path ke unit yang diedit yang dibikin ulang, prosedur Satu dipake ulang
+        assert find(tree, PROCEDURE_DECLARATION) is untouched
+
+def test_line_col_after_inserting_lines_above():
+    for compress in (False, True):
+        parser = IncrementalParser(lex(PROGRAM), compress)
+        edit(parser, PROGRAM.index("prosedur"), 0, "{ dua\n baris }\n")
+        edit(parser, parser.tokens.source.index("a := n"), 0, "\n\n")
+
+def test_syntax_error_then_fix():
+    for compress in (False, True):
+        parser = IncrementalParser(lex(PROGRAM), compress)
+        offset = PROGRAM.index("n + 1")
+        assert edit(parser, offset, 1, "(") is None
+        # edit terakhir error, tree sebelumnya gak dipake lagi
+        assert parser.tree is None
+        assert edit(parser, offset, 1, "n") is not None
+        assert parser.reparsed[0] == "<program>"
+        assert same(parser.tree, Parser(lex(PROGRAM), compress).parse())
+
+def test_error_message_matches_parser():
+    tokens = lex(PROGRAM)
+    parser = IncrementalParser(tokens)
+    try:
+        parser.edit(PROGRAM.index("selesai;"), 7, "", load_engine(DFA_PATH), report=lambda message: None)
+    except ParseError as error:
+        expected = full_parse(tokens.source, False)
+        assert str(error) == expected
+    else:
+        raise AssertionError("missing selesai was accepted")
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
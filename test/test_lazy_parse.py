@@ -0,0 +1,136 @@
+# test mode lazy Parser: body prosedur/fungsi baru di-parse pas diakses, tapi tree yang udah
+# dipaksa ke-parse semua dan pesan error-nya harus sama persis kayak parser biasa (eager)
+#
+# cara pake (dari root folder):
+#   python3 -m pytest test/test_lazy_parse.py
+#   python3 test/test_lazy_parse.py
+
+import contextlib
+import glob
+import io
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import ARITHMETIC_OPERATORS, KEYWORDS, LOGICAL_OPERATORS, lexical_analyze, load_engine, read_source_file
+from parser import LazyBlockNode, ParseError, ParseNode, Parser
+from tree_printer import tree_to_string
+
+DFA_PATH = os.path.join(ROOT, "rules", "dfa_rules_final.json")
+INPUTS = sorted(glob.glob(os.path.join(ROOT, "test", "milestone-*", "input", "*.pas")))
+
+# body nested yang rusak: batas body yang di-skip meleset, error-nya harus tetep versi eager
+UNCLOSED_NESTED_BODY = """program P;
+variabel x: integer;
+prosedur A;
+mulai
+  jika x > 1 maka
+    mulai
+      x := 1;
+selesai;
+mulai
+  x := 2
+selesai.
+"""
+MISSING_INNER_END = """program P;
+variabel x: integer;
+fungsi F(a: integer): integer;
+  prosedur G;
+  mulai
+    x := 1
+  ;
+mulai
+  F := a
+selesai;
+mulai
+  x := F(1)
+selesai.
+"""
+ERROR_IN_BODY = """program P;
+variabel x: integer;
+prosedur A;
+mulai
+  x := ;
+selesai;
+mulai
+  x := 2
+selesai.
+"""
+
+def lex(text):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return lexical_analyze(text, load_engine(DFA_PATH), KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
+
+def render(tokens, compress=False, lazy=False):
+    # tree_to_string ngakses semua children, jadi body lazy ikut ke-parse
+    try:
+        return tree_to_string(Parser(tokens, compress, lazy=lazy).parse(), is_root=True)
+    except ParseError as error:
+        return f"ParseError: {error}"
+
+def lazy_blocks(node):
+    # LazyBlockNode di tree tanpa maksa body-nya ke-parse
+    found = []
+    stack = [node]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, LazyBlockNode):
+            found.append(node)
+            if not node.parsed:
+                continue
+        if isinstance(node, ParseNode):
+            stack.extend(node.children)
+    return found
+
+def test_forced_lazy_tree_matches_eager():
+    checked = 0
+    for path in INPUTS:
+        try:
+            tokens = lex(read_source_file(path))
+        except Exception:
+            continue
+        for compress in (False, True):
+            assert render(tokens, compress, lazy=True) == render(tokens, compress)
+            checked += 1
+    assert checked > 0
+
+def test_bodies_parsed_on_access():
+    tokens = lex(read_source_file(os.path.join(ROOT, "test", "milestone-3", "input", "test_brutal.pas")))
+    tree = Parser(tokens, lazy=True).parse()
+    blocks = lazy_blocks(tree)
+    assert len(blocks) > 1
+    assert not any(block.parsed for block in blocks)
+
+    blocks[0].children
+    assert blocks[0].parsed
+    assert not any(block.parsed for block in blocks[1:])
+
+def test_error_in_body_raised_on_access():
+    tokens = lex(ERROR_IN_BODY)
+    expected = render(tokens)
+    assert expected.startswith("ParseError: ")
+
+    tree = Parser(tokens, lazy=True).parse()
+    (block,) = lazy_blocks(tree)
+    try:
+        block.children
+    except ParseError as error:
+        assert f"ParseError: {error}" == expected
+    else:
+        raise AssertionError("error in the lazy body was not reported")
+
+def test_malformed_nesting_matches_eager():
+    for text in (UNCLOSED_NESTED_BODY, MISSING_INNER_END):
+        tokens = lex(text)
+        expected = render(tokens)
+        assert expected.startswith("ParseError: ")
+        for compress in (False, True):
+            assert render(tokens, compress, lazy=True) == render(tokens, compress)
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,138 @@
+# test parser paralel: parse tree-nya harus sama persis kayak Parser.parse() (input milestone,
+# program di atas PARALLEL_MIN_TOKENS), dan prosedur/fungsi yang gagal di worker di-parse ulang
+# di process utama jadi error-nya juga sama
+#
+# cara pake (dari root folder):
+#   python3 -m pytest test/test_parallel_parser.py
+#   python3 test/test_parallel_parser.py
+
+import contextlib
+import glob
+import io
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+import parallel_parser
+from lexer import ARITHMETIC_OPERATORS, KEYWORDS, LOGICAL_OPERATORS, lexical_analyze, load_engine, read_source_file
+from parallel_parser import PARALLEL_MIN_TOKENS, find_subprogram_bounds, parallel_parse
+from parser import ParseNode, Parser
+
+DFA_PATH = os.path.join(ROOT, "rules", "dfa_rules_final.json")
+INPUTS = sorted(glob.glob(os.path.join(ROOT, "test", "milestone-*", "input", "*.pas")))
+
+SUBPROGRAM = """
+fungsi F{k}(a, b: integer): integer;
+variabel
+    t: integer;
+    prosedur Dalam{k}(z: integer);
+    mulai
+        writeln('dalam ', z)
+    selesai;
+mulai
+    t := a * (b + {k}) - a bagi 2;
+    jika t >= 10 maka
+        t := -t
+    selain-itu
+        untuk t := 10 turun-ke 1 lakukan writeln(t);
+    F{k} := t
+selesai;
+"""
+
+def lex(text):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return lexical_analyze(text, load_engine(DFA_PATH), KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
+
+def program(n, body="    x := F0(1, 2)\n"):
+    return ("program Besar;\nvariabel x: integer;\n" + "".join(SUBPROGRAM.replace("{k}", str(k)) for k in range(n))
+            + "mulai\n" + body + "selesai.\n")
+
+def same(a, b):
+    # class node, chain, dan token (type, value, offset) harus sama persis
+    stack = [(a, b)]
+    while stack:
+        a, b = stack.pop()
+        if isinstance(a, ParseNode):
+            if type(a) is not type(b) or a.chain != b.chain or len(a.children) != len(b.children):
+                return False
+            stack.extend(zip(a.children, b.children))
+        elif isinstance(b, ParseNode) or (a.type, a.value, a.offset) != (b.type, b.value, b.offset):
+            return False
+    return True
+
+def outcome(parse):
+    try:
+        return parse()
+    except Exception as error:
+        return f"{type(error).__name__}: {error}"
+
+def assert_same_parse(tokens, compress):
+    expected = outcome(lambda: Parser(tokens, compress).parse())
+    got = outcome(lambda: parallel_parse(tokens, 2, compress))
+    if isinstance(expected, str) or isinstance(got, str):
+        assert got == expected
+    else:
+        assert same(got, expected)
+
+@contextlib.contextmanager
+def parallel_threshold(value):
+    # program kecil biasanya di-parse serial, threshold-nya diturunin biar worker-nya kepake
+    saved = parallel_parser.PARALLEL_MIN_TOKENS
+    parallel_parser.PARALLEL_MIN_TOKENS = value
+    try:
+        yield
+    finally:
+        parallel_parser.PARALLEL_MIN_TOKENS = saved
+
+def test_matches_parser_on_milestone_inputs():
+    split = 0
+    with parallel_threshold(0):
+        for path in INPUTS:
+            try:
+                tokens = lex(read_source_file(path))
+            except Exception:
+                continue
+            if len(find_subprogram_bounds(tokens)) < 2:
+                continue
+            split += 1
+            for compress in (False, True):
+                assert_same_parse(tokens, compress)
+    assert split > 0
+
+def test_matches_parser_above_threshold():
+    tokens = lex(program(450))
+    assert len(tokens) >= PARALLEL_MIN_TOKENS
+    assert len(find_subprogram_bounds(tokens)) == 450
+    assert_same_parse(tokens, False)
+
+def test_broken_subprogram_reports_parser_error():
+    with parallel_threshold(0):
+        # error sintaks di body fungsi kedua
+        text = program(4).replace("F1 := t", "F1 := t +", 1)
+        # selesai body fungsi ketiga ilang, batas hasil pre-scan-nya jadi meleset
+        missing_end = program(4).replace("    F2 := t\nselesai;", "    F2 := t\n;", 1)
+        # program utama rusak, worker-nya sukses semua
+        main = program(4, "    x := (1\n")
+        for source in (text, missing_end, main):
+            tokens = lex(source)
+            for compress in (False, True):
+                assert_same_parse(tokens, compress)
+
+def test_subprogram_bounds():
+    tokens = lex(program(3))
+    bounds = find_subprogram_bounds(tokens)
+    assert len(bounds) == 3
+    for start, end in bounds:
+        assert tokens.value(start) == "fungsi"
+        assert tokens.type(end - 1) == "SEMICOLON"
+        assert tokens.value(end - 2) == "selesai"
+    # prosedur nested di dalem fungsi gak dihitung sebagai prosedur level atas
+    assert all(end <= next_start for (_, end), (next_start, _) in zip(bounds, bounds[1:]))
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,145 @@
+# test mode recover Parser: input yang bener hasilnya sama persis kayak tanpa recover (tanpa
+# error), input rusak dilaporin semua error-nya sekali jalan dengan error pertama sama persis
+# kayak tanpa recover, dan tree parsial-nya masih bisa dipake ASTBuilder + semantic analysis
+#
+# cara pake (dari root folder):
+#   python3 -m pytest test/test_recover.py
+#   python3 test/test_recover.py
+
+import contextlib
+import glob
+import io
+import os
+import random
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from ast_builder import ASTBuilder
+from event_tree import parse_events
+from lexer import ARITHMETIC_OPERATORS, KEYWORDS, LOGICAL_OPERATORS, lexical_analyze, load_engine, read_source_file
+from parser import ERROR, ErrorNode, ParseError, ParseNode, Parser
+from semantic_analyzer import SemanticVisitor
+from tree_printer import tree_to_string
+
+DFA_PATH = os.path.join(ROOT, "rules", "dfa_rules_final.json")
+INPUTS = sorted(glob.glob(os.path.join(ROOT, "test", "milestone-*", "input", "*.pas")))
+
+# tiga error sintaks di tempat yang beda (deklarasi, body prosedur, program utama),
+# plus w yang gak dideklarasi di bagian yang bener
+MULTI_ERROR = """program Banyak;
+variabel
+    x, y: integer;
+    z: ;
+prosedur Cetak(n: integer);
+mulai
+    writeln(n +);
+    y := n
+selesai;
+mulai
+    x := 1;
+    y := (x * 2;
+    w := 3;
+    Cetak(y)
+selesai.
+"""
+
+FRAGMENTS = ["", ";", "mulai", "selesai", "prosedur p;", "x", " - 3", "fungsi", "konstanta", "variabel", ":=",
+             ")", "(", "ulangi", "sampai", ".", "jika", "[", "tipe t = ;"]
+
+def lex(text):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return lexical_analyze(text, load_engine(DFA_PATH), KEYWORDS, LOGICAL_OPERATORS, ARITHMETIC_OPERATORS)
+
+def lex_inputs():
+    for path in INPUTS:
+        try:
+            yield path, lex(read_source_file(path))
+        except Exception:
+            continue
+
+def first_error(tokens, compress=False):
+    try:
+        Parser(tokens, compress).parse()
+    except ParseError as error:
+        return str(error)
+    return None
+
+def check_recover(tokens, compress):
+    # recover gak pernah ngelempar error sintaks, error pertamanya = error tanpa recover
+    expected = first_error(tokens, compress)
+    parser = Parser(tokens, compress, recover=True)
+    tree = parser.parse()
+    if expected is None:
+        assert parser.errors == []
+        assert tree_to_string(tree, is_root=True) == tree_to_string(Parser(tokens, compress).parse(), is_root=True)
+    else:
+        assert parser.errors
+        assert str(parser.errors[0]) == expected
+    return parser, tree
+
+def error_nodes(tree):
+    found = []
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if isinstance(node, ParseNode):
+            if node.kind == ERROR:
+                found.append(node)
+            stack.extend(node.children)
+    return found
+
+def test_milestone_inputs():
+    for path, tokens in lex_inputs():
+        for compress in (False, True):
+            check_recover(tokens, compress)
+
+def test_event_parser_recover_matches_parser():
+    for path, tokens in list(lex_inputs()) + [("multi", lex(MULTI_ERROR))]:
+        parser = Parser(tokens, recover=True)
+        tree = parser.parse()
+        events = parse_events(tokens, recover=True)
+        assert [str(error) for error in events.errors] == [str(error) for error in parser.errors]
+        assert tree_to_string(events, is_root=True) == tree_to_string(tree, is_root=True)
+
+def test_reports_every_error_in_one_run():
+    tokens = lex(MULTI_ERROR)
+    parser, tree = check_recover(tokens, False)
+    assert [(error.token.line_col()[0], error.token.value) for error in parser.errors] == [
+        (4, ";"),
+        (7, ")"),
+        (12, ";"),
+    ]
+    nodes = error_nodes(tree)
+    assert len(nodes) == 3
+    assert all(isinstance(node, ErrorNode) and isinstance(node.error, ParseError) for node in nodes)
+
+def test_partial_tree_goes_through_semantic_analysis():
+    tree = Parser(lex(MULTI_ERROR), recover=True).parse()
+    ast = ASTBuilder().build(tree)
+    visitor = SemanticVisitor()
+    visitor.visit(ast)
+    # subtree yang rusak dilewatin, bagian yang bener tetep dicek
+    assert [(error.line, error.message) for error in visitor.errors] == [(13, "Undeclared variable 'w'")]
+
+def test_mutated_inputs():
+    rng = random.Random(23)
+    texts = [tokens.source for _, tokens in lex_inputs()]
+    for _ in range(150):
+        text = rng.choice(texts)
+        for _ in range(rng.randint(1, 4)):
+            offset = rng.randint(0, len(text))
+            text = text[:offset] + rng.choice(FRAGMENTS) + text[offset + rng.randint(0, 3):]
+        try:
+            tokens = lex(text)
+        except Exception:
+            continue
+        for compress in (False, True):
+            check_recover(tokens, compress)
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")
@@ -0,0 +1,110 @@
+# test file token binary .ptk: token stream yang di-load dari file harus sama kayak hasil lexing
+# aslinya (token, line/column, stopped, hasil parse / pesan error), plus file yang rusak ditolak
+#
+# cara pake (dari root folder):
+#   python3 -m pytest test/test_token_file.py
+#   python3 test/test_token_file.py
+
+import contextlib
+import glob
+import io
+import os
+import struct
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+
+from lexer import tokenize_from_file
+from parser import Parser
+from token_file import PTK_VERSION, load_token_file, write_token_file
+from tree_printer import tree_to_string
+
+DFA_PATH = os.path.join(ROOT, "rules", "dfa_rules_final.json")
+INPUTS = sorted(glob.glob(os.path.join(ROOT, "test", "milestone-*", "input", "*.pas")))
+
+def lex_file(path, use_mmap=False):
+    with contextlib.redirect_stdout(io.StringIO()):
+        try:
+            return tokenize_from_file(DFA_PATH, path, use_mmap=use_mmap)
+        except Exception:
+            return None
+
+def parse(tokens):
+    # parse tree yang di-print, atau pesan error-nya (posisi line/column ikut dibandingin)
+    try:
+        return tree_to_string(Parser(tokens).parse(), is_root=True)
+    except Exception as error:
+        return f"{type(error).__name__}: {error}"
+
+def round_trip(tokens, directory):
+    path = write_token_file(tokens, os.path.join(directory, "tokens.ptk"))
+    return load_token_file(path)
+
+def assert_same_stream(expected, got):
+    assert len(got) == len(expected)
+    assert list(got) == list(expected)
+    assert [got.line_col(i) for i in range(len(got))] == [expected.line_col(i) for i in range(len(expected))]
+    assert got.stopped == expected.stopped
+    assert parse(got) == parse(expected)
+
+def test_round_trip_milestone_inputs():
+    with tempfile.TemporaryDirectory() as directory:
+        checked = 0
+        for path in INPUTS:
+            # source str dan source mmap (offset byte) harus jadi file yang sama isinya
+            for use_mmap in (False, True):
+                tokens = lex_file(path, use_mmap)
+                if tokens is None:
+                    continue
+                assert_same_stream(tokens, round_trip(tokens, directory))
+                checked += 1
+        assert checked > 0
+
+def test_round_trip_non_ascii_and_stopped():
+    text = ("program Unik;\nvariabel s: string;\nmulai\n  s := 'héllo wörld';\n  writeln('ä', s)\n"
+            "selesai.\n  writeln('tidak ditutup\n")
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "unik.pas")
+        with open(source, "w", encoding="utf-8") as f:
+            f.write(text)
+        for use_mmap in (False, True):
+            tokens = lex_file(source, use_mmap)
+            assert tokens.stopped
+            got = round_trip(tokens, directory)
+            assert_same_stream(tokens, got)
+            # value yang sama di string table jadi object yang sama
+            values = [got.value(i) for i in range(len(got))]
+            assert values.count("writeln") == 2
+            first, second = [i for i, value in enumerate(values) if value == "writeln"]
+            assert got.value(first) is got.value(second)
+
+def test_rejects_malformed_files():
+    with tempfile.TemporaryDirectory() as directory:
+        tokens = lex_file(INPUTS[0])
+        path = write_token_file(tokens, os.path.join(directory, "tokens.ptk"))
+        with open(path, "rb") as f:
+            data = f.read()
+
+        cases = {
+            "not_ptk.ptk": b"KEYWORD(program)\nIDENTIFIER(A)\n",
+            "short.ptk": data[:6],
+            "version.ptk": data[:4] + struct.pack("<H", PTK_VERSION + 1) + data[6:],
+        }
+        for name, content in cases.items():
+            bad = os.path.join(directory, name)
+            with open(bad, "wb") as f:
+                f.write(content)
+            try:
+                load_token_file(bad)
+            except ValueError as error:
+                assert bad in str(error)
+            else:
+                raise AssertionError(f"{name} was accepted")
+
+if __name__ == "__main__":
+    for name, test in list(globals().items()):
+        if name.startswith("test_"):
+            test()
+            print(f"{name}: ok")